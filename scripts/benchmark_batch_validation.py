@@ -0,0 +1,97 @@
+"""Benchmark the row by row and the vectorized validation of the file rows."""
+import argparse
+import time
+from typing import Callable, List
+
+from django_decoupled.application.dtos import FileRow
+from django_decoupled.application.validators import (
+    BatchValidator,
+    CategoryNameValidator,
+    DocumentTextValidator,
+    WorksapceNameValidator,
+)
+
+
+def generate_rows(rows: int, categories: int, invalid_every: int) -> List[FileRow]:
+    """Generate file rows, making one of every 'invalid_every' texts too long."""
+    return [
+        FileRow(
+            workspace="Workspace",
+            category=f"category {row % categories}",
+            text=(
+                "x" * 2001
+                if invalid_every and row % invalid_every == 0
+                else f"document {row}"
+            ),
+            row=row + 2,
+        )
+        for row in range(rows)
+    ]
+
+
+def validate_row_by_row(rows: List[FileRow]) -> int:
+    """Validate the rows one at a time, as the value objects do."""
+    errors = 0
+
+    for row in rows:
+        try:
+            WorksapceNameValidator.validate(value=row.workspace)
+            CategoryNameValidator.validate(value=row.category)
+            DocumentTextValidator.validate(value=row.text)
+        except Exception:  # pylint: disable=broad-except
+            errors += 1
+
+    return errors
+
+
+def validate_in_batches(rows: List[FileRow], batch_size: int) -> int:
+    """Validate the rows in batches with the BatchValidator."""
+    errors = 0
+
+    for start in range(0, len(rows), batch_size):
+        report = BatchValidator.validate_rows(rows=rows[start : start + batch_size])
+        errors += len(report.issues)
+
+    return errors
+
+
+def measure(validate: Callable[[], int], repeat: int) -> float:
+    """Return the best wall time out of 'repeat' executions."""
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validate()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--invalid-every", type=int, default=10_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="*", default=[1000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    file_rows = generate_rows(
+        rows=args.rows, categories=args.categories, invalid_every=args.invalid_every
+    )
+
+    print(
+        f"{args.rows} rows, {validate_row_by_row(file_rows)} invalid "
+        f"(row by row only sees the first one before aborting the upload)"
+    )
+
+    baseline = measure(lambda: validate_row_by_row(file_rows), repeat=args.repeat)
+    print(f"{'Row by row':<32}{baseline:>8.2f}s{1:>8.2f}x")
+
+    for batch_size in args.batch_sizes:
+        elapsed = measure(
+            lambda: validate_in_batches(file_rows, batch_size=batch_size),
+            repeat=args.repeat,
+        )
+        name = f"BatchValidator({batch_size})"
+        print(f"{name:<32}{elapsed:>8.2f}s{baseline / elapsed:>8.2f}x")
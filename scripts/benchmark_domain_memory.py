@@ -0,0 +1,67 @@
+"""Benchmark the memory used by the domain objects of a category, per document."""
+import argparse
+import tracemalloc
+import uuid
+
+from django_decoupled.domain.models.workspaces import (
+    Category,
+    CategoryId,
+    CategoryName,
+    Document,
+    DocumentCollection,
+    DocumentId,
+    DocumentText,
+    WorkspaceId,
+)
+
+
+def build_category(texts: list, bulk: bool) -> Category:
+    """Build a category with a document for every text, from Documents or in bulk."""
+    category_id = CategoryId(value=uuid.uuid4())
+
+    if bulk:
+        documents = DocumentCollection()
+        documents.extend(
+            ids=(uuid.uuid4() for _ in texts), texts=texts, category_id=category_id
+        )
+    else:
+        documents = DocumentCollection(
+            items=[
+                Document(
+                    id=DocumentId(value=uuid.uuid4()),
+                    text=DocumentText(value=text),
+                    category_id=CategoryId(value=category_id.value),
+                )
+                for text in texts
+            ]
+        )
+
+    return Category(
+        id=category_id,
+        name=CategoryName(value="category"),
+        workspace_id=WorkspaceId(value=uuid.uuid4()),
+        documents=documents,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # The texts are created beforehand, as they come from the file reader, so only
+    # the domain objects around them are measured.
+    document_texts = [f"document number {row}" for row in range(args.documents)]
+
+    for name, bulk in (("documents", False), ("bulk", True)):
+        tracemalloc.start()
+        category = build_category(texts=document_texts, bulk=bulk)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del category
+
+        print(
+            f"{name:<10}{args.documents} documents: {current / 2**20:.1f} MiB "
+            f"({current / args.documents:.0f} bytes per document), "
+            f"peak {peak / 2**20:.1f} MiB"
+        )
@@ -0,0 +1,87 @@
+"""Benchmark the sequential and the parallel Excel file readers."""
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable
+
+import xlsxwriter
+from django_decoupled.controllers.services.file_readers import (
+    ExcelFileReader,
+    ParallelExcelFileReader,
+)
+
+
+def generate_workbook(path: str, sheets: int, rows: int, categories: int) -> None:
+    """Generate a workbook with the given number of sheets and rows per sheet."""
+    workbook = xlsxwriter.Workbook(filename=path)
+
+    for sheet_index in range(sheets):
+        worksheet = workbook.add_worksheet(f"Workspace {sheet_index}")
+        worksheet.write(0, 0, "Category")
+        worksheet.write(0, 1, "Text")
+
+        for row in range(1, rows + 1):
+            worksheet.write(row, 0, f"category {row % categories}")
+            worksheet.write(row, 1, f"document {row} of the sheet {sheet_index}")
+
+    workbook.close()
+
+
+def measure(read: Callable[[], object], repeat: int) -> float:
+    """Return the best wall time out of 'repeat' executions."""
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        read()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sheets", type=int, default=24)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs="*")
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = args.workers or sorted(
+        {1, 2, 4, 8, cpu_count} & set(range(1, cpu_count + 1))
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "benchmark.xlsx")
+        generate_workbook(
+            path=path, sheets=args.sheets, rows=args.rows, categories=args.categories
+        )
+
+        def read_with(reader: ExcelFileReader) -> Callable[[], object]:
+            """Return a function reading the benchmark workbook with the reader."""
+
+            def read() -> object:
+                """Read the benchmark workbook."""
+                with open(path, "rb") as file:
+                    return reader.read_from_bytes(bytes=file)  # type: ignore
+
+            return read
+
+        print(
+            f"Workbook: {args.sheets} sheets x {args.rows} rows "
+            f"({os.path.getsize(path) / 1024 / 1024:.1f} MB), {cpu_count} CPUs"
+        )
+
+        baseline = measure(read_with(ExcelFileReader()), repeat=args.repeat)
+        print(f"{'ExcelFileReader':<32}{baseline:>8.2f}s{1:>8.2f}x")
+
+        for workers in worker_counts:
+            elapsed = measure(
+                read_with(ParallelExcelFileReader(max_workers=workers)),
+                repeat=args.repeat,
+            )
+            name = f"ParallelExcelFileReader({workers})"
+            print(f"{name:<32}{elapsed:>8.2f}s{baseline / elapsed:>8.2f}x")
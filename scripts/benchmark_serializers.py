@@ -0,0 +1,93 @@
+"""Benchmark the nested and the flat domain serializers of a category."""
+import argparse
+import time
+import uuid
+from typing import Callable
+
+from django_decoupled.application.dtos import CategoryDTO
+from django_decoupled.application.services import (
+    CategoryDomainSerializer,
+    DocumentDomainSerializer,
+    FlatCategoryDomainSerializer,
+)
+from django_decoupled.domain.models.workspaces import (
+    Category,
+    CategoryId,
+    CategoryName,
+    DocumentCollection,
+    WorkspaceId,
+)
+
+
+def build_category(documents: int) -> Category:
+    """Build a category with the given number of documents."""
+    category_id = CategoryId(value=uuid.uuid4())
+    collection = DocumentCollection()
+    collection.extend(
+        ids=(uuid.uuid4() for _ in range(documents)),
+        texts=(f"document number {row}" for row in range(documents)),
+        category_id=category_id,
+    )
+
+    return Category(
+        id=category_id,
+        name=CategoryName(value="category"),
+        workspace_id=WorkspaceId(value=uuid.uuid4()),
+        documents=collection,
+    )
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """Return the best time of 'repeat' calls of the function, in seconds."""
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # The DTOs of the benchmark carry their documents, so the loader is never used.
+    serializers = {
+        "nested": CategoryDomainSerializer(
+            document_serializer=DocumentDomainSerializer(), loader=None
+        ),
+        "flat": FlatCategoryDomainSerializer(
+            document_serializer=DocumentDomainSerializer(), loader=None
+        ),
+    }
+    category = build_category(documents=args.documents)
+    dto: CategoryDTO = serializers["nested"].serialize(domain_obj=category)
+
+    # Both serializers must map the same category to the same DTO and back.
+    for name, serializer in serializers.items():
+        if serializer.serialize(domain_obj=category) != dto:
+            raise SystemExit(f"The {name} serializer does not serialize the same DTO.")
+
+        if (
+            serializers["nested"].serialize(domain_obj=serializer.deserialize(dto=dto))
+            != dto
+        ):
+            raise SystemExit(f"The {name} serializer does not deserialize the DTO.")
+
+    for name, serializer in serializers.items():
+        serialize = measure(
+            lambda: serializer.serialize(domain_obj=category), repeat=args.repeat
+        )
+        deserialize = measure(
+            lambda: serializer.deserialize(dto=dto), repeat=args.repeat
+        )
+
+        print(
+            f"{name:<8}{args.documents} documents: "
+            f"serialize {args.documents / serialize:,.0f} documents/s, "
+            f"deserialize {args.documents / deserialize:,.0f} documents/s"
+        )
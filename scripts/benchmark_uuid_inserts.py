@@ -0,0 +1,86 @@
+"""Benchmark the insert throughput of uuid4 and uuid7 primary keys into a large table."""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from typing import Callable
+
+from django_decoupled.application.identifiers import uuid7
+
+
+def create_table(path: str, generate_uuid: Callable[[], uuid.UUID], rows: int) -> None:
+    """Create a documents table, as Django maps it in SQLite, with 'rows' rows."""
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE document (id char(32) NOT NULL PRIMARY KEY, text text NOT NULL)"
+        )
+        connection.executemany(
+            "INSERT INTO document (id, text) VALUES (?, ?)",
+            ((generate_uuid().hex, f"document {row}") for row in range(rows)),
+        )
+
+
+def insert(
+    path: str,
+    generate_uuid: Callable[[], uuid.UUID],
+    rows: int,
+    batch_size: int,
+    cache_size: int,
+) -> float:
+    """Insert 'rows' rows in batches, one transaction per batch, returning rows/s."""
+    connection = sqlite3.connect(path)
+    connection.execute(f"PRAGMA cache_size = -{cache_size}")
+    start = time.perf_counter()
+
+    for offset in range(0, rows, batch_size):
+        with connection:
+            connection.executemany(
+                "INSERT INTO document (id, text) VALUES (?, ?)",
+                (
+                    (generate_uuid().hex, f"new document {row}")
+                    for row in range(offset, min(offset + batch_size, rows))
+                ),
+            )
+
+    elapsed = time.perf_counter() - start
+    connection.close()
+
+    return rows / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--existing-rows", type=int, default=2_000_000)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--cache-size", type=int, default=8192, help="SQLite page cache in KiB."
+    )
+    args = parser.parse_args()
+
+    print(
+        f"Inserting {args.rows} rows in batches of {args.batch_size} into a table "
+        f"of {args.existing_rows} rows"
+    )
+
+    results = {}
+
+    for name, generate in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+        with tempfile.TemporaryDirectory() as directory:
+            database = os.path.join(directory, "benchmark.sqlite3")
+            create_table(path=database, generate_uuid=generate, rows=args.existing_rows)
+
+            results[name] = insert(
+                path=database,
+                generate_uuid=generate,
+                rows=args.rows,
+                batch_size=args.batch_size,
+                cache_size=args.cache_size,
+            )
+
+        print(
+            f"{name:<8}{results[name]:>12.0f} rows/s"
+            f"{results[name] / results['uuid4']:>8.2f}x"
+        )
@@ -0,0 +1,97 @@
+"""Ingestion budgets module."""
+import io
+from typing import Any, Iterable, Iterator, Optional, Set, Tuple
+
+from .dtos import FileRow, FileWorkspace, IngestionBudget, SheetMetadata
+from .exceptions import IngestionBudgetExceededError
+
+
+def _check(budget: str, value: int, limit: Optional[int]) -> None:
+    """Raise if the value is over the limit."""
+    if limit is not None and value > limit:
+        raise IngestionBudgetExceededError(budget=budget, limit=limit)
+
+
+class IngestionGuard:
+    """
+    IngestionGuard class.
+
+    Enforces an IngestionBudget at every stage of an ingestion: the file size before
+    it is parsed, the rows while they are streamed, aborting on the first row over
+    budget, and the parsed workspaces before they are processed.
+    """
+
+    _budget: IngestionBudget
+
+    def __init__(self, budget: IngestionBudget) -> None:
+        """Class constructor."""
+        self._budget = budget
+
+    def check_file(self, file: Any) -> None:
+        """Check the size of an uploaded file without reading it."""
+        file.seek(0, io.SEEK_END)
+        size = file.tell()
+        file.seek(0)
+
+        self.check_file_size(size=size)
+
+    def check_file_size(self, size: int) -> None:
+        """Check the size of a file, in bytes."""
+        _check(budget="file size", value=size, limit=self._budget.max_file_size)
+
+    def guard_rows(self, rows: Iterable[FileRow]) -> Iterator[FileRow]:
+        """Yield the rows, raising as soon as one of them is over budget."""
+        sheets: Set[str] = set()
+        categories: Set[Tuple[str, str]] = set()
+
+        for row_count, row in enumerate(rows, start=1):
+            _check(budget="rows", value=row_count, limit=self._budget.max_rows)
+
+            if row.workspace not in sheets:
+                sheets.add(row.workspace)
+                _check(
+                    budget="sheets", value=len(sheets), limit=self._budget.max_sheets
+                )
+
+            if (row.workspace, row.category) not in categories:
+                categories.add((row.workspace, row.category))
+                _check(
+                    budget="categories",
+                    value=len(categories),
+                    limit=self._budget.max_categories,
+                )
+
+            yield row
+
+    def check_workspaces(self, file_workspaces: Iterable[FileWorkspace]) -> None:
+        """Check the workspaces parsed from a file before processing them."""
+        file_workspaces = list(file_workspaces)
+
+        _check(
+            budget="sheets", value=len(file_workspaces), limit=self._budget.max_sheets
+        )
+        _check(
+            budget="categories",
+            value=sum(len(ws.categories) for ws in file_workspaces),
+            limit=self._budget.max_categories,
+        )
+        _check(
+            budget="rows",
+            value=sum(
+                len(category.texts)
+                for ws in file_workspaces
+                for category in ws.categories
+            ),
+            limit=self._budget.max_rows,
+        )
+
+    def check_sheets(self, sheets: Iterable[SheetMetadata]) -> None:
+        """Check the sheets of a workbook by the sizes declared in its metadata."""
+        sheets = list(sheets)
+
+        _check(budget="sheets", value=len(sheets), limit=self._budget.max_sheets)
+        _check(
+            budget="rows",
+            value=sum(sheet.rows or 0 for sheet in sheets),
+            limit=self._budget.max_rows,
+        )
@@ -1,8 +1,9 @@
 """Commands module."""
 from dataclasses import dataclass
-from typing import Optional
+from typing import IO, Callable, List, Optional
 
 from ..dependency_injection.dispatcher import Command
+from .dtos import CorpusFileReport
 
 
 @dataclass
@@ -11,6 +12,29 @@ class CreateOrUpdateWorkspaceFromUploadExcelFileCommand(Command):
 
     file_bytes: bytes
     owner: str
+    merge_mode: Optional[str] = None
+    on_progress: Optional[Callable[[int, int], None]] = None
+
+
+@dataclass
+class StreamWorkspacesFromUploadExcelFileCommand(Command):
+    """StreamWorkspacesFromUploadExcelFileCommand Command."""
+
+    file_bytes: bytes
+    owner: str
+    merge_mode: Optional[str] = None
+    on_progress: Optional[Callable[[int, int], None]] = None
+
+
+@dataclass
+class ImportCorpusCommand(Command):
+    """ImportCorpusCommand Command."""
+
+    paths: List[str]
+    owner: str
+    workers: int = 1
+    merge_mode: Optional[str] = None
+    on_file: Optional[Callable[[CorpusFileReport], None]] = None
 
 
 @dataclass
@@ -20,6 +44,7 @@ class CreateWorkspaceAndAddDataFromFileCommand(Command):
     workspace_name: str
     file_bytes: bytes
     owner_id: str
+    on_progress: Optional[Callable[[int, int], None]] = None
 
 
 @dataclass
@@ -45,3 +70,66 @@ class WorkspaceMetricsCommand(Command):
 
     workspace_id: str
     owner: str
+
+
+@dataclass
+class EnqueueIngestionJobCommand(Command):
+    """EnqueueIngestionJobCommand class."""
+
+    file_path: str
+    owner: str
+    workspace_name: Optional[str] = None
+
+
+@dataclass
+class ProcessNextIngestionJobCommand(Command):
+    """ProcessNextIngestionJobCommand class."""
+
+
+@dataclass
+class RetryIngestionJobCommand(Command):
+    """RetryIngestionJobCommand class."""
+
+    job_id: str
+
+
+@dataclass
+class CleanUpIngestionJobsCommand(Command):
+    """CleanUpIngestionJobsCommand class."""
+
+    older_than: int
+
+
+@dataclass
+class StartChunkedUploadCommand(Command):
+    """StartChunkedUploadCommand class."""
+
+    owner: str
+    filename: str
+    size: int
+
+
+@dataclass
+class AppendChunkCommand(Command):
+    """AppendChunkCommand class."""
+
+    upload_id: str
+    owner: str
+    offset: int
+    chunk: IO[bytes]
+    chunk_size: int
+
+
+@dataclass
+class CompleteChunkedUploadCommand(Command):
+    """CompleteChunkedUploadCommand class."""
+
+    upload_id: str
+    owner: str
+
+
+@dataclass
+class ExpireChunkedUploadsCommand(Command):
+    """ExpireChunkedUploadsCommand class."""
+
+    older_than: int
@@ -1,6 +1,105 @@
 """Data transfer object module."""
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    overload,
+)
+
+T = TypeVar("T")
+
+
+class LazySequence(Sequence[T]):
+    """
+    Sequence whose items are loaded on their first access.
+
+    Its length is known without loading the items when it is given, either as a
+    number or as a function counting them, so the consumers that only need counts
+    do not read the items.
+    """
+
+    __slots__ = ("_loader", "_length", "_items")
+
+    _loader: Callable[[], Iterable[T]]
+    _length: Union[int, Callable[[], int], None]
+    _items: Optional[List[T]]
+
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[T]],
+        length: Union[int, Callable[[], int], None] = None,
+    ) -> None:
+        """Class constructor."""
+        self._loader = loader
+        self._length = length
+        self._items = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the items have been loaded."""
+        return self._items is not None
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]:
+        ...
+
+    def __getitem__(self, index):
+        """Return an item, or a list of items for a slice."""
+        return self._load()[index]
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the items, loading them if needed."""
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        """Return the number of items, without loading them if it was given."""
+        if self._items is not None or self._length is None:
+            return len(self._load())
+
+        if callable(self._length):
+            self._length = self._length()
+
+        return self._length
+
+    def __eq__(self, value: object) -> bool:
+        """Compare the items with the ones of another list or sequence."""
+        if not isinstance(value, (list, LazySequence)):
+            return NotImplemented
+
+        return self._load() == list(value)
+
+    __hash__ = None  # type: ignore
+
+    def _load(self) -> List[T]:
+        """Load the items on the first access."""
+        if self._items is None:
+            self._items = list(self._loader())
+
+        return self._items
+
+    def __repr__(self) -> str:
+        """Nice string representation."""
+        if self._items is None:
+            return f"{self.__class__.__name__}([...])"
+
+        return f"{self.__class__.__name__}({self._items!r})"
 
 
 @dataclass
@@ -19,7 +118,9 @@ class CategoryDTO:
     id: str
     name: str
     workspace_id: str
-    documents: List[DocumentDTO]
+    # None when the documents were not loaded, so they are left as stored. The
+    # finders return them as a LazySequence, read when first used.
+    documents: Optional[Sequence[DocumentDTO]]
 
 
 @dataclass
@@ -28,7 +129,8 @@ class WorkspaceDTO:
 
     id: str
     name: str
-    categories: List[CategoryDTO]
+    # None when the categories were not loaded, so they are left as stored.
+    categories: Optional[List[CategoryDTO]]
     owner: str
     model_id: Optional[str] = None
     metrics: Dict[str, Any] = field(default_factory=dict)
@@ -51,10 +153,20 @@ class FileDocument:
 
 @dataclass
 class FileCategory:
-    """CategoryDTO."""
+    """
+    CategoryDTO.
+
+    The documents are held by column, as the list of their texts, so reading a
+    file does not create an object per row.
+    """
 
     name: str
-    documents: List[FileDocument]
+    texts: List[str]
+
+    @property
+    def documents(self) -> List[FileDocument]:
+        """Return a FileDocument for every text of the category."""
+        return [FileDocument(text=text) for text in self.texts]
 
     def __eq__(self, value: object) -> bool:
         """Override the equal method for this class."""
@@ -81,6 +193,237 @@ class FileWorkspace:
         return hash((self.name,))
 
 
+@dataclass(frozen=True)
+class FileRow:
+    """Single row of a file, as streamed by the file readers."""
+
+    workspace: str
+    category: str
+    text: str
+    row: int
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """
+    ValidationIssue.
+
+    An invalid value of a file. Issues of sheet names have no row.
+    """
+
+    sheet: str
+    row: Optional[int]
+    column: str
+    message: str
+
+
+@dataclass
+class ValidationReport:
+    """
+    ValidationReport.
+
+    Keeps the first MAX_ISSUES issues of a file and only counts the rest, so the
+    report of a file with many invalid values stays small.
+    """
+
+    MAX_ISSUES: ClassVar[int] = 100
+
+    issues: List[ValidationIssue] = field(default_factory=list)
+    omitted: int = 0
+
+    def __post_init__(self) -> None:
+        """Drop the issues over MAX_ISSUES, counting them as omitted."""
+        if len(self.issues) > self.MAX_ISSUES:
+            self.omitted += len(self.issues) - self.MAX_ISSUES
+            del self.issues[self.MAX_ISSUES :]
+
+    @property
+    def count(self) -> int:
+        """Return the number of issues, including the omitted ones."""
+        return len(self.issues) + self.omitted
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if there are no issues."""
+        return self.count == 0
+
+    def merge(self, other: "ValidationReport") -> None:
+        """Add the issues of another report to this one."""
+        kept = other.issues[: max(self.MAX_ISSUES - len(self.issues), 0)]
+
+        self.issues.extend(kept)
+        self.omitted += other.count - len(kept)
+
+
+@dataclass(frozen=True)
+class FileProcessingResult(Generic[T]):
+    """
+    FileProcessingResult.
+
+    Objects built by a file processor from the workspaces of a single file, split
+    into the new ones and the ones that already exist, and indexed by name.
+    """
+
+    new: FrozenSet[T] = frozenset()
+    existing: FrozenSet[T] = frozenset()
+    by_name: Mapping[str, T] = field(default_factory=lambda: MappingProxyType({}))
+
+    def get(self, name: str) -> Optional[T]:
+        """Return an object by name."""
+        return self.by_name.get(name)
+
+    def is_existing(self, name: str) -> bool:
+        """Check if the object with the given name already exists."""
+        obj = self.get(name=name)
+
+        return obj is not None and obj in self.existing
+
+
+@dataclass(frozen=True)
+class IngestionReport:
+    """Summary of a streaming ingestion."""
+
+    rows: int
+    documents: int
+    workspaces_created: List[str]
+    workspaces_updated: List[str]
+    duplicates_removed: int = 0
+
+
+@dataclass(frozen=True)
+class UploadResult:
+    """Result of an upload, listing the workspaces processed and skipped."""
+
+    changed: bool
+    workspaces_processed: List[str] = field(default_factory=list)
+    workspaces_skipped: List[str] = field(default_factory=list)
+    duplicates_removed: int = 0
+
+
+@dataclass(frozen=True)
+class CorpusFile:
+    """Rows of a file of a corpus, or the error that prevented reading it."""
+
+    path: str
+    rows: Iterable[FileRow] = ()
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CorpusFileReport:
+    """Result of importing a single file of a corpus."""
+
+    path: str
+    rows: int = 0
+    documents: int = 0
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CorpusImportReport:
+    """Summary of a corpus import."""
+
+    files: List[CorpusFileReport]
+    seconds: float
+
+    @property
+    def rows(self) -> int:
+        """Return the rows imported."""
+        return sum(file.rows for file in self.files if file.error is None)
+
+    @property
+    def documents(self) -> int:
+        """Return the documents written."""
+        return sum(file.documents for file in self.files)
+
+    @property
+    def failed(self) -> List[CorpusFileReport]:
+        """Return the files that could not be imported."""
+        return [file for file in self.files if file.error is not None]
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the import throughput."""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+@dataclass(frozen=True)
+class IngestionBudget:
+    """
+    IngestionBudget.
+
+    Limits enforced while ingesting the uploads of an owner. A None limit means
+    there is no limit.
+    """
+
+    max_file_size: Optional[int] = None
+    max_rows: Optional[int] = None
+    max_sheets: Optional[int] = None
+    max_categories: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class SheetMetadata:
+    """
+    SheetMetadata.
+
+    Size of a sheet as declared by its dimension. The first row of a sheet is the
+    header, so it is not counted. The size is None if the sheet has no dimension.
+    """
+
+    name: str
+    rows: Optional[int] = None
+    columns: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class WorkbookMetadata:
+    """WorkbookMetadata."""
+
+    size: int
+    sheets: List[SheetMetadata] = field(default_factory=list)
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """Return the names of the sheets in the order of the workbook."""
+        return [sheet.name for sheet in self.sheets]
+
+    def get(self, name: str) -> Optional[SheetMetadata]:
+        """Return the metadata of a sheet by name."""
+        return next((sheet for sheet in self.sheets if sheet.name == name), None)
+
+
+@dataclass(frozen=True)
+class IngestionJobDTO:
+    """IngestionJobDTO."""
+
+    id: str
+    owner: str
+    file_path: str
+    status: str
+    workspace_name: Optional[str] = None
+    rows_parsed: int = 0
+    rows_written: int = 0
+    result: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ChunkedUploadDTO:
+    """ChunkedUploadDTO."""
+
+    UPLOADING: ClassVar[str] = "uploading"
+    COMPLETED: ClassVar[str] = "completed"
+
+    id: str
+    owner: str
+    filename: str
+    file_path: str
+    size: int
+    status: str
+    job_id: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class HTTPRequest:
     """Request data transfer object."""
@@ -1,4 +1,7 @@
 """Exception module."""
+from typing import Optional
+
+from .dtos import ValidationReport
 
 
 class DataError(Exception):
@@ -31,6 +34,24 @@ class WorkspaceAlreadyExistsError(PersistenceError):
         super().__init__(self.message)
 
 
+class WorkspaceNotLoadedError(PersistenceError):
+    """Raised when trying to save a Workspace whose collections were not loaded."""
+
+    def __init__(self, message: str) -> None:
+        """Class constructor."""
+        self.message = f"The Workspace '{message}' has collections not loaded."
+        super().__init__(self.message)
+
+
+class ChunkedUploadDoesNotExistError(PersistenceError):
+    """Raised when a chunked upload does not exist, or has expired."""
+
+    def __init__(self, message: str) -> None:
+        """Class constructor."""
+        self.message = f"The chunked upload '{message}' does not exist."
+        super().__init__(self.message)
+
+
 class ResponseError(Exception):
     """Base Expection for Responses."""
 
@@ -125,3 +146,66 @@ class UnhandledHttpStatusCodeError(ResponseError):
 
 class TrainDatasetDataError(DataError):
     """Exception raised when there is an error while generating the TRain Dataset."""
+
+
+class IngestionBudgetExceededError(DataError):
+    """Exception raised when an upload exceeds one of the ingestion budgets."""
+
+    def __init__(self, budget: str, limit: int) -> None:
+        """Class constructor."""
+        self.budget = budget
+        self.limit = limit
+        self.message = f"The upload exceeds the maximum {budget} allowed ({limit})."
+        super().__init__(self.message)
+
+
+class InvalidWorkbookError(DataError):
+    """Exception raised when a file is not a readable Excel workbook."""
+
+    def __init__(self, message: str) -> None:
+        """Class constructor."""
+        self.message = f"The file is not a valid Excel workbook: {message}."
+        super().__init__(self.message)
+
+
+class FileValidationError(DataError):
+    """Exception raised when a file has invalid values."""
+
+    MAX_REPORTED_ISSUES = 10
+
+    def __init__(self, report: ValidationReport) -> None:
+        """Class constructor."""
+        self.report = report
+
+        issues = [
+            f"'{issue.sheet}'"
+            + ("" if issue.row is None else f" row {issue.row}")
+            + f" ({issue.column}): {issue.message}"
+            for issue in report.issues[: self.MAX_REPORTED_ISSUES]
+        ]
+        if report.count > len(issues):
+            issues.append(f"and {report.count - len(issues)} more")
+
+        self.message = (
+            f"The file has {report.count} invalid values: {'; '.join(issues)}."
+        )
+        super().__init__(self.message)
+
+
+class ChunkedUploadConflictError(DataError):
+    """Exception raised when a chunked upload is not in the state a request needs."""
+
+    def __init__(self, message: str, offset: Optional[int] = None) -> None:
+        """Class constructor."""
+        self.message = message
+        self.offset = offset
+        super().__init__(self.message)
+
+
+class InvalidChunkError(DataError):
+    """Exception raised when a chunk does not fit in its upload."""
+
+    def __init__(self, message: str) -> None:
+        """Class constructor."""
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,97 @@
+"""Content fingerprints module."""
+import hashlib
+import math
+from numbers import Integral, Real
+from typing import Any
+
+from .dtos import FileWorkspace
+
+_CHUNK_SIZE = 1024 * 1024
+_MODULUS = 2**256
+
+
+def fingerprint_file(file: Any) -> str:
+    """
+    Return the SHA-256 hex digest of an uploaded file.
+
+    The file is read in chunks and rewound, so it can be read again afterwards.
+
+    Args:
+        file (Any): file-like object supporting 'seek' and 'read'.
+
+    Returns
+        str: hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+
+    file.seek(0)
+    for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    file.seek(0)
+
+    return digest.hexdigest()
+
+
+def _cell_text(value: Any) -> str:
+    """
+    Return the text of a cell value, in the same form for every file reader.
+
+    pandas reads the integers of a column with empty cells as floats, and the empty
+    cells as NaN, where openpyxl reads them as integers and None.
+    """
+    if value is None:
+        return ""
+
+    if isinstance(value, Integral):
+        return str(int(value))
+
+    if isinstance(value, Real):
+        number = float(value)
+
+        if math.isnan(number):
+            return ""
+
+        if number.is_integer():
+            return str(int(number))
+
+    return str(value)
+
+
+class SheetFingerprint:
+    """
+    Incremental fingerprint of the rows of a sheet.
+
+    Every (category, text) pair is hashed on its own and the hashes are added up
+    modulo 2^256. The result does not depend on the row order, so it is the same
+    whether the rows are streamed from the file or grouped by category, while
+    repeated rows still change it. The cell values are hashed as text, in the same
+    form for every file reader.
+    """
+
+    _value: int
+
+    def __init__(self) -> None:
+        """Class constructor."""
+        self._value = 0
+
+    def update(self, category: Any, text: Any) -> None:
+        """Add a row to the fingerprint."""
+        row_digest = hashlib.sha256(
+            f"{_cell_text(category)}\x1f{_cell_text(text)}".encode()
+        ).digest()
+        self._value = (self._value + int.from_bytes(row_digest, "big")) % _MODULUS
+
+    def hexdigest(self) -> str:
+        """Return the fingerprint as a hex string."""
+        return f"{self._value:064x}"
+
+
+def fingerprint_workspace(file_workspace: FileWorkspace) -> str:
+    """Return the fingerprint of the rows of a FileWorkspace."""
+    fingerprint = SheetFingerprint()
+
+    for file_category in file_workspace.categories:
+        for text in file_category.texts:
+            fingerprint.update(category=file_category.name, text=text)
+
+    return fingerprint.hexdigest()
@@ -1,9 +1,15 @@
 """Train handle module."""
+import io
 import logging
+import time
 from dataclasses import asdict
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Optional
 
 from django_decoupled.application.exceptions import (
+    ChunkedUploadConflictError,
+    ChunkedUploadDoesNotExistError,
+    InvalidChunkError,
     RequestExecutionError,
     TrainDatasetDataError,
     WorkspaceAlreadyExistsError,
@@ -12,40 +18,92 @@ from django_decoupled.application.exceptions import (
 
 from ..dependency_injection.dispatcher import Handler
 from ..domain.models.workspaces import (
+    Category,
     CategoryCollection,
+    Document,
     Workspace,
     WorkspaceId,
     WorkspaceName,
     WorkspaceOwnerId,
 )
+from .budgets import IngestionGuard
 from .commands import (
+    AppendChunkCommand,
+    CleanUpIngestionJobsCommand,
+    CompleteChunkedUploadCommand,
     CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
     CreateWorkspaceAndAddDataFromFileCommand,
     CreateWorkspaceCommand,
+    EnqueueIngestionJobCommand,
+    ExpireChunkedUploadsCommand,
+    ImportCorpusCommand,
+    ProcessNextIngestionJobCommand,
+    RetryIngestionJobCommand,
+    StartChunkedUploadCommand,
+    StreamWorkspacesFromUploadExcelFileCommand,
     TrainWorkspaceCommand,
     WorkspaceMetricsCommand,
 )
 from .dtos import (
+    CategoryDTO,
+    ChunkedUploadDTO,
+    CorpusFile,
+    CorpusFileReport,
+    CorpusImportReport,
+    DocumentDTO,
+    FileRow,
     FileWorkspace,
     HTTPRequest,
     HTTPResponse,
+    IngestionBudget,
+    IngestionJobDTO,
+    IngestionReport,
     TrainDataSet,
     TrainingResponse,
+    UploadResult,
     WorkspaceDTO,
 )
+from .fingerprints import fingerprint_file, fingerprint_workspace
+from .identifiers import DocumentIdFactory
 from .interfaces import (
+    IAggregateMapper,
+    IBulkRepository,
+    IChunkedUploadRepository,
+    ICorpusReader,
     IDataProcessor,
     IDomainSerializer,
+    IEventPublisher,
     IExecutor,
     IFileProcessor,
     IFileReader,
+    IFileRowReader,
+    IFileStorage,
     IFinder,
+    IIngestionBudgetFinder,
+    IIngestionJobRepository,
+    IIngestionLog,
     IRepository,
+    IUnitOfWork,
+    IWorkspaceFinder,
 )
+from .merging import MERGE_MODE_REPLACE, check_merge_mode
+from .normalization import TextNormalizer
+from .pipelines import WorkspaceIngestionPipeline
+from .validators import WorkspaceFileValidator
 
 logger = logging.getLogger(__name__)
 
 
+def _report_progress(
+    on_progress: Optional[Callable[[int, int], None]],
+    rows_parsed: int,
+    rows_written: int,
+) -> None:
+    """Call the progress callback of a command, if any."""
+    if on_progress is not None:
+        on_progress(rows_parsed, rows_written)
+
+
 # TODO: WIP
 class CreateWorkspaceHandler(Handler):  # pylint: disable=too-few-public-methods
     """CreateWorkspace command handler."""
@@ -87,29 +145,26 @@ class TrainWorkspaceHandler(Handler):
     """TrainWorkspaceHandler class."""
 
     _data_processor: IDataProcessor[WorkspaceDTO, TrainDataSet]
-    _workspace_repository: IRepository[WorkspaceDTO]
+    _workspace_mapper: IAggregateMapper[Workspace]
     _workspace_finder: IFinder[WorkspaceDTO]
     _requestor: IExecutor[HTTPRequest, HTTPResponse]
-    _serializer: IDomainSerializer[Workspace, WorkspaceDTO]
     _flux_train_endpoint_url: str
     _flux_train_endpoint_method: str
 
     def __init__(
         self,
         data_processor: IDataProcessor[WorkspaceDTO, TrainDataSet],
-        workspace_repository: IRepository[WorkspaceDTO],
+        workspace_mapper: IAggregateMapper[Workspace],
         workspace_finder: IFinder[WorkspaceDTO],
         requestor: IExecutor[HTTPRequest, HTTPResponse],
-        serializer: IDomainSerializer[Workspace, WorkspaceDTO],
         flux_train_endpoint_url: str,
         flux_train_endpoint_method: str,
     ) -> None:
         """Class constructior."""
         self._data_processor = data_processor
-        self._workspace_repository = workspace_repository
+        self._workspace_mapper = workspace_mapper
         self._workspace_finder = workspace_finder
         self._requestor = requestor
-        self._serializer = serializer
         self._flux_train_endpoint_url = flux_train_endpoint_url
         self._flux_train_endpoint_method = flux_train_endpoint_method
 
@@ -154,13 +209,16 @@ class TrainWorkspaceHandler(Handler):
 
             return TrainingResponse(**response_obj)
 
-        workspace = self._serializer.deserialize(dto=workspace_dto)
+        # Only a scalar field changes, so the categories are left unloaded.
+        workspace = self._workspace_mapper.get(
+            id=command.workspace_id, owner_id=command.owner
+        )
+
+        assert workspace
 
         workspace.set_model_id(model_id=http_response.body["model_id"])
 
-        self._workspace_repository.update(
-            workspace=self._serializer.serialize(domain_obj=workspace)
-        )
+        self._workspace_mapper.update(aggregate=workspace)
 
         response_obj.update({"model_id": f"{http_response.body['model_id']}"})
 
@@ -168,80 +226,409 @@ class TrainWorkspaceHandler(Handler):
 
 
 class CreateWorkspaceFromUploadExcelFileCommandHandler(
-    Handler
+    Handler[UploadResult]
 ):  # pylint: disable=too-few-public-methods
     """CreateWorkspaceFromUploadExcelFileCommandHandler command handler."""
 
-    _workspace_repository: IRepository[WorkspaceDTO]
-    _serializer: IDomainSerializer[Workspace, WorkspaceDTO]
+    _workspace_mapper: IAggregateMapper[Workspace]
     _file_reader: IFileReader[FileWorkspace]
     _workspace_finder: IFinder[WorkspaceDTO]
     _file_processor: IFileProcessor[Workspace, FileWorkspace, str]
+    _ingestion_log: IIngestionLog
+    _budget_finder: IIngestionBudgetFinder[IngestionBudget]
+    _unit_of_work: IUnitOfWork
+    _normalizer: TextNormalizer
+    _merge_mode: str
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
-        workspace_repository: IRepository[WorkspaceDTO],
-        serializer: IDomainSerializer[Workspace, WorkspaceDTO],
+        workspace_mapper: IAggregateMapper[Workspace],
         file_reader: IFileReader[FileWorkspace],
         workspace_finder: IFinder[WorkspaceDTO],
         file_processor: IFileProcessor[Workspace, FileWorkspace, str],
+        ingestion_log: IIngestionLog,
+        budget_finder: IIngestionBudgetFinder[IngestionBudget],
+        unit_of_work: IUnitOfWork,
+        normalizer: TextNormalizer,
+        merge_mode: str = MERGE_MODE_REPLACE,
     ) -> None:
         """Class constructor."""
-        self._workspace_repository = workspace_repository
+        self._workspace_mapper = workspace_mapper
         self._file_reader = file_reader
-        self._serializer = serializer
         self._workspace_finder = workspace_finder
         self._file_processor = file_processor
+        self._ingestion_log = ingestion_log
+        self._budget_finder = budget_finder
+        self._unit_of_work = unit_of_work
+        self._normalizer = normalizer
+        self._merge_mode = check_merge_mode(merge_mode=merge_mode)
 
     def handle(
         self, command: CreateOrUpdateWorkspaceFromUploadExcelFileCommand
-    ) -> None:
-        """Handle an CreateOrUpdateWorkspaceFromUploadExcelFileCommand."""
+    ) -> UploadResult:
+        """
+        Handle an CreateOrUpdateWorkspaceFromUploadExcelFileCommand.
+
+        The 'on_progress' callback of the command, if any, receives the number of
+        rows parsed and written once the file is parsed and after every workspace.
+        """
         logger.info("Start Handling a '%s'", command)
 
+        guard = IngestionGuard(budget=self._budget_finder.get(owner_id=command.owner))
+        guard.check_file(file=command.file_bytes)
+
+        file_hash = fingerprint_file(file=command.file_bytes)
+
+        if self._ingestion_log.is_file_unchanged(
+            owner_id=command.owner, file_hash=file_hash
+        ):
+            logger.info("Command '%s' skipped: the file has no changes.", command)
+
+            return UploadResult(changed=False)
+
         file_workspaces_set = self._file_reader.read_from_bytes(
             bytes=command.file_bytes
         )
 
-        self._file_processor.process(
-            file_workspaces=file_workspaces_set, owner=command.owner
+        guard.check_workspaces(file_workspaces=file_workspaces_set)
+
+        file_workspaces_set, duplicates_removed = self._normalizer.normalize_workspaces(
+            file_workspaces=file_workspaces_set
         )
 
-        for workspace in self._file_processor.new_objs:
-            self._workspace_repository.save(
-                workspace=self._serializer.serialize(domain_obj=workspace)
+        sheet_rows = {
+            file_workspace.name: sum(
+                len(file_category.texts) for file_category in file_workspace.categories
             )
+            for file_workspace in file_workspaces_set
+        }
+        progress = partial(
+            _report_progress,
+            on_progress=command.on_progress,
+            rows_parsed=sum(sheet_rows.values()),
+        )
+        progress(rows_written=0)
+
+        sheet_hashes = {
+            file_workspace.name: fingerprint_workspace(file_workspace=file_workspace)
+            for file_workspace in file_workspaces_set
+        }
+        stored_sheet_hashes = self._ingestion_log.get_sheet_hashes(
+            owner_id=command.owner, names=list(sheet_hashes)
+        )
+        changed_file_workspaces = {
+            file_workspace
+            for file_workspace in file_workspaces_set
+            if stored_sheet_hashes.get(file_workspace.name)
+            != sheet_hashes[file_workspace.name]
+        }
+
+        # The workspaces and the fingerprints of the file are written together, and
+        # the events of the workspaces are only published once they are committed.
+        with self._unit_of_work.atomic():
+            if changed_file_workspaces:
+                processing_result = self._file_processor.process(
+                    file_workspaces=changed_file_workspaces,
+                    owner=command.owner,
+                    merge_mode=check_merge_mode(
+                        merge_mode=command.merge_mode or self._merge_mode
+                    ),
+                )
+
+                rows_written = 0
+
+                for workspace in processing_result.new:
+                    self._workspace_mapper.save(aggregate=workspace)
+                    rows_written += sheet_rows[workspace.name.value]
+                    progress(rows_written=rows_written)
+
+                for workspace in processing_result.existing:
+                    self._workspace_mapper.update(aggregate=workspace)
+                    rows_written += sheet_rows[workspace.name.value]
+                    progress(rows_written=rows_written)
 
-        for workspace in self._file_processor.existing_objs:
-            self._workspace_repository.update(
-                workspace=self._serializer.serialize(domain_obj=workspace)
+            self._ingestion_log.record(
+                owner_id=command.owner, sheet_hashes=sheet_hashes, file_hash=file_hash
             )
 
         logger.info("Command '%s' successfully executed.", command)
 
+        return UploadResult(
+            changed=bool(changed_file_workspaces),
+            workspaces_processed=sorted(
+                file_workspace.name for file_workspace in changed_file_workspaces
+            ),
+            workspaces_skipped=sorted(
+                file_workspace.name
+                for file_workspace in file_workspaces_set - changed_file_workspaces
+            ),
+            duplicates_removed=duplicates_removed,
+        )
+
+
+class StreamWorkspacesFromUploadExcelFileCommandHandler(
+    Handler[IngestionReport]
+):  # pylint: disable=too-few-public-methods
+    """StreamWorkspacesFromUploadExcelFileCommand Handler."""
+
+    _workspace_repository: IRepository[WorkspaceDTO]
+    _bulk_repository: IBulkRepository[CategoryDTO, DocumentDTO]
+    _workspace_finder: IWorkspaceFinder[WorkspaceDTO]
+    _file_reader: IFileRowReader[FileRow]
+    _serializer: IDomainSerializer[Workspace, WorkspaceDTO]
+    _category_serializer: IDomainSerializer[Category, CategoryDTO]
+    _document_serializer: IDomainSerializer[Document, DocumentDTO]
+    _ingestion_log: IIngestionLog
+    _unit_of_work: IUnitOfWork
+    _publisher: IEventPublisher
+    _budget_finder: IIngestionBudgetFinder[IngestionBudget]
+    _normalizer: TextNormalizer
+    _batch_size: int
+    _merge_mode: str
+    _document_ids: DocumentIdFactory
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        workspace_repository: IRepository[WorkspaceDTO],
+        bulk_repository: IBulkRepository[CategoryDTO, DocumentDTO],
+        workspace_finder: IWorkspaceFinder[WorkspaceDTO],
+        file_reader: IFileRowReader[FileRow],
+        serializer: IDomainSerializer[Workspace, WorkspaceDTO],
+        category_serializer: IDomainSerializer[Category, CategoryDTO],
+        document_serializer: IDomainSerializer[Document, DocumentDTO],
+        ingestion_log: IIngestionLog,
+        unit_of_work: IUnitOfWork,
+        publisher: IEventPublisher,
+        budget_finder: IIngestionBudgetFinder[IngestionBudget],
+        normalizer: TextNormalizer,
+        batch_size: int,
+        merge_mode: str = MERGE_MODE_REPLACE,
+        document_ids: Optional[DocumentIdFactory] = None,
+    ) -> None:
+        """Class constructor."""
+        self._workspace_repository = workspace_repository
+        self._bulk_repository = bulk_repository
+        self._workspace_finder = workspace_finder
+        self._file_reader = file_reader
+        self._serializer = serializer
+        self._category_serializer = category_serializer
+        self._document_serializer = document_serializer
+        self._ingestion_log = ingestion_log
+        self._unit_of_work = unit_of_work
+        self._publisher = publisher
+        self._budget_finder = budget_finder
+        self._normalizer = normalizer
+        self._batch_size = batch_size
+        self._merge_mode = check_merge_mode(merge_mode=merge_mode)
+        self._document_ids = document_ids or DocumentIdFactory()
+
+    def handle(
+        self, command: StreamWorkspacesFromUploadExcelFileCommand
+    ) -> IngestionReport:
+        """
+        Handle a StreamWorkspacesFromUploadExcelFileCommand.
+
+        The file is ingested, and recorded in the ingestion log, in a single unit of
+        work, so a file that fails, even in its last batch, leaves the stored
+        workspaces as they were. The events of the changes are published once it is
+        committed.
+        """
+        logger.info("Start Handling a '%s'", command)
+
+        guard = IngestionGuard(budget=self._budget_finder.get(owner_id=command.owner))
+        guard.check_file(file=command.file_bytes)
+
+        file_hash = fingerprint_file(file=command.file_bytes)
+
+        if self._ingestion_log.is_file_unchanged(
+            owner_id=command.owner, file_hash=file_hash
+        ):
+            logger.info("Command '%s' skipped: the file has no changes.", command)
+
+            return IngestionReport(
+                rows=0, documents=0, workspaces_created=[], workspaces_updated=[]
+            )
+
+        pipeline = self._create_pipeline(
+            owner=command.owner,
+            merge_mode=command.merge_mode,
+            on_progress=command.on_progress,
+        )
+
+        with self._unit_of_work.atomic():
+            report = pipeline.run(
+                rows=guard.guard_rows(
+                    rows=self._file_reader.iter_rows(bytes=command.file_bytes)
+                )
+            )
+
+            self._ingestion_log.record(
+                owner_id=command.owner,
+                sheet_hashes=pipeline.sheet_hashes,
+                file_hash=file_hash,
+            )
+            self._publish_events(pipeline=pipeline)
+
+        logger.info("Command '%s' successfully executed: %s", command, report)
+
+        return report
+
+    def ingest_rows(
+        self, owner: str, rows: Iterable[FileRow], merge_mode: Optional[str] = None
+    ) -> IngestionReport:
+        """
+        Write rows that were already parsed, within the budget of the owner.
+
+        The rows are written in a single unit of work, and are not recorded in the
+        ingestion log, as they do not come from an uploaded file.
+        """
+        guard = IngestionGuard(budget=self._budget_finder.get(owner_id=owner))
+        pipeline = self._create_pipeline(owner=owner, merge_mode=merge_mode)
+
+        with self._unit_of_work.atomic():
+            report = pipeline.run(rows=guard.guard_rows(rows=rows))
+            self._publish_events(pipeline=pipeline)
+
+        return report
+
+    def _publish_events(self, pipeline: WorkspaceIngestionPipeline) -> None:
+        """Publish the events recorded by the pipeline after the commit."""
+        events = pipeline.pull_events()
+
+        if events:
+            self._unit_of_work.on_commit(
+                partial(self._publisher.publish, events=events)
+            )
+
+    def _create_pipeline(
+        self,
+        owner: str,
+        merge_mode: Optional[str] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> WorkspaceIngestionPipeline:
+        """Create the pipeline writing the rows of an owner."""
+        return WorkspaceIngestionPipeline(
+            owner=owner,
+            batch_size=self._batch_size,
+            workspace_repository=self._workspace_repository,
+            bulk_repository=self._bulk_repository,
+            workspace_finder=self._workspace_finder,
+            workspace_serializer=self._serializer,
+            category_serializer=self._category_serializer,
+            document_serializer=self._document_serializer,
+            normalizer=self._normalizer,
+            merge_mode=merge_mode or self._merge_mode,
+            document_ids=self._document_ids,
+            on_progress=on_progress,
+        )
+
+
+class ImportCorpusCommandHandler(
+    Handler[CorpusImportReport]
+):  # pylint: disable=too-few-public-methods
+    """ImportCorpusCommand Handler."""
+
+    _corpus_reader: ICorpusReader[CorpusFile]
+    _stream_handler: StreamWorkspacesFromUploadExcelFileCommandHandler
+
+    def __init__(
+        self,
+        corpus_reader: ICorpusReader[CorpusFile],
+        stream_handler: StreamWorkspacesFromUploadExcelFileCommandHandler,
+    ) -> None:
+        """Class constructor."""
+        self._corpus_reader = corpus_reader
+        self._stream_handler = stream_handler
+
+    def handle(self, command: ImportCorpusCommand) -> CorpusImportReport:
+        """
+        Handle an ImportCorpusCommand.
+
+        The files are parsed in worker processes while this process writes the rows
+        of every parsed file in batches. A file that cannot be parsed or written is
+        reported and the import goes on with the next one.
+        """
+        logger.info("Start Handling a '%s'", command)
+
+        start = time.perf_counter()
+        files = []
+
+        for corpus_file in self._corpus_reader.read_files(
+            paths=command.paths, workers=command.workers
+        ):
+            file_report = self._import_file(
+                owner=command.owner,
+                corpus_file=corpus_file,
+                merge_mode=command.merge_mode,
+            )
+            files.append(file_report)
+
+            if command.on_file is not None:
+                command.on_file(file_report)
+
+        report = CorpusImportReport(files=files, seconds=time.perf_counter() - start)
+
+        logger.info(
+            "Command '%s' successfully executed: %d rows, %d failed files.",
+            command,
+            report.rows,
+            len(report.failed),
+        )
+
+        return report
+
+    def _import_file(
+        self, owner: str, corpus_file: CorpusFile, merge_mode: Optional[str]
+    ) -> CorpusFileReport:
+        """
+        Write the rows of a file, reporting the error if any.
+
+        Every file is written in its own unit of work, so a file that fails for any
+        reason, from invalid rows to a database constraint, is not written at all
+        and does not stop the import of the following files.
+        """
+        if corpus_file.error is not None:
+            return CorpusFileReport(path=corpus_file.path, error=corpus_file.error)
+
+        try:
+            report = self._stream_handler.ingest_rows(
+                owner=owner, rows=corpus_file.rows, merge_mode=merge_mode
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            logger.warning("File '%s' not imported: %s", corpus_file.path, error)
+
+            return CorpusFileReport(path=corpus_file.path, error=str(error))
+
+        return CorpusFileReport(
+            path=corpus_file.path, rows=report.rows, documents=report.documents
+        )
+
 
 class CreateWorkspaceAndAddDataFromFileCommandHandler(
     Handler[Optional[str]]
 ):  # pylint: disable=too-few-public-methods
     """CreateWorkspaceAndAddDataFromFileCommand Handler."""
 
-    _workspace_repository: IRepository[WorkspaceDTO]
-    _serializer: IDomainSerializer[Workspace, WorkspaceDTO]
+    _workspace_mapper: IAggregateMapper[Workspace]
     _file_reader: IFileReader[FileWorkspace]
     _file_processor: IFileProcessor[Workspace, FileWorkspace, str]
+    _budget_finder: IIngestionBudgetFinder[IngestionBudget]
+    _normalizer: TextNormalizer
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
-        workspace_repository: IRepository[WorkspaceDTO],
-        serializer: IDomainSerializer[Workspace, WorkspaceDTO],
+        workspace_mapper: IAggregateMapper[Workspace],
         file_reader: IFileReader[FileWorkspace],
         file_processor: IFileProcessor[Workspace, FileWorkspace, str],
+        budget_finder: IIngestionBudgetFinder[IngestionBudget],
+        normalizer: TextNormalizer,
     ) -> None:
         """Class constructor."""
-        self._workspace_repository = workspace_repository
+        self._workspace_mapper = workspace_mapper
         self._file_reader = file_reader
-        self._serializer = serializer
         self._file_processor = file_processor
+        self._budget_finder = budget_finder
+        self._normalizer = normalizer
 
     def handle(
         self, command: CreateWorkspaceAndAddDataFromFileCommand
@@ -249,32 +636,65 @@ class CreateWorkspaceAndAddDataFromFileCommandHandler(
         """Handle an AddDataToWorkspaceFromFileCommand."""
         logger.info("Start Handling a '%s'", command)
 
-        file_workspaces_set = self._file_reader.read_from_bytes(
-            bytes=command.file_bytes
+        guard = IngestionGuard(
+            budget=self._budget_finder.get(owner_id=command.owner_id)
         )
+        guard.check_file(file=command.file_bytes)
 
-        file_workspace_names = [
-            workspace_file.name for workspace_file in file_workspaces_set
-        ]
+        sheet_names = self._file_reader.list_sheet_names(bytes=command.file_bytes)
 
-        if command.workspace_name not in file_workspace_names:
+        if command.workspace_name not in sheet_names:
             raise WorkspaceDoesNotExistsError(message=command.workspace_name)
 
+        # Only the sheet of the workspace is parsed.
+        file_workspaces_set = self._file_reader.read_sheets(
+            bytes=command.file_bytes, names=[command.workspace_name]
+        )
+
         for workspace_file in file_workspaces_set:
             if command.workspace_name == workspace_file.name:
-                self._file_processor.process(
-                    file_workspaces={workspace_file}, owner=command.owner_id
+                guard.check_workspaces(file_workspaces=[workspace_file])
+
+                (
+                    normalized_workspaces,
+                    duplicates_removed,
+                ) = self._normalizer.normalize_workspaces(
+                    file_workspaces=[workspace_file]
+                )
+                logger.info(
+                    "%s duplicated documents removed from '%s'.",
+                    duplicates_removed,
+                    workspace_file.name,
                 )
 
-                if command.workspace_name in self._file_processor.existing_objs:
+                processing_result = self._file_processor.process(
+                    file_workspaces=normalized_workspaces,
+                    owner=command.owner_id,
+                    merge_mode=MERGE_MODE_REPLACE,
+                )
+
+                if processing_result.is_existing(name=command.workspace_name):
                     raise WorkspaceAlreadyExistsError(message=command.workspace_name)
 
-                domain_worksapce = self._file_processor.get(name=command.workspace_name)
+                domain_worksapce = processing_result.get(name=command.workspace_name)
 
                 assert domain_worksapce
 
-                self._workspace_repository.save(
-                    workspace=self._serializer.serialize(domain_obj=domain_worksapce)
+                rows = sum(
+                    len(file_category.texts)
+                    for normalized_workspace in normalized_workspaces
+                    for file_category in normalized_workspace.categories
+                )
+                _report_progress(
+                    on_progress=command.on_progress, rows_parsed=rows, rows_written=0
+                )
+
+                self._workspace_mapper.save(aggregate=domain_worksapce)
+
+                _report_progress(
+                    on_progress=command.on_progress,
+                    rows_parsed=rows,
+                    rows_written=rows,
                 )
 
                 return str(domain_worksapce.id.value)
@@ -282,33 +702,484 @@ class CreateWorkspaceAndAddDataFromFileCommandHandler(
         return None
 
 
+class EnqueueIngestionJobCommandHandler(
+    Handler[str]
+):  # pylint: disable=too-few-public-methods
+    """EnqueueIngestionJobCommand Handler."""
+
+    _job_repository: IIngestionJobRepository[IngestionJobDTO]
+
+    def __init__(
+        self, job_repository: IIngestionJobRepository[IngestionJobDTO]
+    ) -> None:
+        """Class constructor."""
+        self._job_repository = job_repository
+
+    def handle(self, command: EnqueueIngestionJobCommand) -> str:
+        """Handle an EnqueueIngestionJobCommand."""
+        logger.info("Start Handling a '%s'", command)
+
+        job_id = self._job_repository.enqueue(
+            owner_id=command.owner,
+            file_path=command.file_path,
+            workspace_name=command.workspace_name,
+        )
+
+        logger.info("Command '%s' successfully executed: job '%s'.", command, job_id)
+
+        return job_id
+
+
+class ProcessNextIngestionJobCommandHandler(
+    Handler[Optional[str]]
+):  # pylint: disable=too-few-public-methods
+    """
+    ProcessNextIngestionJobCommand Handler.
+
+    Claims the oldest pending job and runs the upload use case it was enqueued for:
+    jobs with a workspace name create that workspace, the rest create or update the
+    workspaces of every sheet, streaming the files bigger than
+    'streaming_min_file_size'. The stored file is deleted once the job succeeds, and
+    kept if it fails, so the job can be retried.
+    """
+
+    _job_repository: IIngestionJobRepository[IngestionJobDTO]
+    _file_storage: IFileStorage
+    _upload_handler: Handler[UploadResult]
+    _stream_handler: Handler[IngestionReport]
+    _create_workspace_handler: Handler[Optional[str]]
+    _streaming_min_file_size: int
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        job_repository: IIngestionJobRepository[IngestionJobDTO],
+        file_storage: IFileStorage,
+        upload_handler: Handler[UploadResult],
+        stream_handler: Handler[IngestionReport],
+        create_workspace_handler: Handler[Optional[str]],
+        streaming_min_file_size: int,
+    ) -> None:
+        """Class constructor."""
+        self._job_repository = job_repository
+        self._file_storage = file_storage
+        self._upload_handler = upload_handler
+        self._stream_handler = stream_handler
+        self._create_workspace_handler = create_workspace_handler
+        self._streaming_min_file_size = streaming_min_file_size
+
+    def handle(self, command: ProcessNextIngestionJobCommand) -> Optional[str]:
+        """
+        Handle a ProcessNextIngestionJobCommand.
+
+        Returns
+            Optional[str]: ID of the processed job, None if there were no pending jobs.
+        """
+        job = self._job_repository.claim_next()
+
+        if job is None:
+            return None
+
+        logger.info("Start Handling a '%s': job '%s'", command, job.id)
+
+        try:
+            with self._file_storage.open(path=job.file_path) as file:
+                result = self._run(job=job, file=file)
+
+        except Exception as error:  # pylint: disable=broad-except
+            logger.exception("Ingestion job '%s' failed.", job.id)
+            self._job_repository.fail(job_id=job.id, error=str(error))
+
+        else:
+            self._job_repository.complete(job_id=job.id, result=result)
+            self._file_storage.delete(path=job.file_path)
+            logger.info(
+                "Command '%s' successfully executed: job '%s'.", command, job.id
+            )
+
+        return job.id
+
+    def _run(self, job: IngestionJobDTO, file: Any) -> Dict[str, Any]:
+        """
+        Run the use case of a job and return its result.
+
+        The progress of the job is updated as the use case reports it, which also
+        renews the lease of the job.
+        """
+        on_progress = partial(self._job_repository.update_progress, job.id)
+
+        if job.workspace_name is not None:
+            workspace_id = self._create_workspace_handler.handle(
+                command=CreateWorkspaceAndAddDataFromFileCommand(
+                    file_bytes=file,
+                    owner_id=job.owner,
+                    workspace_name=job.workspace_name,
+                    on_progress=on_progress,
+                )
+            )
+
+            return {"workspace_id": workspace_id}
+
+        file.seek(0, io.SEEK_END)
+        file_size = file.tell()
+        file.seek(0)
+
+        if file_size > self._streaming_min_file_size:
+            report = self._stream_handler.handle(
+                command=StreamWorkspacesFromUploadExcelFileCommand(
+                    file_bytes=file, owner=job.owner, on_progress=on_progress
+                )
+            )
+            on_progress(report.rows, report.documents)
+
+            return asdict(report)
+
+        upload_result = self._upload_handler.handle(
+            command=CreateOrUpdateWorkspaceFromUploadExcelFileCommand(
+                file_bytes=file, owner=job.owner, on_progress=on_progress
+            )
+        )
+
+        return asdict(upload_result)
+
+
+class RetryIngestionJobCommandHandler(
+    Handler[bool]
+):  # pylint: disable=too-few-public-methods
+    """RetryIngestionJobCommand Handler."""
+
+    _job_repository: IIngestionJobRepository[IngestionJobDTO]
+
+    def __init__(
+        self, job_repository: IIngestionJobRepository[IngestionJobDTO]
+    ) -> None:
+        """Class constructor."""
+        self._job_repository = job_repository
+
+    def handle(self, command: RetryIngestionJobCommand) -> bool:
+        """
+        Handle a RetryIngestionJobCommand.
+
+        Returns
+            bool: whether the job was queued again, as only failed jobs are.
+        """
+        logger.info("Start Handling a '%s'", command)
+
+        retried = self._job_repository.retry(job_id=command.job_id)
+
+        logger.info("Command '%s' executed: retried %s.", command, retried)
+
+        return retried
+
+
+class CleanUpIngestionJobsCommandHandler(
+    Handler[int]
+):  # pylint: disable=too-few-public-methods
+    """
+    CleanUpIngestionJobsCommand Handler.
+
+    Abandons the jobs failed for longer than the retention of the command, deleting
+    the files kept to retry them.
+    """
+
+    _job_repository: IIngestionJobRepository[IngestionJobDTO]
+    _file_storage: IFileStorage
+
+    def __init__(
+        self,
+        job_repository: IIngestionJobRepository[IngestionJobDTO],
+        file_storage: IFileStorage,
+    ) -> None:
+        """Class constructor."""
+        self._job_repository = job_repository
+        self._file_storage = file_storage
+
+    def handle(self, command: CleanUpIngestionJobsCommand) -> int:
+        """
+        Handle a CleanUpIngestionJobsCommand.
+
+        Returns
+            int: number of jobs abandoned.
+        """
+        logger.info("Start Handling a '%s'", command)
+
+        file_paths = self._job_repository.abandon_failed(older_than=command.older_than)
+
+        for file_path in file_paths:
+            self._file_storage.delete(path=file_path)
+
+        logger.info(
+            "Command '%s' successfully executed: %s jobs abandoned.",
+            command,
+            len(file_paths),
+        )
+
+        return len(file_paths)
+
+
+class StartChunkedUploadCommandHandler(
+    Handler[ChunkedUploadDTO]
+):  # pylint: disable=too-few-public-methods
+    """
+    StartChunkedUploadCommand Handler.
+
+    Creates an empty file for the chunks of an upload, once its declared size is
+    checked against the budget of the owner.
+    """
+
+    _upload_repository: IChunkedUploadRepository[ChunkedUploadDTO]
+    _file_storage: IFileStorage
+    _budget_finder: IIngestionBudgetFinder[IngestionBudget]
+
+    def __init__(
+        self,
+        upload_repository: IChunkedUploadRepository[ChunkedUploadDTO],
+        file_storage: IFileStorage,
+        budget_finder: IIngestionBudgetFinder[IngestionBudget],
+    ) -> None:
+        """Class constructor."""
+        self._upload_repository = upload_repository
+        self._file_storage = file_storage
+        self._budget_finder = budget_finder
+
+    def handle(self, command: StartChunkedUploadCommand) -> ChunkedUploadDTO:
+        """Handle a StartChunkedUploadCommand."""
+        logger.info("Start Handling a '%s'", command)
+
+        IngestionGuard(
+            budget=self._budget_finder.get(owner_id=command.owner)
+        ).check_file_size(size=command.size)
+
+        upload = self._upload_repository.create(
+            owner_id=command.owner,
+            filename=command.filename,
+            file_path=self._file_storage.create(name=command.filename),
+            size=command.size,
+        )
+
+        logger.info("Command '%s' successfully executed: %s", command, upload.id)
+
+        return upload
+
+
+class AppendChunkCommandHandler(
+    Handler[ChunkedUploadDTO]
+):  # pylint: disable=too-few-public-methods
+    """
+    AppendChunkCommand Handler.
+
+    The upload is locked while the chunk is appended, and the chunk must start at
+    the bytes already received, so a chunk is never written twice.
+    """
+
+    _upload_repository: IChunkedUploadRepository[ChunkedUploadDTO]
+    _file_storage: IFileStorage
+    _unit_of_work: IUnitOfWork
+
+    def __init__(
+        self,
+        upload_repository: IChunkedUploadRepository[ChunkedUploadDTO],
+        file_storage: IFileStorage,
+        unit_of_work: IUnitOfWork,
+    ) -> None:
+        """Class constructor."""
+        self._upload_repository = upload_repository
+        self._file_storage = file_storage
+        self._unit_of_work = unit_of_work
+
+    def handle(self, command: AppendChunkCommand) -> ChunkedUploadDTO:
+        """
+        Handle an AppendChunkCommand.
+
+        Raises
+            ChunkedUploadDoesNotExistError: if the upload does not exist.
+            ChunkedUploadConflictError: if the upload is completed, or the chunk
+                does not start at the bytes received.
+            InvalidChunkError: if the chunk exceeds the declared size.
+        """
+        with self._unit_of_work.atomic():
+            upload = self._upload_repository.get(
+                id=command.upload_id, owner_id=command.owner, lock=True
+            )
+
+            if upload is None:
+                raise ChunkedUploadDoesNotExistError(message=command.upload_id)
+
+            if upload.status != ChunkedUploadDTO.UPLOADING:
+                raise ChunkedUploadConflictError(
+                    message="The upload is already completed."
+                )
+
+            received = self._file_storage.size(path=upload.file_path)
+
+            if command.offset != received:
+                raise ChunkedUploadConflictError(
+                    message="Offset mismatch.", offset=received
+                )
+
+            if command.offset + command.chunk_size > upload.size:
+                raise InvalidChunkError(message="The chunk exceeds the declared size.")
+
+            self._file_storage.append(path=upload.file_path, chunk=command.chunk)
+            self._upload_repository.touch(id=upload.id)
+
+        return upload
+
+
+class CompleteChunkedUploadCommandHandler(
+    Handler[str]
+):  # pylint: disable=too-few-public-methods
+    """
+    CompleteChunkedUploadCommand Handler.
+
+    Enqueues the ingestion of a fully received upload, once the file passes the
+    same metadata precheck as a single request upload. Completing an upload twice
+    returns the job of the first time.
+    """
+
+    _upload_repository: IChunkedUploadRepository[ChunkedUploadDTO]
+    _job_repository: IIngestionJobRepository[IngestionJobDTO]
+    _file_storage: IFileStorage
+    _file_validator: WorkspaceFileValidator
+    _budget_finder: IIngestionBudgetFinder[IngestionBudget]
+    _unit_of_work: IUnitOfWork
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        upload_repository: IChunkedUploadRepository[ChunkedUploadDTO],
+        job_repository: IIngestionJobRepository[IngestionJobDTO],
+        file_storage: IFileStorage,
+        file_validator: WorkspaceFileValidator,
+        budget_finder: IIngestionBudgetFinder[IngestionBudget],
+        unit_of_work: IUnitOfWork,
+    ) -> None:
+        """Class constructor."""
+        self._upload_repository = upload_repository
+        self._job_repository = job_repository
+        self._file_storage = file_storage
+        self._file_validator = file_validator
+        self._budget_finder = budget_finder
+        self._unit_of_work = unit_of_work
+
+    def handle(self, command: CompleteChunkedUploadCommand) -> str:
+        """
+        Handle a CompleteChunkedUploadCommand.
+
+        Returns
+            str: ID of the job ingesting the upload.
+
+        Raises
+            ChunkedUploadDoesNotExistError: if the upload does not exist.
+            ChunkedUploadConflictError: if the upload is not fully received.
+            InvalidWorkbookError: if the file is not a workbook.
+            IngestionBudgetExceededError: if the file is over the budget.
+        """
+        logger.info("Start Handling a '%s'", command)
+
+        with self._unit_of_work.atomic():
+            upload = self._upload_repository.get(
+                id=command.upload_id, owner_id=command.owner, lock=True
+            )
+
+            if upload is None:
+                raise ChunkedUploadDoesNotExistError(message=command.upload_id)
+
+            if upload.status != ChunkedUploadDTO.UPLOADING:
+                assert upload.job_id
+
+                return upload.job_id
+
+            received = self._file_storage.size(path=upload.file_path)
+
+            if received != upload.size:
+                raise ChunkedUploadConflictError(
+                    message="The upload is incomplete.", offset=received
+                )
+
+            with self._file_storage.open(path=upload.file_path) as file:
+                self._file_validator.validate(
+                    value=file,
+                    budget=self._budget_finder.get(owner_id=command.owner),
+                )
+
+            job_id = self._job_repository.enqueue(
+                owner_id=command.owner, file_path=upload.file_path
+            )
+            self._upload_repository.complete(id=upload.id, job_id=job_id)
+
+        logger.info("Command '%s' successfully executed: job '%s'.", command, job_id)
+
+        return job_id
+
+
+class ExpireChunkedUploadsCommandHandler(
+    Handler[int]
+):  # pylint: disable=too-few-public-methods
+    """
+    ExpireChunkedUploadsCommand Handler.
+
+    Deletes the uploads that received no chunk for longer than the expiry of the
+    command, along with their partial files.
+    """
+
+    _upload_repository: IChunkedUploadRepository[ChunkedUploadDTO]
+    _file_storage: IFileStorage
+
+    def __init__(
+        self,
+        upload_repository: IChunkedUploadRepository[ChunkedUploadDTO],
+        file_storage: IFileStorage,
+    ) -> None:
+        """Class constructor."""
+        self._upload_repository = upload_repository
+        self._file_storage = file_storage
+
+    def handle(self, command: ExpireChunkedUploadsCommand) -> int:
+        """
+        Handle an ExpireChunkedUploadsCommand.
+
+        Returns
+            int: number of uploads expired.
+        """
+        logger.info("Start Handling a '%s'", command)
+
+        file_paths = self._upload_repository.expire(older_than=command.older_than)
+
+        for file_path in file_paths:
+            self._file_storage.delete(path=file_path)
+
+        logger.info(
+            "Command '%s' successfully executed: %s uploads expired.",
+            command,
+            len(file_paths),
+        )
+
+        return len(file_paths)
+
+
 class WorkspaceMetricsCommandHandler(Handler):
     """WorkspaceMetricsCommand Handler."""
 
     _data_processor: IDataProcessor[WorkspaceDTO, TrainDataSet]
-    _workspace_repository: IRepository[WorkspaceDTO]
+    _workspace_mapper: IAggregateMapper[Workspace]
     _workspace_finder: IFinder[WorkspaceDTO]
     _requestor: IExecutor[HTTPRequest, HTTPResponse]
-    _serializer: IDomainSerializer[Workspace, WorkspaceDTO]
     _flux_metrics_endpoint_url: str
     _flux_metrics_endpoint_method: str
 
     def __init__(
         self,
         data_processor: IDataProcessor[WorkspaceDTO, TrainDataSet],
-        workspace_repository: IRepository[WorkspaceDTO],
+        workspace_mapper: IAggregateMapper[Workspace],
         workspace_finder: IFinder[WorkspaceDTO],
         requestor: IExecutor[HTTPRequest, HTTPResponse],
-        serializer: IDomainSerializer[Workspace, WorkspaceDTO],
         flux_metrics_endpoint_url: str,
         flux_metrics_endpoint_method: str,
     ) -> None:
         """Class constructior."""
         self._data_processor = data_processor
-        self._workspace_repository = workspace_repository
+        self._workspace_mapper = workspace_mapper
         self._workspace_finder = workspace_finder
         self._requestor = requestor
-        self._serializer = serializer
         self._flux_metrics_endpoint_url = flux_metrics_endpoint_url
         self._flux_metrics_endpoint_method = flux_metrics_endpoint_method
 
@@ -335,13 +1206,16 @@ class WorkspaceMetricsCommandHandler(Handler):
         except Exception as error:
             raise RequestExecutionError(message=str(error)) from error
 
-        workspace = self._serializer.deserialize(dto=workspace_dto)
+        # Only a scalar field changes, so the categories are left unloaded.
+        workspace = self._workspace_mapper.get(
+            id=command.workspace_id, owner_id=command.owner
+        )
+
+        assert workspace
 
         workspace.set_metrics(metrics=http_response.body["report"])
 
-        self._workspace_repository.update(
-            workspace=self._serializer.serialize(domain_obj=workspace)
-        )
+        self._workspace_mapper.update(aggregate=workspace)
 
 
 # TODO: WIP
@@ -0,0 +1,107 @@
+"""Identifiers module."""
+import secrets
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_counter = 0
+
+_MAX_COUNTER = 0xFFF
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID, as the version 7 of RFC 9562.
+
+    The first 48 bits are the Unix time in milliseconds, followed by a 12 bits
+    counter, randomly seeded every millisecond, and 62 random bits. UUIDs generated
+    by a process are strictly increasing, so rows inserted together land in the same
+    pages of the primary key index instead of being scattered across it.
+
+    Returns
+        uuid.UUID: version 7 UUID.
+    """
+    global _last_timestamp, _counter  # pylint: disable=global-statement
+
+    with _lock:
+        timestamp = time.time_ns() // 1_000_000
+
+        if timestamp > _last_timestamp:
+            _last_timestamp = timestamp
+            # Half of the counter is left for the UUIDs of the same millisecond.
+            _counter = secrets.randbits(11)
+        elif _counter < _MAX_COUNTER:
+            _counter += 1
+        else:
+            _last_timestamp += 1
+            _counter = 0
+
+        timestamp, counter = _last_timestamp, _counter
+
+    return uuid.UUID(
+        int=(
+            timestamp << 80
+            | 0x7 << 76
+            | counter << 64
+            | 0b10 << 62
+            | secrets.randbits(62)
+        )
+    )
+
+
+DOCUMENT_IDS_UUID7 = "uuid7"
+DOCUMENT_IDS_CONTENT = "content"
+
+DOCUMENT_ID_SCHEMES = (DOCUMENT_IDS_UUID7, DOCUMENT_IDS_CONTENT)
+
+# Namespace of the content-addressed document IDs. It must never change, otherwise
+# the documents ingested again would get new IDs.
+DOCUMENTS_NAMESPACE = uuid.UUID("ab4a37ca-4619-450f-9af3-ca8b16b0d183")
+
+
+class DocumentIdFactory:
+    """
+    DocumentIdFactory class.
+
+    Generates the IDs of the new documents with one of two schemes: time-ordered
+    UUIDs, or UUIDs derived from the content of the document, so ingesting the
+    same text into the same category always gives the same ID.
+
+    With content-addressed IDs, repeated ingestions are idempotent: the documents
+    already stored are skipped by ID, and the duplicated texts of a category become
+    a single document.
+    """
+
+    _scheme: str
+
+    def __init__(self, scheme: str = DOCUMENT_IDS_UUID7) -> None:
+        """Class constructor."""
+        if scheme not in DOCUMENT_ID_SCHEMES:
+            raise ValueError(
+                f"Invalid document ID scheme '{scheme}', "
+                f"expected one of {DOCUMENT_ID_SCHEMES}."
+            )
+
+        self._scheme = scheme
+
+    @property
+    def is_content_addressed(self) -> bool:
+        """Check if the IDs are derived from the content of the documents."""
+        return self._scheme == DOCUMENT_IDS_CONTENT
+
+    def generate(self, workspace_id: str, category_name: str, text: str) -> uuid.UUID:
+        """
+        Generate the ID of a new document.
+
+        Content-addressed IDs are the UUIDv5 of the workspace ID, the category name
+        and the normalized text. The workspace ID, rather than its name, keeps the
+        documents of different owners apart.
+        """
+        if self._scheme == DOCUMENT_IDS_UUID7:
+            return uuid7()
+
+        return uuid.uuid5(
+            DOCUMENTS_NAMESPACE, f"{workspace_id}\x1f{category_name}\x1f{text}"
+        )
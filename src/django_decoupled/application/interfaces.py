@@ -1,8 +1,25 @@
 """Application services module."""
 from abc import ABC, abstractmethod
-from typing import Any, Generic, List, Optional, Set, TypeVar
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 from uuid import UUID
 
+from ..domain.events import DomainEvent
+from .dtos import FileProcessingResult
+
 K = TypeVar("K")
 V = TypeVar("V")
 T = TypeVar("T")
@@ -20,9 +37,57 @@ class IRepository(ABC, Generic[V]):
     def save(self, workspace: V) -> None:
         """Save an obj in the database."""
 
+
+class IBulkRepository(ABC, Generic[K, V]):
+    """Interface for repositories writing categories and documents in batches."""
+
+    @abstractmethod
+    def save_categories(self, categories: List[K]) -> None:
+        """Save a batch of categories in the database."""
+
+    @abstractmethod
+    def save_documents(self, documents: List[V]) -> None:
+        """Save a batch of documents in the database."""
+
+    @abstractmethod
+    def delete_documents(self, category_id: str) -> None:
+        """Delete all the documents of a category."""
+
+    @abstractmethod
+    def delete_documents_by_id(self, ids: List[str]) -> None:
+        """Delete a batch of documents by ID."""
+
+    @abstractmethod
+    def iter_document_texts(self, category_id: str) -> Iterator[Tuple[str, str]]:
+        """Yield the text and ID of every document of a category."""
+
+
+class IAggregateMapper(ABC, Generic[V]):
+    """Interface for mapping aggregates straight between database rows and domain."""
+
     @abstractmethod
-    def update(self, workspace: V) -> None:
-        """Update an obj in the database."""
+    def get(self, id: str, owner_id: str) -> Optional[V]:
+        """Get an aggregate by ID and owner ID leaving its categories unloaded."""
+
+    @abstractmethod
+    def get_by_name(self, name: str, owner_id: str) -> Optional[V]:
+        """Get an aggregate by name and owner ID leaving its documents unloaded."""
+
+    @abstractmethod
+    def save(self, aggregate: V) -> None:
+        """Save a new aggregate in the database."""
+
+    @abstractmethod
+    def update(self, aggregate: V) -> None:
+        """Update an aggregate in the database, leaving its unloaded parts as stored."""
+
+
+class IEventPublisher(ABC):
+    """Interface for publishing the events recorded by the domain."""
+
+    @abstractmethod
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        """Deliver every event to the subscribers of its type."""
 
 
 class IFinder(ABC, Generic[V]):
@@ -45,6 +110,157 @@ class IFinder(ABC, Generic[V]):
         """Check if the instance exists in the database."""
 
 
+class IWorkspaceFinder(IFinder[V]):
+    """Interface for the workspace finders, which can leave collections unloaded."""
+
+    @abstractmethod
+    def get_by_name_without_documents(self, name: str, owner_id: str) -> Optional[V]:
+        """Get a workspace by name and owner ID leaving its documents unloaded."""
+
+    @abstractmethod
+    def get_without_categories(self, id: str, owner_id: str) -> Optional[V]:
+        """Get a workspace by ID and owner ID leaving its categories unloaded."""
+
+
+class ICollectionLoader(ABC, Generic[K, V]):
+    """Interface for loading the collections left unloaded by a finder."""
+
+    @abstractmethod
+    def load_categories(self, workspace_id: str) -> List[K]:
+        """Return the categories of a workspace, leaving their documents unloaded."""
+
+    @abstractmethod
+    def load_documents(self, category_id: str) -> Iterator[V]:
+        """Yield the documents of a category."""
+
+
+class IUnitOfWork(ABC):
+    """Interface for running the writes of a use case as a single unit."""
+
+    @abstractmethod
+    def atomic(self) -> ContextManager[None]:
+        """Return a context whose writes are all committed, or none if it fails."""
+
+    @abstractmethod
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Call the callback once the current unit of work is committed."""
+
+
+class IIngestionLog(ABC):
+    """Interface for the log of the files ingested by every owner."""
+
+    @abstractmethod
+    def is_file_unchanged(self, owner_id: str, file_hash: str) -> bool:
+        """Check if every sheet of the file is still stored as it was ingested."""
+
+    @abstractmethod
+    def get_sheet_hashes(self, owner_id: str, names: List[str]) -> Dict[str, str]:
+        """Return the fingerprint of the last ingestion of every sheet by name."""
+
+    @abstractmethod
+    def record(
+        self,
+        owner_id: str,
+        sheet_hashes: Dict[str, str],
+        file_hash: str,
+    ) -> None:
+        """Record the fingerprints of an ingested file and its sheets."""
+
+
+class IIngestionJobRepository(ABC, Generic[V]):
+    """Interface for the persisted queue of ingestion jobs."""
+
+    @abstractmethod
+    def enqueue(
+        self, owner_id: str, file_path: str, workspace_name: Optional[str] = None
+    ) -> str:
+        """Create a pending job and return its ID."""
+
+    @abstractmethod
+    def claim_next(self) -> Optional[V]:
+        """Mark the oldest pending, or abandoned, job as running and return it."""
+
+    @abstractmethod
+    def update_progress(self, job_id: str, rows_parsed: int, rows_written: int) -> None:
+        """Update the progress counters of a running job, renewing its lease."""
+
+    @abstractmethod
+    def complete(self, job_id: str, result: Dict[str, Any]) -> None:
+        """Mark a job as succeeded."""
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str) -> None:
+        """Mark a job as failed."""
+
+    @abstractmethod
+    def retry(self, job_id: str) -> bool:
+        """Mark a failed job as pending again, returning whether it had failed."""
+
+    @abstractmethod
+    def abandon_failed(self, older_than: int) -> List[str]:
+        """Mark the jobs failed for a while as abandoned, returning their files."""
+
+
+class IChunkedUploadRepository(ABC, Generic[V]):
+    """Interface for the uploads received in chunks."""
+
+    @abstractmethod
+    def create(self, owner_id: str, filename: str, file_path: str, size: int) -> V:
+        """Create an upload waiting for its chunks."""
+
+    @abstractmethod
+    def get(self, id: str, owner_id: str, lock: bool = False) -> Optional[V]:
+        """Get an upload, locking it until the end of the unit of work if asked."""
+
+    @abstractmethod
+    def touch(self, id: str) -> None:
+        """Record that a chunk was received, delaying the expiry of the upload."""
+
+    @abstractmethod
+    def complete(self, id: str, job_id: str) -> None:
+        """Mark an upload as completed by the job ingesting it."""
+
+    @abstractmethod
+    def expire(self, older_than: int) -> List[str]:
+        """Delete the uploads without chunks for a while, returning their files."""
+
+
+class IIngestionBudgetFinder(ABC, Generic[V]):
+    """Interface for the ingestion budgets of the owners."""
+
+    @abstractmethod
+    def get(self, owner_id: str) -> V:
+        """Return the ingestion budget of an owner."""
+
+
+class IFileStorage(ABC):
+    """Interface for the storage of the files waiting to be ingested."""
+
+    @abstractmethod
+    def save(self, file: Any) -> str:
+        """Store an uploaded file and return its path."""
+
+    @abstractmethod
+    def create(self, name: str) -> str:
+        """Create an empty file, to be filled by chunks, and return its path."""
+
+    @abstractmethod
+    def append(self, path: str, chunk: IO[bytes]) -> int:
+        """Append a chunk to a stored file and return its new size."""
+
+    @abstractmethod
+    def size(self, path: str) -> int:
+        """Return the size of a stored file."""
+
+    @abstractmethod
+    def open(self, path: str) -> IO[bytes]:
+        """Open a stored file for binary reading."""
+
+    @abstractmethod
+    def delete(self, path: str) -> None:
+        """Delete a stored file."""
+
+
 class IDomainSerializer(ABC, Generic[V, K]):
     """IDomainSerializer Interface."""
 
@@ -106,38 +322,58 @@ class IFileReader(ABC, Generic[K]):
 
     @abstractmethod
     def read_from_bytes(self, bytes: bytes) -> Set[K]:
-        """Read file from bytes."""
+        """Read file from bytes, raising FileValidationError if it is not valid."""
         ...
 
+    @abstractmethod
+    def list_sheet_names(self, bytes: bytes) -> List[str]:
+        """Return the names of the sheets of a file without parsing them."""
 
-class IValidator(ABC):
-    """Validator interface."""
+    @abstractmethod
+    def read_sheets(self, bytes: bytes, names: List[str]) -> Set[K]:
+        """Read only the given sheets of a file, raising FileValidationError too."""
+
+
+class IFileMetadataReader(ABC, Generic[K]):
+    """IFileMetadataReader interface."""
 
-    @staticmethod
     @abstractmethod
-    def validate(value: Any) -> None:
-        """Validate the value parameter."""
+    def read_metadata(self, bytes: bytes) -> K:
+        """Read the sheets and their sizes of a file without parsing its cells."""
 
 
-class IFileProcessor(ABC, Generic[K, V, T]):
-    """FileProcessor interface."""
+class IFileRowReader(ABC, Generic[K]):
+    """IFileRowReader interface."""
 
-    @property
     @abstractmethod
-    def new_objs(self) -> Set[K]:
-        """Return new instances found within the File."""
+    def iter_rows(self, bytes: bytes) -> Iterator[K]:
+        """Stream the rows of a file one at a time."""
+
+
+class ICorpusReader(ABC, Generic[K]):
+    """ICorpusReader interface."""
 
-    @property
     @abstractmethod
-    def existing_objs(self) -> Set[K]:
-        """Return existing instances found within the File."""
+    def read_files(self, paths: List[str], workers: int) -> Iterator[K]:
+        """Parse the files of a corpus, yielding every file as soon as it is read."""
+
+
+class IValidator(ABC):
+    """Validator interface."""
 
     @abstractmethod
-    def process(self, file_workspaces: Set[V], owner: T) -> None:
-        """Process intances within a file."""
+    def validate(self, value: Any) -> None:
+        """Validate the value parameter."""
 
-    def get(self, name: T) -> Optional[K]:
-        """Return an file instance by name."""
+
+class IFileProcessor(ABC, Generic[K, V, T]):
+    """FileProcessor interface."""
+
+    @abstractmethod
+    def process(
+        self, file_workspaces: Set[V], owner: T, merge_mode: str
+    ) -> FileProcessingResult[K]:
+        """Process intances within a file, returning the result of this call only."""
 
 
 class IRequestValidator(ABC, Generic[K]):  # pylint: disable=R0903
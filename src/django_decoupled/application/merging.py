@@ -0,0 +1,63 @@
+"""Merge modes module."""
+from collections import defaultdict
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# The documents of an existing category are replaced by the texts of the file.
+MERGE_MODE_REPLACE = "replace"
+# The texts of the file that are not stored yet are added to the category.
+MERGE_MODE_APPEND = "append"
+# As append, and the stored documents whose text is not in the file are deleted.
+MERGE_MODE_MERGE = "merge"
+
+MERGE_MODES = (MERGE_MODE_REPLACE, MERGE_MODE_APPEND, MERGE_MODE_MERGE)
+
+
+def check_merge_mode(merge_mode: str) -> str:
+    """Return the merge mode, raising ValueError if it is not valid."""
+    if merge_mode not in MERGE_MODES:
+        raise ValueError(
+            f"Invalid merge mode '{merge_mode}', expected one of {MERGE_MODES}."
+        )
+
+    return merge_mode
+
+
+class DocumentMatcher(Generic[T]):
+    """
+    DocumentMatcher class.
+
+    Matches the texts of a file against the documents stored in a category, so the
+    stored documents keep their IDs and only the new texts become new documents.
+
+    Every stored document matches a single text of the file, so duplicated texts
+    are matched one to one.
+    """
+
+    _stored: Dict[str, List[T]]
+
+    def __init__(self, stored: Iterable[Tuple[str, T]]) -> None:
+        """
+        Class constructor.
+
+        Args:
+            stored (Iterable[Tuple[str, T]]): text and document, or document ID, of
+                every stored document.
+        """
+        self._stored = defaultdict(list)
+
+        for text, document in stored:
+            self._stored[text].append(document)
+
+    def match(self, text: str) -> Optional[T]:
+        """Return the stored document with the text, None if the text is new."""
+        documents = self._stored.get(text)
+
+        return documents.pop() if documents else None
+
+    def unmatched(self) -> List[T]:
+        """Return the stored documents that have not matched any text."""
+        return [
+            document for documents in self._stored.values() for document in documents
+        ]
@@ -0,0 +1,121 @@
+"""Text normalization module."""
+import hashlib
+import unicodedata
+from typing import Any, Iterable, Optional, Set, Tuple
+
+from .dtos import FileCategory, FileWorkspace
+
+DEDUP_SCOPE_NONE = "none"
+DEDUP_SCOPE_CATEGORY = "category"
+DEDUP_SCOPE_WORKBOOK = "workbook"
+
+DEDUP_SCOPES = (DEDUP_SCOPE_NONE, DEDUP_SCOPE_CATEGORY, DEDUP_SCOPE_WORKBOOK)
+
+
+class TextNormalizer:
+    """
+    TextNormalizer class.
+
+    Normalizes the document texts of an upload (Unicode NFC, collapsed whitespace
+    and, optionally, casefolding) and identifies the exact duplicates among the
+    normalized texts, either within the same category or across the whole
+    workbook.
+
+    Duplicates are identified by a digest of the text, so deduplicating an upload
+    keeps 16 bytes per distinct text in memory instead of the texts themselves.
+    """
+
+    _casefold: bool
+    _dedup_scope: str
+
+    def __init__(
+        self, casefold: bool = False, dedup_scope: str = DEDUP_SCOPE_CATEGORY
+    ) -> None:
+        """Class constructor."""
+        if dedup_scope not in DEDUP_SCOPES:
+            raise ValueError(
+                f"Invalid dedup scope '{dedup_scope}', expected one of {DEDUP_SCOPES}."
+            )
+
+        self._casefold = casefold
+        self._dedup_scope = dedup_scope
+
+    @property
+    def is_sheet_scoped(self) -> bool:
+        """Check if the texts of different sheets are never duplicates."""
+        return self._dedup_scope == DEDUP_SCOPE_CATEGORY
+
+    def normalize(self, text: Any) -> Any:
+        """Return the normalized text. Non-text values are returned unchanged."""
+        if not isinstance(text, str):
+            return text
+
+        text = " ".join(unicodedata.normalize("NFC", text).split())
+
+        return text.casefold() if self._casefold else text
+
+    def dedup_key(self, workspace: str, category: Any, text: Any) -> Optional[bytes]:
+        """
+        Return the key identifying the duplicates of a normalized text.
+
+        Returns
+            Optional[bytes]: digest of the text within its scope, None if the texts
+            are not deduplicated.
+        """
+        if self._dedup_scope == DEDUP_SCOPE_NONE:
+            return None
+
+        if self._dedup_scope == DEDUP_SCOPE_CATEGORY:
+            value = f"{workspace}\x1f{category}\x1f{text}"
+        else:
+            value = f"{text}"
+
+        return hashlib.blake2b(value.encode(), digest_size=16).digest()
+
+    def normalize_workspaces(
+        self, file_workspaces: Iterable[FileWorkspace]
+    ) -> Tuple[Set[FileWorkspace], int]:
+        """
+        Normalize the texts of the workspaces read from a file, dropping duplicates.
+
+        The workspaces are visited by name, so the same occurrence of a duplicate is
+        kept on every upload.
+
+        Returns
+            Tuple[Set[FileWorkspace], int]: the normalized workspaces and the number
+            of duplicated documents removed.
+        """
+        seen: Set[bytes] = set()
+        removed = 0
+        normalized_workspaces = set()
+
+        for file_workspace in sorted(file_workspaces, key=lambda ws: ws.name):
+            categories = []
+
+            for file_category in file_workspace.categories:
+                texts = []
+
+                for file_text in file_category.texts:
+                    text = self.normalize(text=file_text)
+                    key = self.dedup_key(
+                        workspace=file_workspace.name,
+                        category=file_category.name,
+                        text=text,
+                    )
+
+                    if key is not None:
+                        if key in seen:
+                            removed += 1
+                            continue
+
+                        seen.add(key)
+
+                    texts.append(text)
+
+                categories.append(FileCategory(name=file_category.name, texts=texts))
+
+            normalized_workspaces.add(
+                FileWorkspace(name=file_workspace.name, categories=categories)
+            )
+
+        return normalized_workspaces, removed
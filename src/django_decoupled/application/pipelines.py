@@ -0,0 +1,423 @@
+"""Ingestion pipelines module."""
+import logging
+from dataclasses import replace
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from uuid import UUID
+
+from ..domain.events import DomainEvent
+from ..domain.events.workspaces import (
+    CategoryAdded,
+    DocumentsAdded,
+    DocumentsRemoved,
+    DocumentsReplaced,
+)
+from ..domain.models.workspaces import (
+    Category,
+    CategoryCollection,
+    CategoryId,
+    CategoryName,
+    Document,
+    DocumentCollection,
+    DocumentId,
+    DocumentText,
+    Workspace,
+    WorkspaceId,
+    WorkspaceName,
+    WorkspaceOwnerId,
+)
+from .dtos import (
+    CategoryDTO,
+    DocumentDTO,
+    FileRow,
+    IngestionReport,
+    WorkspaceDTO,
+)
+from .exceptions import FileValidationError
+from .fingerprints import SheetFingerprint
+from .identifiers import DocumentIdFactory
+from .interfaces import (
+    IBulkRepository,
+    IDomainSerializer,
+    IRepository,
+    IWorkspaceFinder,
+)
+from .merging import (
+    MERGE_MODE_MERGE,
+    MERGE_MODE_REPLACE,
+    DocumentMatcher,
+    check_merge_mode,
+)
+from .normalization import TextNormalizer
+from .validators import BatchValidator
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group the items of an iterable in lists of, at most, 'size' elements."""
+    iterator = iter(items)
+
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class WorkspaceIngestionPipeline:
+    """
+    WorkspaceIngestionPipeline class.
+
+    Moves the rows of a file into the database through a chain of generators
+    (reader -> validation -> domain mapping -> repository writes), so only one batch
+    of documents is held in memory at a time and the first batches are written while
+    the following rows are still being parsed.
+
+    Categories found in the file are merged into the existing categories with the
+    same name according to the merge mode, as the non-streaming upload does. A
+    pipeline instance keeps the state of a single ingestion, so a new one must be
+    built for every file.
+
+    The rows are written as DTOs, without loading the workspaces, so the pipeline
+    records the events of the changes itself: a CategoryAdded for every new
+    category, and a DocumentsAdded, DocumentsReplaced or DocumentsRemoved for every
+    batch written to, or deleted from, a category.
+    """
+
+    _owner: str
+    _batch_size: int
+    _workspace_repository: IRepository[WorkspaceDTO]
+    _bulk_repository: IBulkRepository[CategoryDTO, DocumentDTO]
+    _workspace_finder: IWorkspaceFinder[WorkspaceDTO]
+    _workspace_serializer: IDomainSerializer[Workspace, WorkspaceDTO]
+    _category_serializer: IDomainSerializer[Category, CategoryDTO]
+    _document_serializer: IDomainSerializer[Document, DocumentDTO]
+    _workspaces: Dict[str, Workspace]
+    _categories: Dict[Tuple[str, str], CategoryId]
+    _category_workspaces: Dict[CategoryId, WorkspaceId]
+    _replaced_categories: Set[CategoryId]
+    _events: List[DomainEvent]
+    _created_workspaces: List[str]
+    _updated_workspaces: List[str]
+    _sheet_fingerprints: Dict[str, SheetFingerprint]
+    _normalizer: Optional[TextNormalizer]
+    _merge_mode: str
+    _document_ids: DocumentIdFactory
+    _matchers: Dict[CategoryId, DocumentMatcher[str]]
+    _on_progress: Optional[Callable[[int, int], None]]
+    _seen_texts: Set[bytes]
+    _seen_sheet: Optional[str]
+    _rows: int
+    _duplicates_removed: int
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        owner: str,
+        batch_size: int,
+        workspace_repository: IRepository[WorkspaceDTO],
+        bulk_repository: IBulkRepository[CategoryDTO, DocumentDTO],
+        workspace_finder: IWorkspaceFinder[WorkspaceDTO],
+        workspace_serializer: IDomainSerializer[Workspace, WorkspaceDTO],
+        category_serializer: IDomainSerializer[Category, CategoryDTO],
+        document_serializer: IDomainSerializer[Document, DocumentDTO],
+        normalizer: Optional[TextNormalizer] = None,
+        merge_mode: str = MERGE_MODE_REPLACE,
+        document_ids: Optional[DocumentIdFactory] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """Class constructor."""
+        self._owner = owner
+        self._batch_size = batch_size
+        self._workspace_repository = workspace_repository
+        self._bulk_repository = bulk_repository
+        self._workspace_finder = workspace_finder
+        self._workspace_serializer = workspace_serializer
+        self._category_serializer = category_serializer
+        self._document_serializer = document_serializer
+        self._workspaces = {}
+        self._categories = {}
+        self._category_workspaces = {}
+        self._replaced_categories = set()
+        self._events = []
+        self._created_workspaces = []
+        self._updated_workspaces = []
+        self._sheet_fingerprints = {}
+        self._normalizer = normalizer
+        self._document_ids = document_ids or DocumentIdFactory()
+        self._merge_mode = check_merge_mode(merge_mode=merge_mode)
+
+        # Replacing a category with content-addressed IDs gives the same IDs to the
+        # texts already stored, so it is merged instead to write only the changes.
+        if self._merge_mode == MERGE_MODE_REPLACE and (
+            self._document_ids.is_content_addressed
+        ):
+            self._merge_mode = MERGE_MODE_MERGE
+
+        self._matchers = {}
+        self._on_progress = on_progress
+        self._seen_texts = set()
+        self._seen_sheet = None
+        self._rows = 0
+        self._duplicates_removed = 0
+
+    @property
+    def sheet_hashes(self) -> Dict[str, str]:
+        """Return the fingerprint of every sheet streamed so far."""
+        return {
+            name: fingerprint.hexdigest()
+            for name, fingerprint in self._sheet_fingerprints.items()
+        }
+
+    def pull_events(self) -> List[DomainEvent]:
+        """Return the events recorded since the last call, and forget them."""
+        events, self._events = self._events, []
+
+        return events
+
+    def run(self, rows: Iterable[FileRow]) -> IngestionReport:
+        """
+        Stream the rows into the database.
+
+        Every batch is validated as a whole before being written, and the first
+        batch with invalid values fails the whole file, so the rows after it are
+        neither read nor validated. The documents of the first batches are already
+        deleted or written by then, so the pipeline must run within a unit of work
+        that rolls them back.
+
+        The 'on_progress' callback, if any, receives the number of rows parsed and
+        documents written after every batch.
+
+        Args:
+            rows (Iterable[FileRow]): file rows, usually a file reader generator.
+
+        Returns
+            IngestionReport: IngestionReport instance.
+
+        Raises
+            FileValidationError: with the issues of the first invalid batch.
+        """
+        documents_written = 0
+
+        for batch in batched(self._track(rows), self._batch_size):
+            validation_report = BatchValidator.validate_rows(rows=batch)
+
+            if not validation_report.is_valid:
+                raise FileValidationError(report=validation_report)
+
+            domain_documents = list(self._to_domain(batch))
+            documents = [
+                self._document_serializer.serialize(domain_obj=document)
+                for document in domain_documents
+            ]
+            self._bulk_repository.save_documents(documents=documents)
+            self._record_documents_written(documents=domain_documents)
+            documents_written += len(documents)
+
+            logger.debug("%s documents written so far.", documents_written)
+
+            if self._on_progress is not None:
+                self._on_progress(self._rows, documents_written)
+
+        if self._merge_mode == MERGE_MODE_MERGE:
+            self._delete_unmatched_documents()
+
+        return IngestionReport(
+            rows=self._rows,
+            documents=documents_written,
+            workspaces_created=self._created_workspaces,
+            workspaces_updated=self._updated_workspaces,
+            duplicates_removed=self._duplicates_removed,
+        )
+
+    def _track(self, rows: Iterable[FileRow]) -> Iterator[FileRow]:
+        """Count, normalize, deduplicate and fingerprint the rows."""
+        for row in rows:
+            self._rows += 1
+
+            if self._normalizer is not None:
+                normalized_row = self._normalize(row=row)
+
+                if normalized_row is None:
+                    self._duplicates_removed += 1
+                    continue
+
+                row = normalized_row
+
+            self._sheet_fingerprints.setdefault(
+                row.workspace, SheetFingerprint()
+            ).update(category=row.category, text=row.text)
+
+            yield row
+
+    def _normalize(self, row: FileRow) -> Optional[FileRow]:
+        """
+        Return the row with its text normalized, or None if it is a duplicate.
+
+        The readers stream a sheet at a time, so the keys of the texts are only kept
+        for the sheet being streamed when they are scoped by category.
+        """
+        assert self._normalizer
+
+        if self._normalizer.is_sheet_scoped and row.workspace != self._seen_sheet:
+            self._seen_texts.clear()
+            self._seen_sheet = row.workspace
+
+        text = self._normalizer.normalize(text=row.text)
+        key = self._normalizer.dedup_key(
+            workspace=row.workspace, category=row.category, text=text
+        )
+
+        if key is not None:
+            if key in self._seen_texts:
+                return None
+
+            self._seen_texts.add(key)
+
+        return row if text == row.text else replace(row, text=text)
+
+    def _to_domain(self, rows: Iterable[FileRow]) -> Iterator[Document]:
+        """Map the rows to Domain documents, skipping the texts already stored."""
+        for row in rows:
+            category_id = self._get_category_id(
+                workspace_name=row.workspace, category_name=row.category
+            )
+            matcher = self._matchers.get(category_id)
+
+            if matcher is not None and matcher.match(text=row.text) is not None:
+                continue
+
+            yield Document(
+                id=DocumentId(
+                    value=self._document_ids.generate(
+                        workspace_id=str(self._workspaces[row.workspace].id.value),
+                        category_name=row.category,
+                        text=row.text,
+                    )
+                ),
+                text=DocumentText(value=row.text),
+                category_id=category_id,
+            )
+
+    def _record_documents_written(self, documents: List[Document]) -> None:
+        """
+        Record the documents written by a batch, grouped by category.
+
+        The first batch written to a replaced category replaces its documents, and
+        the following ones add to them.
+        """
+        ids_by_category: Dict[CategoryId, Dict[UUID, None]] = {}
+
+        for document in documents:
+            # Content-addressed IDs repeat with the texts, but are written once.
+            ids_by_category.setdefault(document.category, {})[document.id.value] = None
+
+        for category_id, ids in ids_by_category.items():
+            event_class = (
+                DocumentsReplaced
+                if category_id in self._replaced_categories
+                else DocumentsAdded
+            )
+            self._replaced_categories.discard(category_id)
+            self._events.append(
+                event_class(
+                    workspace_id=self._category_workspaces[category_id],
+                    category_id=category_id,
+                    document_ids=tuple(ids),
+                )
+            )
+
+    def _delete_unmatched_documents(self) -> None:
+        """Delete the stored documents whose text was not in the file."""
+        for category_id, matcher in self._matchers.items():
+            for ids in batched(matcher.unmatched(), self._batch_size):
+                self._bulk_repository.delete_documents_by_id(ids=ids)
+                self._events.append(
+                    DocumentsRemoved(
+                        workspace_id=self._category_workspaces[category_id],
+                        category_id=category_id,
+                        document_ids=tuple(UUID(id) for id in ids),
+                    )
+                )
+
+    def _get_category_id(self, workspace_name: str, category_name: str) -> CategoryId:
+        """Return the category ID, creating the category on its first appearance."""
+        key = (workspace_name, category_name)
+
+        if key in self._categories:
+            return self._categories[key]
+
+        workspace = self._get_workspace(name=workspace_name)
+
+        for category in workspace.categories.values():
+            if category.name.value == category_name:
+                if self._merge_mode == MERGE_MODE_REPLACE:
+                    self._bulk_repository.delete_documents(
+                        category_id=str(category.id.value)
+                    )
+                    self._replaced_categories.add(category.id)
+                else:
+                    self._matchers[category.id] = DocumentMatcher(
+                        stored=self._bulk_repository.iter_document_texts(
+                            category_id=str(category.id.value)
+                        )
+                    )
+                self._categories[key] = category.id
+                self._category_workspaces[category.id] = workspace.id
+
+                return category.id
+
+        category = Category(
+            id=CategoryId(value=self._workspace_repository.generate_uuid()),
+            name=CategoryName(value=category_name),
+            workspace_id=workspace.id,
+            documents=DocumentCollection(),
+        )
+        self._bulk_repository.save_categories(
+            categories=[self._category_serializer.serialize(domain_obj=category)]
+        )
+        self._categories[key] = category.id
+        self._category_workspaces[category.id] = workspace.id
+        self._events.append(
+            CategoryAdded(workspace_id=workspace.id, category_id=category.id)
+        )
+
+        return category.id
+
+    def _get_workspace(self, name: str) -> Workspace:
+        """Return the workspace, creating it on its first appearance."""
+        if name in self._workspaces:
+            return self._workspaces[name]
+
+        workspace_dto = self._workspace_finder.get_by_name_without_documents(
+            name=name, owner_id=self._owner
+        )
+
+        if workspace_dto is not None:
+            workspace = self._workspace_serializer.deserialize(dto=workspace_dto)
+            self._updated_workspaces.append(name)
+
+        else:
+            workspace = Workspace(
+                id=WorkspaceId(value=self._workspace_repository.generate_uuid()),
+                name=WorkspaceName(value=name),
+                categories=CategoryCollection(),
+                owner_id=WorkspaceOwnerId.from_string(value=self._owner),
+            )
+            self._workspace_repository.save(
+                workspace=self._workspace_serializer.serialize(domain_obj=workspace)
+            )
+            self._created_workspaces.append(name)
+
+        self._workspaces[name] = workspace
+
+        return workspace
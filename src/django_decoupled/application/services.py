@@ -1,6 +1,7 @@
 """Application services module."""
-import uuid
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+from uuid import UUID
 
 from ..domain.models.workspaces import (
     Category,
@@ -11,6 +12,8 @@ from ..domain.models.workspaces import (
     DocumentCollection,
     DocumentId,
     DocumentText,
+    LazyCategoryCollection,
+    LazyDocumentCollection,
     Workspace,
     WorkspaceId,
     WorkspaceMetrics,
@@ -22,11 +25,36 @@ from .dtos import (
     CategoryDTO,
     DocumentDTO,
     FileCategory,
-    FileDocument,
+    FileProcessingResult,
     FileWorkspace,
+    LazySequence,
     WorkspaceDTO,
 )
-from .interfaces import IDomainSerializer, IFileProcessor, IFinder
+from .identifiers import DocumentIdFactory, uuid7
+from .interfaces import (
+    IAggregateMapper,
+    ICollectionLoader,
+    IDomainSerializer,
+    IFileProcessor,
+)
+from .merging import MERGE_MODE_APPEND, MERGE_MODE_REPLACE, DocumentMatcher
+
+
+def _is_lazy(documents: Optional[Sequence[DocumentDTO]]) -> bool:
+    """Check if the documents of a DTO were not loaded, or not read yet."""
+    return documents is None or (
+        isinstance(documents, LazySequence) and not documents.is_loaded
+    )
+
+
+def _unique_rows(ids: Iterable[UUID], texts: Iterable[str]) -> Dict[UUID, str]:
+    """
+    Return the texts of the documents by ID.
+
+    Content-addressed IDs repeat with the texts of a category, so a repeated ID keeps
+    the position of its first row and the text of the last one, as in extend.
+    """
+    return dict(zip(ids, texts))
 
 
 class DocumentDomainSerializer(IDomainSerializer[Document, DocumentDTO]):
@@ -50,62 +78,172 @@ class DocumentDomainSerializer(IDomainSerializer[Document, DocumentDTO]):
 
 
 class CategoryDomainSerializer(IDomainSerializer[Category, CategoryDTO]):
-    """CategoryDomainSerializer class."""
+    """
+    CategoryDomainSerializer class.
+
+    Categories whose documents were not loaded get a lazy document collection, and
+    are serialized without documents while it has not been loaded.
+    """
 
     _document_serializer: IDomainSerializer[Document, DocumentDTO]
+    _loader: ICollectionLoader[CategoryDTO, DocumentDTO]
 
     def __init__(
-        self, document_serializer: IDomainSerializer[Document, DocumentDTO]
+        self,
+        document_serializer: IDomainSerializer[Document, DocumentDTO],
+        loader: ICollectionLoader[CategoryDTO, DocumentDTO],
     ) -> None:
         """Class constructor."""
         self._document_serializer = document_serializer
+        self._loader = loader
 
     def serialize(self, domain_obj: Category) -> CategoryDTO:
         """Serialize a Domain instance into a CategoryDTO."""
+        documents = domain_obj.documents
+
         return CategoryDTO(
             id=str(domain_obj.id.value),
             name=domain_obj.name.value,
             workspace_id=str(domain_obj.workspace.value),
-            documents=[
+            documents=None
+            if not documents.is_loaded
+            else [
                 self._document_serializer.serialize(domain_obj=domain_document)
-                for domain_document in domain_obj.documents.values()
+                for domain_document in documents.values()
             ],
         )
 
     def deserialize(self, dto: CategoryDTO) -> Category:
         """Deserialize a CategoryDTO instance into a Domain instance."""
-        return Category(
-            id=CategoryId.from_string(value=dto.id),
-            name=CategoryName(value=dto.name),
-            documents=DocumentCollection(
+        category_id = CategoryId.from_string(value=dto.id)
+        documents: DocumentCollection
+
+        if dto.documents is None or _is_lazy(documents=dto.documents):
+            documents = self._lazy_documents(
+                category_id=category_id, documents=dto.documents
+            )
+        else:
+            documents = DocumentCollection(
                 items=[
                     self._document_serializer.deserialize(dto=document)
                     for document in dto.documents
                 ]
+            )
+
+        return Category(
+            id=category_id,
+            name=CategoryName(value=dto.name),
+            documents=documents,
+            workspace_id=WorkspaceId.from_string(value=dto.workspace_id),
+        )
+
+    def _lazy_documents(
+        self,
+        category_id: CategoryId,
+        documents: Optional[Sequence[DocumentDTO]] = None,
+    ) -> LazyDocumentCollection:
+        """
+        Build a document collection loaded on first access.
+
+        The documents are read from the lazy sequence of the DTO, or from the
+        database if the DTO has none.
+        """
+        return LazyDocumentCollection(
+            category_id=category_id,
+            loader=lambda: (
+                (UUID(document.id), document.text)
+                for document in (
+                    self._loader.load_documents(category_id=str(category_id.value))
+                    if documents is None
+                    else documents
+                )
             ),
+        )
+
+
+class FlatCategoryDomainSerializer(CategoryDomainSerializer):
+    """
+    FlatCategoryDomainSerializer class.
+
+    Maps the documents of a category in a single loop over the columns of its
+    collection, instead of building and serializing a Document per row. Every
+    document is taken to belong to the category that holds it.
+    """
+
+    def serialize(self, domain_obj: Category) -> CategoryDTO:
+        """Serialize a Domain instance into a CategoryDTO."""
+        documents = domain_obj.documents
+        category_id = str(domain_obj.id.value)
+
+        return CategoryDTO(
+            id=category_id,
+            name=domain_obj.name.value,
+            workspace_id=str(domain_obj.workspace.value),
+            documents=None
+            if not documents.is_loaded
+            else [
+                DocumentDTO(id=str(document_id), text=text, category_id=category_id)
+                for document_id, text in documents.rows()
+            ],
+        )
+
+    def deserialize(self, dto: CategoryDTO) -> Category:
+        """Deserialize a CategoryDTO instance into a Domain instance."""
+        category_id = CategoryId.from_string(value=dto.id)
+        documents: DocumentCollection
+
+        if dto.documents is None or _is_lazy(documents=dto.documents):
+            documents = self._lazy_documents(
+                category_id=category_id, documents=dto.documents
+            )
+        else:
+            documents = DocumentCollection()
+            documents.extend(
+                ids=[UUID(document.id) for document in dto.documents],
+                texts=[document.text for document in dto.documents],
+                category_id=category_id,
+            )
+
+        return Category(
+            id=category_id,
+            name=CategoryName(value=dto.name),
+            documents=documents,
             workspace_id=WorkspaceId.from_string(value=dto.workspace_id),
         )
 
 
 class WorkspaceDomainSerializer(IDomainSerializer[Workspace, WorkspaceDTO]):
-    """WorkspaceDomainSerializer class."""
+    """
+    WorkspaceDomainSerializer class.
+
+    Workspaces whose categories were not loaded get a lazy category collection, and
+    are serialized without categories while it has not been loaded.
+    """
 
     _category_serializer: IDomainSerializer[Category, CategoryDTO]
+    _loader: ICollectionLoader[CategoryDTO, DocumentDTO]
 
     def __init__(
-        self, category_serializer: IDomainSerializer[Category, CategoryDTO]
+        self,
+        category_serializer: IDomainSerializer[Category, CategoryDTO],
+        loader: ICollectionLoader[CategoryDTO, DocumentDTO],
     ) -> None:
         """Class constructor."""
         self._category_serializer = category_serializer
+        self._loader = loader
 
     def serialize(self, domain_obj: Workspace) -> WorkspaceDTO:
         """Serialize a database object into a DomainWorkspace."""
+        categories = domain_obj.categories
+
         return WorkspaceDTO(
             id=str(domain_obj.id.value),
             name=domain_obj.name.value,
-            categories=[
+            categories=None
+            if not categories.is_loaded
+            else [
                 self._category_serializer.serialize(domain_obj=category)
-                for category in domain_obj.categories.values()
+                for category in categories.values()
             ],
             owner=str(domain_obj.owner.value),
             model_id=str(domain_obj.model_id.value)
@@ -119,7 +257,9 @@ class WorkspaceDomainSerializer(IDomainSerializer[Workspace, WorkspaceDTO]):
         return Workspace(
             id=WorkspaceId.from_string(dto.id),
             name=WorkspaceName(dto.name),
-            categories=CategoryCollection(
+            categories=self._lazy_categories(workspace_id=dto.id)
+            if dto.categories is None
+            else CategoryCollection(
                 items=[
                     self._category_serializer.deserialize(dto=category_dto)
                     for category_dto in dto.categories
@@ -132,160 +272,166 @@ class WorkspaceDomainSerializer(IDomainSerializer[Workspace, WorkspaceDTO]):
             metrics=WorkspaceMetrics(value=dto.metrics),
         )
 
+    def _lazy_categories(self, workspace_id: str) -> LazyCategoryCollection:
+        """Build a category collection loaded from the database on first access."""
+        return LazyCategoryCollection(
+            loader=lambda: [
+                self._category_serializer.deserialize(dto=category_dto)
+                for category_dto in self._loader.load_categories(
+                    workspace_id=workspace_id
+                )
+            ]
+        )
+
 
 class ExcelFileProcessor(IFileProcessor[Workspace, FileWorkspace, str]):
-    """ExcelFileProcessor class."""
+    """
+    ExcelFileProcessor class.
+
+    The processor is shared by every request, so it keeps no state: each call to
+    process returns its own immutable result.
+    """
 
-    _workspace_finder: IFinder[WorkspaceDTO]
-    _serializer: IDomainSerializer[Workspace, WorkspaceDTO]
-    _new_workspaces: Set[Workspace]
-    _existing_workspaces: Set[Workspace]
-    _data: Dict[str, Workspace]
+    _workspace_mapper: IAggregateMapper[Workspace]
+    _document_ids: DocumentIdFactory
 
     def __init__(
         self,
-        workspace_finder: IFinder[WorkspaceDTO],
-        serializer: IDomainSerializer[Workspace, WorkspaceDTO],
+        workspace_mapper: IAggregateMapper[Workspace],
+        document_ids: Optional[DocumentIdFactory] = None,
     ) -> None:
         """Class constructor."""
-        self._workspace_finder = workspace_finder
-        self._serializer = serializer
-        self._new_workspaces = set()
-        self._existing_workspaces = set()
-        self._data = {}
-
-    @property
-    def new_objs(self):
-        """Return new workspaces found within the Excel File."""
-        return self._new_workspaces
-
-    @property
-    def existing_objs(self):
-        """Return existing workspaces found within the Excel File."""
-        return self._existing_workspaces
-
-    def process(self, file_workspaces: Set[FileWorkspace], owner: str) -> None:
-        """Process File Workspaces."""
+        self._workspace_mapper = workspace_mapper
+        self._document_ids = document_ids or DocumentIdFactory()
+
+    def process(
+        self,
+        file_workspaces: Set[FileWorkspace],
+        owner: str,
+        merge_mode: str = MERGE_MODE_REPLACE,
+    ) -> FileProcessingResult[Workspace]:
+        """
+        Process File Workspaces.
+
+        In the append and merge modes the stored documents whose text is in the file
+        keep their IDs, and only the new texts are mapped to new documents.
+        """
+        new_workspaces = set()
+        existing_workspaces = set()
+
         for file_workspace in file_workspaces:
-            if self._workspace_finder.exists(name=file_workspace.name, owner_id=owner):
-                self._existing_workspaces.add(
+            # The documents are only loaded for the categories of the file that
+            # keep them, as the append and merge modes do.
+            workspace = self._workspace_mapper.get_by_name(
+                name=file_workspace.name, owner_id=owner
+            )
+
+            if workspace is not None:
+                existing_workspaces.add(
                     self._process_existing_workspace(
-                        file_workspace=file_workspace, owner_id=owner
+                        workspace=workspace,
+                        file_workspace=file_workspace,
+                        merge_mode=merge_mode,
                     )
                 )
                 continue
 
-            self._new_workspaces.add(
+            new_workspaces.add(
                 self._workspace_to_domain(
                     file_workspace=file_workspace,
                     owner=owner,
                 )
             )
 
-        tmp_new_data = {
-            workspace.name.value: workspace for workspace in self._new_workspaces
-        }
-        tmp_existing_data = {
-            workspace.name.value: workspace for workspace in self._existing_workspaces
-        }
-
-        self._data = {**tmp_new_data, **tmp_existing_data}
-
-    def get(self, name: str) -> Optional[Workspace]:
-        """Return a workspace by name."""
-        return self._data.get(name, None)
-
-    def _process_existing_workspace(
-        self, file_workspace: FileWorkspace, owner_id: str
-    ) -> Workspace:
-        """Build workspaces base on database existencies."""
-        workspace = self._serializer.deserialize(
-            dto=self._workspace_finder.get_by_name(
-                name=file_workspace.name, owner_id=owner_id
-            )
-        )
-
-        return Workspace(
-            id=workspace.id,
-            name=workspace.name,
-            owner_id=workspace.owner,
-            categories=CategoryCollection(
-                self._process_existing_categories(
-                    existing_categories=workspace.categories,
-                    file_categories=file_workspace.categories,
-                    workspace_id=str(workspace.id.value),
-                )
+        return FileProcessingResult(
+            new=frozenset(new_workspaces),
+            existing=frozenset(existing_workspaces),
+            by_name=MappingProxyType(
+                {
+                    workspace.name.value: workspace
+                    for workspace in new_workspaces | existing_workspaces
+                }
             ),
         )
 
-    def _process_existing_categories(
-        self,
-        existing_categories: CategoryCollection,
-        file_categories: List[FileCategory],
-        workspace_id: str,
-    ) -> List[Category]:
-        new_categories: Set[Category] = set()
-        categories_to_be_updated: Set[Category] = set()
-
-        existing_category_name_set = {
-            existing_category.name.value
-            for existing_category in existing_categories.values()
-        }
-
-        existing_category_name_map = {
-            existing_category.name.value: existing_category
-            for existing_category in existing_categories.values()
-        }
-
+    def _process_existing_workspace(
+        self, workspace: Workspace, file_workspace: FileWorkspace, merge_mode: str
+    ) -> Workspace:
+        """
+        Merge the categories of a file into a stored workspace.
+
+        The changes go through the workspace, so it records their events. The
+        categories that are not in the file keep their documents unloaded, and are
+        left as they are stored.
+        """
+        # The last category of the file with a name wins, as with the map it had.
         file_categories_name_map = {
-            file_category.name: file_category for file_category in file_categories
+            file_category.name: file_category
+            for file_category in file_workspace.categories
         }
-        file_categories_set = {file_category.name for file_category in file_categories}
-
-        new_category_names_in_file = file_categories_set - existing_category_name_set
-        existing_category_names_in_file = (
-            file_categories_set - new_category_names_in_file
-        )
 
-        new_file_categories = {
-            file_categories_name_map[new_category_name]
-            for new_category_name in new_category_names_in_file
-        }
-        existing_file_categories = {
-            file_categories_name_map[update_category_name]
-            for update_category_name in existing_category_names_in_file
-        }
+        for file_category in file_categories_name_map.values():
+            if not workspace.categories.has_name(name=file_category.name):
+                self._add_category(workspace=workspace, file_category=file_category)
+                continue
 
-        for new_file_category in new_file_categories:
-            new_categories.add(
-                self._category_to_domain(
-                    file_category=new_file_category, workspace_id=workspace_id
-                )
+            existing_category = workspace.categories.get_by_name(
+                name=file_category.name
+            )
+            documents = self._merge_documents(
+                existing_category=existing_category,
+                file_category=file_category,
+                merge_mode=merge_mode,
+            )
+            rows = _unique_rows(
+                ids=(document.id.value for document in documents),
+                texts=(document.text.value for document in documents),
+            )
+            workspace.replace_documents(
+                category_id=existing_category.id, ids=rows.keys(), texts=rows.values()
             )
 
-        for existing_file_category in existing_file_categories:
-            categories_to_be_updated.add(
-                Category(
-                    id=existing_category_name_map[existing_file_category.name].id,
-                    name=CategoryName(value=existing_file_category.name),
-                    workspace_id=WorkspaceId.from_string(value=workspace_id),
-                    documents=DocumentCollection(
-                        items=[
-                            self._document_to_domain(
-                                file_document=file_document,
-                                category_id=str(
-                                    existing_category_name_map[
-                                        existing_file_category.name
-                                    ].id.value
-                                ),
-                            )
-                            for file_document in existing_file_category.documents
-                        ]
-                    ),
+        return workspace
+
+    def _merge_documents(
+        self, existing_category: Category, file_category: FileCategory, merge_mode: str
+    ) -> List[Document]:
+        """Map the documents of a file category into an existing category."""
+        workspace_id = str(existing_category.workspace.value)
+        category_id = str(existing_category.id.value)
+
+        if merge_mode == MERGE_MODE_REPLACE:
+            return [
+                self._document_to_domain(
+                    text=text,
+                    workspace_id=workspace_id,
+                    category_id=category_id,
+                    category_name=file_category.name,
                 )
+                for text in file_category.texts
+            ]
+
+        matcher = DocumentMatcher(
+            stored=(
+                (document.text.value, document)
+                for document in existing_category.documents.values()
+            )
+        )
+        documents = [
+            matcher.match(text=text)
+            or self._document_to_domain(
+                text=text,
+                workspace_id=workspace_id,
+                category_id=category_id,
+                category_name=file_category.name,
             )
+            for text in file_category.texts
+        ]
+
+        if merge_mode == MERGE_MODE_APPEND:
+            documents.extend(matcher.unmatched())
 
-        return list(new_categories | categories_to_be_updated)
+        return documents
 
     def _workspace_to_domain(
         self,
@@ -293,48 +439,67 @@ class ExcelFileProcessor(IFileProcessor[Workspace, FileWorkspace, str]):
         owner: str,
     ) -> Workspace:
         """Map external file instances to Domain instances."""
-        workspace_id = WorkspaceId(value=uuid.uuid4())
-
-        return Workspace(
-            id=workspace_id,
+        workspace = Workspace(
+            id=WorkspaceId(value=uuid7()),
             name=WorkspaceName(value=file_workspace.name),
             owner_id=WorkspaceOwnerId.from_string(value=owner),
-            categories=CategoryCollection(
-                items=[
-                    self._category_to_domain(
-                        file_category=file_category,
-                        workspace_id=str(workspace_id.value),
-                    )
-                    for file_category in file_workspace.categories
-                ]
-            ),
+            categories=CategoryCollection(),
         )
 
-    def _category_to_domain(
-        self, file_category: FileCategory, workspace_id: str
-    ) -> Category:
-        """Map external file instances to Domain instances."""
-        category_id = CategoryId(value=uuid.uuid4())
-        return Category(
-            id=category_id,
-            name=CategoryName(value=file_category.name),
-            workspace_id=WorkspaceId.from_string(value=workspace_id),
-            documents=DocumentCollection(
-                items=[
-                    self._document_to_domain(
-                        file_document=file_document, category_id=str(category_id.value)
-                    )
-                    for file_document in file_category.documents
-                ]
+        for file_category in file_workspace.categories:
+            self._add_category(workspace=workspace, file_category=file_category)
+
+        return workspace
+
+    def _add_category(self, workspace: Workspace, file_category: FileCategory) -> None:
+        """Add a category of a file, with its documents, to a workspace."""
+        category_id = CategoryId(value=uuid7())
+        workspace_id = str(workspace.id.value)
+
+        workspace.add_categories(
+            categories=[
+                Category(
+                    id=category_id,
+                    name=CategoryName(value=file_category.name),
+                    workspace_id=workspace.id,
+                    documents=DocumentCollection(),
+                )
+            ]
+        )
+
+        rows = _unique_rows(
+            ids=(
+                self._document_ids.generate(
+                    workspace_id=workspace_id,
+                    category_name=file_category.name,
+                    text=text,
+                )
+                for text in file_category.texts
             ),
+            texts=file_category.texts,
         )
 
+        if rows:
+            workspace.add_documents(
+                category_id=category_id, ids=rows.keys(), texts=rows.values()
+            )
+
     def _document_to_domain(
-        self, file_document: FileDocument, category_id: str
+        self,
+        text: str,
+        workspace_id: str,
+        category_id: str,
+        category_name: str,
     ) -> Document:
         """Map external file instances to Domain instances."""
         return Document(
-            id=DocumentId(value=uuid.uuid4()),
-            text=DocumentText(value=file_document.text),
+            id=DocumentId(
+                value=self._document_ids.generate(
+                    workspace_id=workspace_id,
+                    category_name=category_name,
+                    text=text,
+                )
+            ),
+            text=DocumentText(value=text),
             category_id=CategoryId.from_string(value=category_id),
         )
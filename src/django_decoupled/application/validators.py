@@ -1,8 +1,20 @@
 """Validators module."""
-from typing import Any
+from typing import Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 from ..domain.models.workspaces import CategoryName, DocumentText, WorkspaceName
-from .interfaces import IValidator
+from .budgets import IngestionGuard
+from .dtos import (
+    FileRow,
+    IngestionBudget,
+    ValidationIssue,
+    ValidationReport,
+    WorkbookMetadata,
+)
+from .exceptions import FileValidationError, InvalidWorkbookError
+from .interfaces import IFileMetadataReader, IValidator
 
 
 class DocumentTextValidator(IValidator):
@@ -33,10 +45,203 @@ class WorksapceNameValidator(IValidator):
 
 
 class WorkspaceFileValidator(IValidator):
-    """WorkspaceFileValidator class."""
+    """
+    WorkspaceFileValidator class.
+
+    Validates an uploaded file from the metadata of the workbook, without parsing
+    its cells, so invalid or oversized files are rejected before being stored.
+    """
+
+    _metadata_reader: IFileMetadataReader[WorkbookMetadata]
+
+    def __init__(self, metadata_reader: IFileMetadataReader[WorkbookMetadata]) -> None:
+        """Class constructor."""
+        self._metadata_reader = metadata_reader
+
+    def validate(
+        self,
+        value: Any,
+        workspace_name: Optional[str] = None,
+        budget: Optional[IngestionBudget] = None,
+    ) -> None:
+        """
+        Validate an uploaded file.
+
+        Args:
+            value (Any): the uploaded file.
+            workspace_name (Optional[str]): name of the sheet that must be in the
+                file, if only that sheet is going to be read.
+            budget (Optional[IngestionBudget]): budget of the owner of the file.
+
+        Raises
+            InvalidWorkbookError: if the file is not a workbook or has no sheets.
+            FileValidationError: if the sheet of the workspace is not in the file.
+            IngestionBudgetExceededError: if the file is over the budget.
+        """
+        metadata = self._metadata_reader.read_metadata(bytes=value)
+
+        if not metadata.sheets:
+            raise InvalidWorkbookError(message="it has no sheets")
+
+        sheets = metadata.sheets
+
+        if workspace_name is not None:
+            sheet = metadata.get(name=workspace_name)
+
+            if sheet is None:
+                raise FileValidationError(
+                    report=ValidationReport(
+                        issues=[
+                            ValidationIssue(
+                                sheet=workspace_name,
+                                row=None,
+                                column="workspace",
+                                message="The sheet is not in the file",
+                            )
+                        ]
+                    )
+                )
+
+            sheets = [sheet]
+
+        if budget is not None:
+            guard = IngestionGuard(budget=budget)
+            guard.check_file_size(size=metadata.size)
+            guard.check_sheets(sheets=sheets)
+
+
+class BatchValidator:
+    """
+    BatchValidator class.
+
+    Validates whole columns of a file at once with vectorized operations, applying
+    the same rules as the domain value objects, and reports every invalid value
+    instead of stopping at the first one. Invalid sheet and category names are
+    reported once, at the first row where they appear.
+
+    The frames to validate have 'workspace', 'category', 'text' and 'row' columns,
+    where 'row' is the row number in the file.
+    """
+
+    COLUMNS = {
+        "workspace": WorkspaceName.MAX_LENGTH,
+        "category": CategoryName.MAX_LENGTH,
+        "text": DocumentText.MAX_LENGTH,
+    }
+
+    @classmethod
+    def validate_frame(cls, df: pd.DataFrame) -> ValidationReport:
+        """
+        Validate a frame with the rows of a file.
+
+        The values are checked with vectorized operations, and only the invalid
+        ones, if any, are visited one at a time to build the report.
+
+        Args:
+            df (pd.DataFrame): frame with the 'workspace', 'category', 'text' and
+                'row' columns.
+
+        Returns
+            ValidationReport: report with every invalid value of the frame.
+        """
+        sheets = df["workspace"].to_numpy(dtype=object)
+        rows = df["row"].to_numpy()
+        issues: List[ValidationIssue] = []
+
+        for column, max_length in cls.COLUMNS.items():
+            values = df[column].to_numpy(dtype=object)
+
+            if column == "text":
+                invalid = cls._find_invalid(values=values, max_length=max_length)
+            else:
+                invalid = cls._find_invalid_names(
+                    values=values, sheets=sheets, max_length=max_length
+                )
+
+            issues.extend(
+                ValidationIssue(
+                    sheet=str(sheets[index]),
+                    row=None if column == "workspace" else int(rows[index]),
+                    column=column,
+                    message=message,
+                )
+                for index, message in invalid
+            )
+
+        issues.sort(key=lambda issue: (issue.sheet, issue.row or 0))
+
+        return ValidationReport(issues=issues)
+
+    @classmethod
+    def validate_rows(cls, rows: Iterable[FileRow]) -> ValidationReport:
+        """Validate a batch of file rows."""
+        rows = list(rows)
+
+        return cls.validate_frame(
+            df=pd.DataFrame(
+                {
+                    "workspace": [row.workspace for row in rows],
+                    "category": [row.category for row in rows],
+                    "text": [row.text for row in rows],
+                    "row": [row.row for row in rows],
+                },
+                dtype=object,
+            )
+        )
+
+    @classmethod
+    def _find_invalid_names(
+        cls, values: np.ndarray, sheets: np.ndarray, max_length: int
+    ) -> List[Tuple[int, str]]:
+        """
+        Return the index and the issue of the first row of every invalid name.
+
+        Names repeat across many rows, so only the distinct ones are validated.
+        """
+        names = pd.unique(values)
+        invalid: List[Tuple[int, str]] = []
+
+        for name_index, message in cls._find_invalid(
+            values=names, max_length=max_length
+        ):
+            name = names[name_index]
+            indexes = np.flatnonzero(
+                pd.isna(values) if pd.isna(name) else values == name
+            )
+            _, first_indexes = np.unique(sheets[indexes], return_index=True)
+
+            invalid.extend((int(indexes[first]), message) for first in first_indexes)
+
+        return invalid
 
     @staticmethod
-    def validate(value: Any) -> None:
-        """Validate the name of a file dataset."""
-        ### Performs validations related to the excel file
-        print(f"Uploaded file: {value._name}")
+    def _find_invalid(values: np.ndarray, max_length: int) -> List[Tuple[int, str]]:
+        """Return the index and the issue of the empty, non-text and too long values."""
+        series = pd.Series(values, dtype=object)
+        missing = series.isna().to_numpy()
+
+        try:
+            lengths = series.str.len().to_numpy(dtype=float)
+            blank = series.str.isspace().to_numpy(dtype=object) == True  # noqa: E712
+        except AttributeError:  # None of the values is a string
+            lengths = np.full(len(values), np.nan)
+            blank = np.zeros(len(values), dtype=bool)
+
+        empty = missing | blank | (lengths == 0)
+        non_text = np.isnan(lengths) & ~empty
+        too_long = lengths > max_length
+
+        if not (empty | non_text | too_long).any():
+            return []
+
+        return sorted(
+            [(int(index), "Empty value") for index in np.flatnonzero(empty)]
+            + [
+                (int(index), "The value is not a text")
+                for index in np.flatnonzero(non_text)
+            ]
+            + [
+                (int(index), f"Longer than {max_length} characters")
+                for index in np.flatnonzero(too_long)
+            ]
+        )
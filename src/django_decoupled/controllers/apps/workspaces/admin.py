@@ -6,6 +6,12 @@ from django.db.models import QuerySet
 from django.http import HttpRequest
 
 from ....dependency_injection.containers import container
+from ....infrastructure.persistence.ingestion.models import (
+    ChunkedUpload,
+    IngestionBudget,
+    IngestionJob,
+    IngestionLog,
+)
 from ....infrastructure.persistence.workspaces.models import (
     Category,
     Document,
@@ -16,7 +22,7 @@ from .forms import CategoryForm, DocumentForm, WorkspaceForm
 if TYPE_CHECKING:
     from ....dependency_injection.dispatcher import Dispatcher
 
-from ....application.commands import TrainWorkspaceCommand
+from ....application.commands import RetryIngestionJobCommand, TrainWorkspaceCommand
 
 
 class DocumentAdmin(admin.ModelAdmin):
@@ -83,6 +89,89 @@ class WorkspaceAdmin(admin.ModelAdmin):
             dispatcher.dispatch(command=train_workspace_command)
 
 
+class IngestionLogAdmin(admin.ModelAdmin):
+    """IngestionLogAdmin class."""
+
+    list_display = ("workspace", "file_hash", "sheet_count", "updated_at")
+    readonly_fields = ("workspace", "sheet_hash", "file_hash", "sheet_count")
+
+    def get_queryset(self, request):
+        """Filter the admin query set by User."""
+        qs = super().get_queryset(request)
+        if request.user.is_superuser:
+            return qs
+        return qs.filter(workspace__owner=request.user)
+
+
+class IngestionJobAdmin(admin.ModelAdmin):
+    """IngestionJobAdmin class."""
+
+    list_display = ("id", "owner", "status", "rows_written", "created_at")
+    list_filter = ("status",)
+    readonly_fields = ("rows_parsed", "rows_written", "result", "error")
+    actions = ["retry_ingestion_jobs"]
+
+    def get_queryset(self, request):
+        """Filter the admin query set by User."""
+        qs = super().get_queryset(request)
+        if request.user.is_superuser:
+            return qs
+        return qs.filter(owner=request.user)
+
+    @admin.action(description="Retry selected failed Ingestion jobs")
+    def retry_ingestion_jobs(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet,
+        dispatcher: "Dispatcher" = container.dispatcher,
+    ) -> None:
+        """
+        Queue the selected failed jobs again.
+
+        Args:
+            request (HttpRequest): Django HttpRequest
+            queryset (Queryset): selected ingestion jobs queryset
+            dispatcher (Dispatcher, optional): command dispatcher. Defaults to container.dispatcher().
+        """
+        retried = sum(
+            dispatcher.dispatch(command=RetryIngestionJobCommand(job_id=str(job.id)))
+            for job in queryset
+        )
+
+        self.message_user(request, f"{retried} ingestion jobs queued again.")
+
+
+class ChunkedUploadAdmin(admin.ModelAdmin):
+    """ChunkedUploadAdmin class."""
+
+    list_display = ("id", "owner", "filename", "size", "status", "created_at")
+    list_filter = ("status",)
+    readonly_fields = ("file_path", "size", "job")
+
+    def get_queryset(self, request):
+        """Filter the admin query set by User."""
+        qs = super().get_queryset(request)
+        if request.user.is_superuser:
+            return qs
+        return qs.filter(owner=request.user)
+
+
+class IngestionBudgetAdmin(admin.ModelAdmin):
+    """IngestionBudgetAdmin class."""
+
+    list_display = (
+        "owner",
+        "max_file_size",
+        "max_rows",
+        "max_sheets",
+        "max_categories",
+    )
+
+
 admin.site.register(Document, DocumentAdmin)
 admin.site.register(Category, CategoryAdmin)
 admin.site.register(Workspace, WorkspaceAdmin)
+admin.site.register(IngestionLog, IngestionLogAdmin)
+admin.site.register(IngestionJob, IngestionJobAdmin)
+admin.site.register(ChunkedUpload, ChunkedUploadAdmin)
+admin.site.register(IngestionBudget, IngestionBudgetAdmin)
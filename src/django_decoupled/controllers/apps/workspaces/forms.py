@@ -1,14 +1,18 @@
 """Workspaces forms module."""
-from typing import Any
+from typing import Any, Dict
 
 from django import forms
 
+from ....application.dtos import IngestionBudget
+from ....application.exceptions import DataError
+from ....application.interfaces import IIngestionBudgetFinder
 from ....application.validators import (
     CategoryNameValidator,
     DocumentTextValidator,
     WorksapceNameValidator,
     WorkspaceFileValidator,
 )
+from ....dependency_injection.containers import container
 from ....infrastructure.persistence.workspaces.models import (
     Category,
     Document,
@@ -62,8 +66,46 @@ class WorkspaceForm(forms.ModelForm):
 
 
 class WorkspaceWithFileUploadForm(WorkspaceForm):
-    """WorkspaceWithFileUploadForm class."""
-
-    dataset = forms.FileField(
-        validators=[WorkspaceFileValidator.validate], required=True
-    )
+    """
+    WorkspaceWithFileUploadForm class.
+
+    The dataset is validated from the metadata of the workbook, so files without
+    the sheet of the workspace or over the budget of the owner are rejected before
+    any cell is parsed.
+    """
+
+    dataset = forms.FileField(required=True)
+
+    def __init__(
+        self,
+        *args: Any,
+        file_validator: WorkspaceFileValidator = container.workspace_file_validator,
+        budget_finder: IIngestionBudgetFinder[
+            IngestionBudget
+        ] = container.ingestion_budget_finder,
+        **kwargs: Any,
+    ) -> None:
+        """Init method."""
+        super().__init__(*args, **kwargs)
+        self._file_validator = file_validator
+        self._budget_finder = budget_finder
+
+    def clean(self) -> Dict[str, Any]:
+        """Validate the dataset against the workspace name and the owner budget."""
+        cleaned_data = super().clean()
+        dataset = cleaned_data.get("dataset")
+        owner = cleaned_data.get("owner")
+
+        if dataset is None or owner is None:
+            return cleaned_data
+
+        try:
+            self._file_validator.validate(
+                value=dataset,
+                workspace_name=cleaned_data.get("name"),
+                budget=self._budget_finder.get(owner_id=str(owner.id)),
+            )
+        except DataError as error:
+            self.add_error("dataset", forms.ValidationError(str(error)))
+
+        return cleaned_data
@@ -0,0 +1,49 @@
+"""Clean up ingestion jobs management command module."""
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from ......application.commands import (
+    CleanUpIngestionJobsCommand,
+    ExpireChunkedUploadsCommand,
+)
+from ......dependency_injection.containers import container
+
+
+class Command(BaseCommand):
+    """Clean up of the files kept by the failed jobs and the abandoned uploads."""
+
+    help = (
+        "Abandon the ingestion jobs failed for longer than the retention, deleting "
+        "the files kept to retry them, and the chunked uploads expired."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=settings.INGESTION_JOBS_RETENTION,
+            help="Seconds a failed job is kept before it is abandoned.",
+        )
+        parser.add_argument(
+            "--uploads-older-than",
+            type=int,
+            default=settings.INGESTION_UPLOADS_EXPIRY,
+            help="Seconds a chunked upload is kept without chunks before it expires.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Abandon the failed jobs, expire the uploads and print how many were."""
+        abandoned = container.dispatcher.dispatch(
+            command=CleanUpIngestionJobsCommand(older_than=options["older_than"])
+        )
+        expired = container.dispatcher.dispatch(
+            command=ExpireChunkedUploadsCommand(
+                older_than=options["uploads_older_than"]
+            )
+        )
+
+        self.stdout.write(f"{abandoned} failed ingestion jobs abandoned.")
+        self.stdout.write(f"{expired} chunked uploads expired.")
@@ -0,0 +1,92 @@
+"""Import corpus management command module."""
+import os
+from typing import Any, List
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from ......application.commands import ImportCorpusCommand
+from ......application.dtos import CorpusFileReport
+from ......application.merging import MERGE_MODES
+from ......dependency_injection.containers import container
+from .....services.file_readers import CORPUS_FILE_READERS
+
+
+class Command(BaseCommand):
+    """Bulk import of a directory of files."""
+
+    help = (
+        "Import every xlsx, csv and jsonl file of a directory into the workspaces of "
+        "an owner, parsing the files in parallel."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument("directory", help="Directory with the files to import.")
+        parser.add_argument(
+            "--owner", required=True, help="Email of the owner of the workspaces."
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of processes parsing the files.",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=MERGE_MODES,
+            default=settings.INGESTION_MERGE_MODE,
+            help="How the files are merged into the existing categories.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Import the files and print a summary."""
+        owner = get_user_model().objects.filter(email=options["owner"]).first()
+        if owner is None:
+            raise CommandError(f"The owner '{options['owner']}' does not exist.")
+
+        paths = self._find_files(directory=options["directory"])
+        if not paths:
+            raise CommandError(f"No files to import in '{options['directory']}'.")
+
+        self.stdout.write(f"Importing {len(paths)} files...")
+
+        report = container.dispatcher.dispatch(
+            command=ImportCorpusCommand(
+                paths=paths,
+                owner=str(owner.id),
+                workers=options["workers"],
+                merge_mode=options["mode"],
+                on_file=self._write_file_report,
+            )
+        )
+
+        self.stdout.write(
+            f"{len(report.files) - len(report.failed)} files imported, "
+            f"{len(report.failed)} failed: {report.rows} rows and "
+            f"{report.documents} documents in {report.seconds:.1f}s "
+            f"({report.rows_per_second:.0f} rows/s)."
+        )
+        for file_report in report.failed:
+            self.stderr.write(f"Failed '{file_report.path}': {file_report.error}")
+
+    @staticmethod
+    def _find_files(directory: str) -> List[str]:
+        """Return the supported files of a directory and its subdirectories."""
+        if not os.path.isdir(directory):
+            raise CommandError(f"'{directory}' is not a directory.")
+
+        return sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(directory)
+            for name in names
+            if os.path.splitext(name)[1].lower() in CORPUS_FILE_READERS
+        )
+
+    def _write_file_report(self, file_report: CorpusFileReport) -> None:
+        """Print the result of every file as soon as it is imported."""
+        if file_report.error is None:
+            self.stdout.write(f"  {file_report.path}: {file_report.rows} rows")
+        else:
+            self.stdout.write(f"  {file_report.path}: FAILED")
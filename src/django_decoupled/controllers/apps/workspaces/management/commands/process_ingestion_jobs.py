@@ -0,0 +1,45 @@
+"""Process ingestion jobs management command module."""
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from ......application.commands import ProcessNextIngestionJobCommand
+from ......dependency_injection.containers import container
+
+
+class Command(BaseCommand):
+    """Ingestion jobs worker."""
+
+    help = "Process the pending ingestion jobs, polling the queue for new ones."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once there are no pending jobs instead of polling the queue.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=int,
+            default=settings.INGESTION_JOBS_POLL_INTERVAL,
+            help="Seconds to wait before polling an empty queue again.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Process the jobs until the queue is empty or forever."""
+        dispatcher = container.dispatcher
+
+        while True:
+            job_id = dispatcher.dispatch(command=ProcessNextIngestionJobCommand())
+
+            if job_id is not None:
+                self.stdout.write(f"Ingestion job '{job_id}' processed.")
+                continue
+
+            if options["once"]:
+                return
+
+            time.sleep(options["sleep"])
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:07
+"""Migrations for the workspaces app."""
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("workspaces", "0006_alter_document_text"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IngestionLog",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "sheet_hash",
+                    models.CharField(max_length=64, verbose_name="sheet hash"),
+                ),
+                (
+                    "file_hash",
+                    models.CharField(
+                        db_index=True, max_length=64, verbose_name="file hash"
+                    ),
+                ),
+                (
+                    "sheet_count",
+                    models.PositiveIntegerField(verbose_name="sheet count"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="updated at"),
+                ),
+                (
+                    "workspace",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ingestion_log",
+                        to="workspaces.workspace",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Ingestion log",
+                "verbose_name_plural": "ingestion logs",
+                "ordering": ["-updated_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:14
+"""Migrations for the workspaces app."""
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("workspaces", "0009_chunkedupload"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IngestionBudget",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "max_file_size",
+                    models.PositiveBigIntegerField(
+                        blank=True, null=True, verbose_name="max file size"
+                    ),
+                ),
+                (
+                    "max_rows",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="max rows"
+                    ),
+                ),
+                (
+                    "max_sheets",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="max sheets"
+                    ),
+                ),
+                (
+                    "max_categories",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="max categories"
+                    ),
+                ),
+                (
+                    "owner",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ingestion_budget",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Ingestion budget",
+                "verbose_name_plural": "ingestion budgets",
+            },
+        ),
+    ]
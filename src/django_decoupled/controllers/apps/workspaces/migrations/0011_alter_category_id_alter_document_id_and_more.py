@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:28
+"""Migrations for the workspaces app."""
+
+from django.db import migrations, models
+
+import django_decoupled.application.identifiers
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("workspaces", "0010_ingestionbudget"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="category",
+            name="id",
+            field=models.UUIDField(
+                default=django_decoupled.application.identifiers.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+                unique=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="document",
+            name="id",
+            field=models.UUIDField(
+                default=django_decoupled.application.identifiers.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+                unique=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="workspace",
+            name="id",
+            field=models.UUIDField(
+                default=django_decoupled.application.identifiers.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+                unique=True,
+            ),
+        ),
+    ]
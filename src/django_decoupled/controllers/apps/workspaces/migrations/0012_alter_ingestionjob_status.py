@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:35
+"""Migrations for the workspaces app."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("workspaces", "0011_alter_category_id_alter_document_id_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="ingestionjob",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("running", "Running"),
+                    ("succeeded", "Succeeded"),
+                    ("failed", "Failed"),
+                    ("abandoned", "Abandoned"),
+                ],
+                db_index=True,
+                default="pending",
+                max_length=16,
+                verbose_name="status",
+            ),
+        ),
+    ]
@@ -2,7 +2,11 @@
 from django.urls import path
 
 from .views import (
+    ChunkedUploadCompleteView,
+    ChunkedUploadDetailView,
+    ChunkedUploadView,
     FileUploadView,
+    IngestionJobDetailView,
     WorkspaceCreateView,
     WorkspaceDetailView,
     WorkspaceListView,
@@ -16,4 +20,16 @@ urlpatterns = [
     path("train/<uuid:pk>/", WorkspaceTrainView.as_view(), name="train"),
     path("detail/<uuid:pk>/", WorkspaceDetailView.as_view(), name="detail"),
     path("upload_file/", FileUploadView.as_view(), name="file-upload"),
+    path("upload_file/chunked/", ChunkedUploadView.as_view(), name="chunked-upload"),
+    path(
+        "upload_file/chunked/<uuid:pk>/",
+        ChunkedUploadDetailView.as_view(),
+        name="chunked-upload-detail",
+    ),
+    path(
+        "upload_file/chunked/<uuid:pk>/complete/",
+        ChunkedUploadCompleteView.as_view(),
+        name="chunked-upload-complete",
+    ),
+    path("jobs/<uuid:pk>/", IngestionJobDetailView.as_view(), name="job-detail"),
 ]
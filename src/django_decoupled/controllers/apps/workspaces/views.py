@@ -1,9 +1,12 @@
 """Workspaces views module."""
+from typing import Any, Dict
 
 from django import forms
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpRequest, HttpResponse
-from django.shortcuts import render
+from django.db.models import QuerySet
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
 from django.utils.decorators import method_decorator
 from django.views import View
@@ -11,17 +14,26 @@ from django.views.decorators.csrf import csrf_exempt, csrf_protect
 from django.views.generic import DetailView, FormView, TemplateView
 
 from ....application.commands import (
-    CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
-    CreateWorkspaceAndAddDataFromFileCommand,
+    AppendChunkCommand,
+    CompleteChunkedUploadCommand,
+    EnqueueIngestionJobCommand,
+    StartChunkedUploadCommand,
     TrainWorkspaceCommand,
     WorkspaceMetricsCommand,
 )
+from ....application.dtos import ChunkedUploadDTO, WorkspaceDTO
 from ....application.exceptions import (
-    WorkspaceAlreadyExistsError,
-    WorkspaceDoesNotExistsError,
+    ChunkedUploadConflictError,
+    ChunkedUploadDoesNotExistError,
+    FileValidationError,
+    IngestionBudgetExceededError,
+    InvalidChunkError,
+    InvalidWorkbookError,
 )
+from ....application.interfaces import IChunkedUploadRepository, IFileStorage, IFinder
 from ....dependency_injection.containers import container
 from ....dependency_injection.dispatcher import Dispatcher
+from ....infrastructure.persistence.ingestion.models import IngestionJob
 from ....infrastructure.persistence.workspaces.models import Workspace
 from .forms import WorkspaceWithFileUploadForm
 
@@ -39,15 +51,228 @@ class FileUploadView(LoginRequiredMixin, View):
         return render(request, self.template)
 
     @method_decorator(csrf_protect)
-    def post(self, request, dispatcher: Dispatcher = container.dispatcher):
-        """UploadFile POST view handler."""
-        create_workspace_command = CreateOrUpdateWorkspaceFromUploadExcelFileCommand(
-            file_bytes=request.FILES["file"], owner=str(request.user.id)
+    def post(
+        self,
+        request,
+        dispatcher: Dispatcher = container.dispatcher,
+        file_storage: IFileStorage = container.ingestion_file_storage,
+    ):
+        """
+        UploadFile POST view handler.
+
+        The file is ingested by a background worker, so the response is the status
+        of the enqueued job, which polls itself until the job is finished.
+        """
+        file_path = file_storage.save(file=request.FILES["file"])
+
+        job_id = dispatcher.dispatch(
+            command=EnqueueIngestionJobCommand(
+                file_path=file_path, owner=str(request.user.id)
+            )
+        )
+
+        job = IngestionJob.objects.get(id=job_id)
+
+        return render(request, "workspaces/job_status.html", {"job": job}, status=202)
+
+
+def chunked_upload_status(
+    upload: ChunkedUploadDTO, file_storage: IFileStorage
+) -> Dict[str, Any]:
+    """Return the status of a chunked upload as a JSON serializable dict."""
+    return {
+        "id": upload.id,
+        "filename": upload.filename,
+        "size": upload.size,
+        # The file is deleted once ingested, so completed uploads report their size.
+        "offset": (
+            file_storage.size(path=upload.file_path)
+            if upload.status == ChunkedUploadDTO.UPLOADING
+            else upload.size
+        ),
+        "status": upload.status,
+        "job_id": upload.job_id,
+    }
+
+
+def chunked_upload_error(error: Exception) -> HttpResponse:
+    """Return the response of an error of a chunked upload."""
+    if isinstance(error, ChunkedUploadDoesNotExistError):
+        raise Http404(str(error))
+
+    content: Dict[str, Any] = {"error": str(error)}
+
+    if isinstance(error, ChunkedUploadConflictError):
+        if error.offset is not None:
+            content["offset"] = error.offset
+
+        return JsonResponse(content, status=409)
+
+    if isinstance(error, IngestionBudgetExceededError):
+        return JsonResponse(content, status=413)
+
+    return JsonResponse(content, status=400)
+
+
+class ChunkedUploadView(LoginRequiredMixin, View):
+    """
+    ChunkedUploadView class.
+
+    Starts a resumable upload. The client declares the file name and size, and then
+    sends the file in chunks to the upload URL.
+    """
+
+    def post(
+        self,
+        request: HttpRequest,
+        dispatcher: Dispatcher = container.dispatcher,
+        file_storage: IFileStorage = container.ingestion_file_storage,
+    ) -> HttpResponse:
+        """ChunkedUpload POST view handler."""
+        filename = request.POST.get("filename", "")
+
+        try:
+            size = int(request.POST["size"])
+        except (KeyError, ValueError):
+            return JsonResponse({"error": "A valid 'size' is required."}, status=400)
+
+        if size <= 0:
+            return JsonResponse({"error": "A valid 'size' is required."}, status=400)
+
+        try:
+            upload = dispatcher.dispatch(
+                command=StartChunkedUploadCommand(
+                    owner=str(request.user.id), filename=filename, size=size
+                )
+            )
+        except IngestionBudgetExceededError as error:
+            return chunked_upload_error(error=error)
+
+        return JsonResponse(
+            chunked_upload_status(upload=upload, file_storage=file_storage),
+            status=201,
+            headers={
+                "Location": reverse_lazy(
+                    "workspaces:chunked-upload-detail", kwargs={"pk": upload.id}
+                )
+            },
+        )
+
+
+class ChunkedUploadDetailView(LoginRequiredMixin, View):
+    """
+    ChunkedUploadDetailView class.
+
+    GET returns the upload status, whose 'offset' is the number of bytes received.
+    PATCH appends the request body at the offset given in the 'Upload-Offset' header,
+    which must match the bytes already received, so a chunk is never written twice.
+    """
+
+    def get(
+        self,
+        request: HttpRequest,
+        pk: str,
+        upload_repository: IChunkedUploadRepository[
+            ChunkedUploadDTO
+        ] = container.chunked_upload_repository,
+        file_storage: IFileStorage = container.ingestion_file_storage,
+    ) -> HttpResponse:
+        """ChunkedUpload GET view handler."""
+        upload = upload_repository.get(id=str(pk), owner_id=str(request.user.id))
+
+        if upload is None:
+            raise Http404(f"The chunked upload '{pk}' does not exist.")
+
+        return JsonResponse(
+            chunked_upload_status(upload=upload, file_storage=file_storage)
+        )
+
+    def patch(
+        self,
+        request: HttpRequest,
+        pk: str,
+        dispatcher: Dispatcher = container.dispatcher,
+        file_storage: IFileStorage = container.ingestion_file_storage,
+    ) -> HttpResponse:
+        """ChunkedUpload PATCH view handler."""
+        try:
+            offset = int(request.headers["Upload-Offset"])
+            chunk_size = int(request.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return JsonResponse(
+                {
+                    "error": "The 'Upload-Offset' and 'Content-Length' headers are required."
+                },
+                status=400,
+            )
+
+        if chunk_size > settings.INGESTION_UPLOAD_MAX_CHUNK_SIZE:
+            return JsonResponse(
+                {"error": "The chunk is too big."},
+                status=413,
+            )
+
+        try:
+            upload = dispatcher.dispatch(
+                command=AppendChunkCommand(
+                    upload_id=str(pk),
+                    owner=str(request.user.id),
+                    offset=offset,
+                    chunk=request,
+                    chunk_size=chunk_size,
+                )
+            )
+        except (
+            ChunkedUploadDoesNotExistError,
+            ChunkedUploadConflictError,
+            InvalidChunkError,
+        ) as error:
+            return chunked_upload_error(error=error)
+
+        return JsonResponse(
+            chunked_upload_status(upload=upload, file_storage=file_storage)
         )
 
-        dispatcher.dispatch(command=create_workspace_command)
 
-        return HttpResponse("File successfuly uploaded.")
+class ChunkedUploadCompleteView(LoginRequiredMixin, View):
+    """
+    ChunkedUploadCompleteView class.
+
+    Enqueues the ingestion of a fully received upload, as a single request upload,
+    once the workbook passes the same precheck.
+    """
+
+    def post(
+        self,
+        request: HttpRequest,
+        pk: str,
+        dispatcher: Dispatcher = container.dispatcher,
+    ) -> HttpResponse:
+        """ChunkedUploadComplete POST view handler."""
+        try:
+            job_id = dispatcher.dispatch(
+                command=CompleteChunkedUploadCommand(
+                    upload_id=str(pk), owner=str(request.user.id)
+                )
+            )
+        except (
+            ChunkedUploadDoesNotExistError,
+            ChunkedUploadConflictError,
+            InvalidWorkbookError,
+            FileValidationError,
+            IngestionBudgetExceededError,
+        ) as error:
+            return chunked_upload_error(error=error)
+
+        return JsonResponse(
+            {
+                "job_id": job_id,
+                "status_url": reverse_lazy(
+                    "workspaces:job-detail", kwargs={"pk": job_id}
+                ),
+            },
+            status=202,
+        )
 
 
 class WorkspaceListView(LoginRequiredMixin, TemplateView):
@@ -61,7 +286,6 @@ class WorkspaceCreateView(LoginRequiredMixin, FormView):
 
     form_class = WorkspaceWithFileUploadForm
     template_name = "workspaces/create.html"
-    _created_workspace_id: str
 
     def post(self, request: HttpRequest) -> HttpResponse:
         """CreateWorkspace POST view handler."""
@@ -73,52 +297,40 @@ class WorkspaceCreateView(LoginRequiredMixin, FormView):
             return self.form_invalid(form)
 
     def form_valid(
-        self, form: forms.Form, dispatcher: Dispatcher = container.dispatcher
+        self,
+        form: forms.Form,
+        dispatcher: Dispatcher = container.dispatcher,
+        file_storage: IFileStorage = container.ingestion_file_storage,
+        workspace_finder: IFinder[WorkspaceDTO] = container.workspace_finder,
     ) -> HttpResponse:
-        """Form valid method."""
-        owner = form.cleaned_data["owner"]
+        """
+        Form valid method.
 
+        The name is checked before enqueueing the job, so a name already in use is
+        reported in the form instead of in a failed job.
+        """
+        owner = form.cleaned_data["owner"]
         workspace_name = form.cleaned_data["name"]
-        file_bytes = form.cleaned_data["dataset"]
-
-        try:
-            create_and_add_files_to_workspace_command = (
-                CreateWorkspaceAndAddDataFromFileCommand(
-                    file_bytes=file_bytes,
-                    owner_id=str(owner.id),
-                    workspace_name=workspace_name,
-                )
-            )
-
-            self._created_workspace_id: str = dispatcher.dispatch(
-                command=create_and_add_files_to_workspace_command
-            )
 
-        except WorkspaceAlreadyExistsError:
+        if workspace_finder.exists(name=workspace_name, owner_id=str(owner.id)):
             form.add_error(
                 field="name",
                 error=f"Ya existe un proyecto de nombre '{workspace_name}'.",
             )
             return self.form_invalid(form)
 
-        except WorkspaceDoesNotExistsError:
-            form.add_error(
-                field="name",
-                error=(
-                    "No se pudo procesar el domumento. Por favor revise que el nombre "
-                    "del proyecto coincida con el nombre de una de las hojas del domumento."
-                ),
-            )
-            return self.form_invalid(form)
+        file_path = file_storage.save(file=form.cleaned_data["dataset"])
 
-        return super().form_valid(form)
-
-    def get_success_url(self) -> str:
-        """Get success url method."""
-        return reverse_lazy(
-            "workspaces:train", kwargs={"pk": self._created_workspace_id}
+        job_id = dispatcher.dispatch(
+            command=EnqueueIngestionJobCommand(
+                file_path=file_path,
+                owner=str(owner.id),
+                workspace_name=workspace_name,
+            )
         )
 
+        return redirect("workspaces:job-detail", pk=job_id)
+
 
 class WorkspaceTrainView(LoginRequiredMixin, TemplateView):
     """WorkspaceTrainView class."""
@@ -156,6 +368,22 @@ class WorkspaceTrainView(LoginRequiredMixin, TemplateView):
         )
 
 
+class IngestionJobDetailView(LoginRequiredMixin, DetailView):
+    """
+    IngestionJobDetailView class.
+
+    Renders the job status fragment, which HTMX polls while the job is running.
+    """
+
+    model = IngestionJob
+    template_name = "workspaces/job_status.html"
+    context_object_name = "job"
+
+    def get_queryset(self) -> QuerySet:
+        """Filter the jobs by User."""
+        return super().get_queryset().filter(owner=self.request.user)
+
+
 class WorkspaceDetailView(LoginRequiredMixin, DetailView):
     """WorkspaceDetailView class."""
 
@@ -1,43 +1,513 @@
 """Services module."""
+import csv
+import io
+import json
+import os
+import posixpath
+import tempfile
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
 from io import BytesIO
-from typing import Set
+from itertools import islice, repeat
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from xml.etree import ElementTree
 
 import pandas as pd
 from openpyxl import load_workbook
+from openpyxl.utils.cell import range_boundaries
 
-from ...application.dtos import FileCategory, FileDocument, FileWorkspace
-from ...application.interfaces import IFileReader
+from ...application.dtos import (
+    CorpusFile,
+    FileCategory,
+    FileRow,
+    FileWorkspace,
+    SheetMetadata,
+    ValidationIssue,
+    ValidationReport,
+    WorkbookMetadata,
+)
+from ...application.exceptions import FileValidationError, InvalidWorkbookError
+from ...application.interfaces import (
+    ICorpusReader,
+    IFileMetadataReader,
+    IFileReader,
+    IFileRowReader,
+)
+from ...application.validators import BatchValidator
 
+SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+RELATIONSHIPS_NS = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+)
+PACKAGE_RELATIONSHIPS_NS = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}"
+)
 
-class ExcelFileReader(IFileReader[FileWorkspace]):
+
+def dataframe_to_workspace(workspace_name: str, df: pd.DataFrame) -> FileWorkspace:
+    """Map the dataframe of a single sheet into a FileWorkspace."""
+    categories = []
+
+    df = df.rename(
+        columns={
+            df.columns[0]: "category",
+            df.columns[1]: "text",
+        },
+    )
+    for category, documents_df in df.groupby(by="category"):
+        categories.append(
+            FileCategory(name=category, texts=documents_df["text"].tolist())
+        )
+
+    return FileWorkspace(name=workspace_name, categories=categories)
+
+
+def validate_dataframe(workspace_name: str, df: pd.DataFrame) -> ValidationReport:
+    """
+    Validate the dataframe of a single sheet.
+
+    Rows without category are skipped, as they are when mapping the dataframe, and
+    the first row of the sheet is the header, so the first data row is the row 2.
+    """
+    rows_df = pd.DataFrame(
+        {
+            "workspace": workspace_name,
+            "category": df.iloc[:, 0],
+            "text": df.iloc[:, 1],
+            "row": df.index + 2,
+        }
+    )
+
+    return BatchValidator.validate_frame(df=rows_df[rows_df["category"].notna()])
+
+
+def read_excel_sheet(
+    path: str, sheet_name: str
+) -> Tuple[FileWorkspace, ValidationReport]:
+    """
+    Read and validate a single sheet of an Excel file stored in disk.
+
+    This function runs inside the worker processes of the ParallelExcelFileReader,
+    so it must remain a module level function to be picklable.
+
+    Args:
+        path (str): path of the Excel file
+        sheet_name (str): name of the sheet to be read
+
+    Returns
+        Tuple[FileWorkspace, ValidationReport]: the sheet and its validation report.
+    """
+    df = pd.read_excel(path, engine="openpyxl", sheet_name=sheet_name)
+
+    return (
+        dataframe_to_workspace(workspace_name=sheet_name, df=df),
+        validate_dataframe(workspace_name=sheet_name, df=df),
+    )
+
+
+def collect_sheets(
+    sheets: Iterable[Tuple[FileWorkspace, ValidationReport]]
+) -> Set[FileWorkspace]:
+    """
+    Collect the sheets read from a file, once all of them are valid.
+
+    Raises
+        FileValidationError: with the issues of every sheet, if any.
+    """
+    workspaces = set()
+    report = ValidationReport()
+
+    for workspace, sheet_report in sheets:
+        workspaces.add(workspace)
+        report.merge(sheet_report)
+
+    if not report.is_valid:
+        raise FileValidationError(report=report)
+
+    return workspaces
+
+
+def read_sheet_dimension(sheet_xml: IO[bytes]) -> Optional[str]:
+    """
+    Read the dimension of a sheet, stopping before its cells.
+
+    The dimension element precedes the cells in the sheet XML, so only the first
+    bytes of the sheet part are decompressed and parsed.
+    """
+    for _, element in ElementTree.iterparse(sheet_xml, events=("start",)):
+        if element.tag == f"{SPREADSHEET_NS}dimension":
+            return element.get("ref")
+
+        if element.tag == f"{SPREADSHEET_NS}sheetData":
+            return None
+
+    return None
+
+
+def sheet_metadata(name: str, ref: Optional[str]) -> SheetMetadata:
+    """Build the metadata of a sheet from its dimension, such as 'A1:B51'."""
+    if not ref:
+        return SheetMetadata(name=name)
+
+    try:
+        min_col, min_row, max_col, max_row = range_boundaries(ref)
+    except ValueError:
+        return SheetMetadata(name=name)
+
+    return SheetMetadata(
+        name=name, rows=max_row - min_row, columns=max_col - min_col + 1
+    )
+
+
+def read_workbook_metadata(file: IO[bytes]) -> WorkbookMetadata:
+    """
+    Read the sheets of an xlsx file and their sizes without parsing any cell.
+
+    Only the workbook part, its relationships and the dimension of every sheet are
+    read from the zip archive.
+
+    Raises
+        InvalidWorkbookError: if the file is not an xlsx workbook.
+    """
+    file.seek(0, io.SEEK_END)
+    size = file.tell()
+    file.seek(0)
+
+    try:
+        with zipfile.ZipFile(file) as archive:
+            workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+            relationships = ElementTree.fromstring(
+                archive.read("xl/_rels/workbook.xml.rels")
+            )
+            targets = {
+                relationship.get("Id"): relationship.get("Target", "")
+                for relationship in relationships.iter(
+                    f"{PACKAGE_RELATIONSHIPS_NS}Relationship"
+                )
+            }
+
+            sheets = []
+            for sheet in workbook.iter(f"{SPREADSHEET_NS}sheet"):
+                target = targets[sheet.get(f"{RELATIONSHIPS_NS}id")]
+                path = (
+                    target.lstrip("/")
+                    if target.startswith("/")
+                    else posixpath.normpath(posixpath.join("xl", target))
+                )
+
+                with archive.open(path) as sheet_xml:
+                    dimension = read_sheet_dimension(sheet_xml=sheet_xml)
+
+                sheets.append(sheet_metadata(name=sheet.get("name", ""), ref=dimension))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as error:
+        raise InvalidWorkbookError(message=str(error)) from error
+    finally:
+        file.seek(0)
+
+    return WorkbookMetadata(size=size, sheets=sheets)
+
+
+class ExcelFileReader(
+    IFileReader[FileWorkspace],
+    IFileRowReader[FileRow],
+    IFileMetadataReader[WorkbookMetadata],
+):
     """ExcelFileReader class."""
 
     def read_from_bytes(self, bytes: bytes) -> Set[FileWorkspace]:
         """Read an  file form bytes."""
-        workspaces = set()
-        categories = []
+        return self.read_sheets(bytes=bytes, names=self.list_sheet_names(bytes=bytes))
+
+    def list_sheet_names(self, bytes: bytes) -> List[str]:
+        """Return the names of the sheets without loading their cells."""
+        return self.read_metadata(bytes=bytes).sheet_names
 
+    def read_metadata(self, bytes: bytes) -> WorkbookMetadata:
+        """Read the sheets of an Excel file and their sizes from its XML parts."""
+        return read_workbook_metadata(file=bytes)  # type: ignore
+
+    def read_sheets(self, bytes: bytes, names: List[str]) -> Set[FileWorkspace]:
+        """Read and validate only the given sheets of an Excel file."""
         bytes.seek(0)  # type: ignore
-        wb = load_workbook(filename=BytesIO(bytes.read()))  # type: ignore
-
-        for ws in wb:
-            workspace_name = ws.title
-            df = pd.read_excel(wb, engine="openpyxl", sheet_name=workspace_name)
-            df.rename(
-                columns={
-                    df.columns[0]: "category",
-                    df.columns[1]: "text",
-                },
-                inplace=True,
+        dfs = pd.read_excel(
+            BytesIO(bytes.read()), engine="openpyxl", sheet_name=names  # type: ignore
+        )
+
+        return collect_sheets(
+            sheets=(
+                (
+                    dataframe_to_workspace(workspace_name=name, df=df),
+                    validate_dataframe(workspace_name=name, df=df),
+                )
+                for name, df in dfs.items()
             )
-            for category, documents_df in df.groupby(by="category"):
-                documents = []
+        )
+
+    def iter_rows(self, bytes: bytes) -> Iterator[FileRow]:
+        """
+        Stream the rows of an Excel file without loading the whole workbook.
+
+        The first row of every sheet is the header, and rows without category are
+        skipped, as they are when reading the file into FileWorkspace instances.
+        """
+        bytes.seek(0)  # type: ignore
+        wb = load_workbook(filename=bytes, read_only=True, data_only=True)
+
+        try:
+            for ws in wb:
+                rows = ws.iter_rows(min_row=2, max_col=2, values_only=True)
+
+                for row_number, (category, text) in enumerate(rows, start=2):
+                    if category is None:
+                        continue
+
+                    yield FileRow(
+                        workspace=ws.title, category=category, text=text, row=row_number
+                    )
+        finally:
+            wb.close()
+
+
+class ParallelExcelFileReader(ExcelFileReader):
+    """
+    ParallelExcelFileReader class.
+
+    Distributes the sheets of a workbook across a pool of worker processes. Every
+    worker opens the file read-only by path and parses a single sheet.
+    """
+
+    _max_workers: Optional[int]
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """Class constructor."""
+        self._max_workers = max_workers
+
+    def read_sheets(self, bytes: bytes, names: List[str]) -> Set[FileWorkspace]:
+        """Read the given sheets of an Excel file parsing them in parallel."""
+        max_workers = min(len(names), self._max_workers or os.cpu_count() or 1)
+
+        if max_workers < 2:
+            return super().read_sheets(bytes=bytes, names=names)
+
+        with self._file_path(file=bytes) as path:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return collect_sheets(
+                    sheets=executor.map(read_excel_sheet, repeat(path), names)
+                )
+
+    @staticmethod
+    @contextmanager
+    def _file_path(file: Any) -> Iterator[str]:
+        """
+        Return a path in disk for the uploaded file.
+
+        Large uploads are already stored in a temporary file by Django, otherwise the
+        content is dumped into a temporary file that is removed afterwards.
+        """
+        if hasattr(file, "temporary_file_path"):
+            yield file.temporary_file_path()
+            return
+
+        file.seek(0)
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
+            tmp_file.write(file.read())
+
+        try:
+            yield tmp_file.name
+        finally:
+            os.remove(tmp_file.name)
+
+
+def file_workspace_name(file: Any) -> str:
+    """Return the workspace name of a single sheet file: its name without extension."""
+    return os.path.splitext(os.path.basename(getattr(file, "name", "") or ""))[0]
+
+
+class CsvFileReader(IFileRowReader[FileRow]):
+    """
+    CsvFileReader class.
+
+    Reads a CSV file as a single sheet named after the file, with the same layout as
+    an Excel sheet: a header row followed by category and text columns.
+    """
+
+    def iter_rows(self, bytes: bytes) -> Iterator[FileRow]:
+        """Stream the rows of a CSV file."""
+        workspace = file_workspace_name(file=bytes)
+
+        bytes.seek(0)  # type: ignore
+        text_file = io.TextIOWrapper(bytes, encoding="utf-8-sig", newline="")  # type: ignore
+
+        try:
+            rows = csv.reader(text_file)
+            next(rows, None)
+
+            for row_number, row in enumerate(rows, start=2):
+                category = row[0] if row else None
+                if not category:
+                    continue
+
+                yield FileRow(
+                    workspace=workspace,
+                    category=category,
+                    text=row[1] if len(row) > 1 else None,  # type: ignore
+                    row=row_number,
+                )
+        finally:
+            text_file.detach()
+
+
+class JsonLinesFileReader(IFileRowReader[FileRow]):
+    """
+    JsonLinesFileReader class.
+
+    Reads a JSON Lines file as a single sheet named after the file, where every line
+    is an object with 'category' and 'text' keys.
+    """
+
+    def iter_rows(self, bytes: bytes) -> Iterator[FileRow]:
+        """
+        Stream the rows of a JSON Lines file.
+
+        Raises
+            FileValidationError: on the first line that is not a JSON object.
+        """
+        workspace = file_workspace_name(file=bytes)
+
+        bytes.seek(0)  # type: ignore
+        text_file = io.TextIOWrapper(bytes, encoding="utf-8")  # type: ignore
+
+        try:
+            for row_number, line in enumerate(text_file, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    obj = json.loads(line)
+                    category, text = obj.get("category"), obj.get("text")
+                except (ValueError, AttributeError) as error:
+                    raise FileValidationError(
+                        report=ValidationReport(
+                            issues=[
+                                ValidationIssue(
+                                    sheet=workspace,
+                                    row=row_number,
+                                    column="row",
+                                    message="The line is not a JSON object",
+                                )
+                            ]
+                        )
+                    ) from error
+
+                if category is None:
+                    continue
+
+                yield FileRow(
+                    workspace=workspace, category=category, text=text, row=row_number
+                )
+        finally:
+            text_file.detach()
+
+
+CORPUS_FILE_READERS: Dict[str, Callable[[], IFileRowReader[FileRow]]] = {
+    ".xlsx": ExcelFileReader,
+    ".csv": CsvFileReader,
+    ".jsonl": JsonLinesFileReader,
+}
+
+
+def stream_corpus_file(path: str) -> CorpusFile:
+    """
+    Open a file of a corpus with the reader of its extension.
+
+    The rows are parsed as they are consumed, so the file is never held in memory.
+    Errors found while parsing them are raised to the consumer.
+    """
+    _, extension = os.path.splitext(path)
+    reader_class = CORPUS_FILE_READERS.get(extension.lower())
+
+    if reader_class is None:
+        return CorpusFile(path=path, error=f"Unsupported file type '{extension}'.")
+
+    return CorpusFile(path=path, rows=_iter_file_rows(path=path, reader=reader_class()))
+
+
+def _iter_file_rows(path: str, reader: IFileRowReader[FileRow]) -> Iterator[FileRow]:
+    """Stream the rows of a file, keeping it open until they are consumed."""
+    with open(path, "rb") as file:
+        yield from reader.iter_rows(bytes=file)  # type: ignore
+
+
+def read_corpus_file(path: str) -> CorpusFile:
+    """
+    Parse a file of a corpus into rows, with the reader of its extension.
+
+    This function runs inside the worker processes of the ParallelCorpusReader, so it
+    must remain a module level function to be picklable, and the rows must be parsed
+    before being sent back. Errors are returned instead of raised, as the exceptions
+    of the application are not picklable.
+    """
+    corpus_file = stream_corpus_file(path=path)
+
+    if corpus_file.error is not None:
+        return corpus_file
+
+    try:
+        rows = tuple(corpus_file.rows)
+    except Exception as error:  # pylint: disable=broad-except
+        return CorpusFile(path=path, error=str(error))
+
+    return CorpusFile(path=path, rows=rows)
+
+
+class ParallelCorpusReader(ICorpusReader[CorpusFile]):
+    """
+    ParallelCorpusReader class.
+
+    Parses the files of a corpus in a pool of worker processes. Only a few files per
+    worker are in flight at any time, so the rows parsed ahead of the writer are
+    bounded however big the corpus is. With a single worker the files are streamed
+    by the writer instead, one row at a time.
+    """
+
+    IN_FLIGHT_FILES_PER_WORKER = 2
+
+    def read_files(self, paths: List[str], workers: int) -> Iterator[CorpusFile]:
+        """Parse the files, yielding them in the order they are parsed."""
+        if workers < 2:
+            for path in paths:
+                yield stream_corpus_file(path=path)
+            return
+
+        pending_paths = iter(paths)
 
-                for _document in documents_df.itertuples(name="Document", index=False):
-                    documents.append(FileDocument(text=_document.text))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(read_corpus_file, path)
+                for path in islice(
+                    pending_paths, workers * self.IN_FLIGHT_FILES_PER_WORKER
+                )
+            }
 
-                categories.append(FileCategory(name=category, documents=documents))
+            while futures:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
 
-            workspaces.add(FileWorkspace(name=workspace_name, categories=categories))
+                for future in done:
+                    yield future.result()
 
-        return workspaces
+                futures.update(
+                    executor.submit(read_corpus_file, path)
+                    for path in islice(pending_paths, len(done))
+                )
@@ -0,0 +1,62 @@
+"""File storages module."""
+import os
+import shutil
+import uuid
+from typing import IO, Any
+
+from ...application.interfaces import IFileStorage
+
+
+class LocalFileStorage(IFileStorage):
+    """
+    LocalFileStorage class.
+
+    Keeps the uploaded files in a local directory until a worker ingests them, so
+    the directory must be shared between the web and the worker processes.
+    """
+
+    _directory: str
+
+    def __init__(self, directory: str) -> None:
+        """Class constructor."""
+        self._directory = directory
+
+    def save(self, file: Any) -> str:
+        """Store an uploaded file and return its path."""
+        path = self.create(name=getattr(file, "name", "") or "")
+
+        file.seek(0)
+        self.append(path=path, chunk=file)
+
+        return path
+
+    def create(self, name: str) -> str:
+        """Create an empty file, to be filled by chunks, and return its path."""
+        os.makedirs(self._directory, exist_ok=True)
+
+        _, extension = os.path.splitext(name)
+        path = os.path.join(self._directory, f"{uuid.uuid4()}{extension}")
+
+        open(path, "wb").close()  # pylint: disable=consider-using-with
+
+        return path
+
+    def append(self, path: str, chunk: IO[bytes]) -> int:
+        """Append a chunk to a stored file and return its new size."""
+        with open(path, "ab") as stored_file:
+            shutil.copyfileobj(chunk, stored_file)
+
+            return stored_file.tell()
+
+    def size(self, path: str) -> int:
+        """Return the size of a stored file."""
+        return os.path.getsize(path)
+
+    def open(self, path: str) -> IO[bytes]:
+        """Open a stored file for binary reading."""
+        return open(path, "rb")
+
+    def delete(self, path: str) -> None:
+        """Delete a stored file."""
+        if os.path.exists(path):
+            os.remove(path)
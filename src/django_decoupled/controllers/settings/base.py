@@ -11,8 +11,9 @@ https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 # pylint: disable=R0801
 import os
+import tempfile
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -95,7 +96,7 @@ WSGI_APPLICATION = "django_decoupled.controllers.config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
-DATABASES = {
+DATABASES: Dict[str, Dict[str, Any]] = {
     "default": {
         "ENGINE": "django.db.backends.postgresql_psycopg2",
         "NAME": os.environ["PG_NAME"],
@@ -106,6 +107,10 @@ DATABASES = {
     }
 }
 
+# The progress of the ingestion jobs is written through a connection of its own, so
+# it is committed while the job is still writing its documents.
+DATABASES["ingestion_jobs"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
+
 
 # https://docs.djangoproject.com/en/3.2/releases/3.2/#customizing-type-of-auto-created-primary-keys
 # Default primary key field type
@@ -182,5 +187,86 @@ FLUX_METRICS_ENDPOINT_METHOD = os.environ["FLUX_METRICS_ENDPOINT_METHOD"]
 # REQUESTOR
 REQUESTOR_AVAILABLE_HTTP_METHODS = os.environ["AVAILABLE_HTTP_METHODS"]
 
+# FILE READERS
+# Number of worker processes used to parse the sheets of an uploaded workbook.
+# A value of 1 parses the sheets sequentially within the request process.
+EXCEL_READER_WORKERS = int(os.environ.get("EXCEL_READER_WORKERS", 1))
+
+# INGESTION
+# Uploads bigger than INGESTION_STREAMING_MIN_FILE_SIZE (bytes) are streamed into the
+# database in batches of INGESTION_BATCH_SIZE documents instead of being fully loaded.
+INGESTION_BATCH_SIZE = int(os.environ.get("INGESTION_BATCH_SIZE", 1000))
+INGESTION_STREAMING_MIN_FILE_SIZE = int(
+    os.environ.get("INGESTION_STREAMING_MIN_FILE_SIZE", 5 * 1024 * 1024)
+)
+# Uploads are stored in INGESTION_JOBS_DIR until a 'process_ingestion_jobs' worker
+# ingests them, so the directory must be shared by the web and the worker processes.
+INGESTION_JOBS_DIR = os.environ.get(
+    "INGESTION_JOBS_DIR", os.path.join(tempfile.gettempdir(), "ingestion_jobs")
+)
+# Seconds an idle worker waits before polling the job queue again.
+INGESTION_JOBS_POLL_INTERVAL = int(os.environ.get("INGESTION_JOBS_POLL_INTERVAL", 2))
+# Seconds after which a running job without progress is taken as abandoned by a dead
+# worker, and is claimed again. The progress is written after every batch streamed or
+# workspace written, through the INGESTION_JOBS_DATABASE connection, which must not be
+# the one the documents are written through.
+INGESTION_JOBS_LEASE_TIMEOUT = int(
+    os.environ.get("INGESTION_JOBS_LEASE_TIMEOUT", 30 * 60)
+)
+INGESTION_JOBS_DATABASE = os.environ.get("INGESTION_JOBS_DATABASE", "ingestion_jobs")
+# The file of a failed job is kept, so the job can be retried from the admin, until the
+# 'clean_up_ingestion_jobs' command abandons the jobs failed for longer than
+# INGESTION_JOBS_RETENTION seconds.
+INGESTION_JOBS_RETENTION = int(
+    os.environ.get("INGESTION_JOBS_RETENTION", 7 * 24 * 60 * 60)
+)
+# Chunked uploads are appended to a file of INGESTION_JOBS_DIR, accepting chunks of
+# INGESTION_UPLOAD_MAX_CHUNK_SIZE bytes at most.
+INGESTION_UPLOAD_MAX_CHUNK_SIZE = int(
+    os.environ.get("INGESTION_UPLOAD_MAX_CHUNK_SIZE", 8 * 1024 * 1024)
+)
+# Chunked uploads without chunks for INGESTION_UPLOADS_EXPIRY seconds are deleted, with
+# their partial files, by the 'clean_up_ingestion_jobs' command.
+INGESTION_UPLOADS_EXPIRY = int(os.environ.get("INGESTION_UPLOADS_EXPIRY", 24 * 60 * 60))
+
+# TEXT NORMALIZATION
+# Uploaded texts are normalized (Unicode NFC, collapsed whitespace and, optionally,
+# casefolded) and their exact duplicates are dropped within the INGESTION_DEDUP_SCOPE:
+# "category", "workbook" or "none".
+INGESTION_NORMALIZE_CASEFOLD = (
+    os.environ.get("INGESTION_NORMALIZE_CASEFOLD", "False").lower() == "true"
+)
+INGESTION_DEDUP_SCOPE = os.environ.get("INGESTION_DEDUP_SCOPE", "category")
+
+# MERGE MODE
+# How the texts of a re-uploaded sheet are merged into its existing categories:
+# "replace" their documents, "append" the new texts, or "merge" them, keeping the
+# stored documents whose text is in the file and deleting the rest.
+INGESTION_MERGE_MODE = os.environ.get("INGESTION_MERGE_MODE", "replace")
+
+# DOCUMENT IDS
+# The IDs of the new documents are time-ordered UUIDs ("uuid7") or derived from the
+# workspace, category and text of the document ("content"), which makes repeated
+# ingestions idempotent.
+INGESTION_DOCUMENT_IDS = os.environ.get("INGESTION_DOCUMENT_IDS", "uuid7")
+
+# SERIALIZERS
+# The workspaces are mapped between the domain, the DTOs and the database with
+# "nested" serializers, one call per object, or with "flat" serializers, which map
+# the documents of a category in a single loop.
+SERIALIZERS_MODE = os.environ.get("SERIALIZERS_MODE", "nested")
+
+# INGESTION BUDGETS
+# Default limits of every upload, which can be overridden per owner in the admin.
+# Uploads over any of them are aborted as soon as the limit is exceeded.
+INGESTION_BUDGET_MAX_FILE_SIZE = int(
+    os.environ.get("INGESTION_BUDGET_MAX_FILE_SIZE", 250 * 1024 * 1024)
+)
+INGESTION_BUDGET_MAX_ROWS = int(os.environ.get("INGESTION_BUDGET_MAX_ROWS", 2_000_000))
+INGESTION_BUDGET_MAX_SHEETS = int(os.environ.get("INGESTION_BUDGET_MAX_SHEETS", 100))
+INGESTION_BUDGET_MAX_CATEGORIES = int(
+    os.environ.get("INGESTION_BUDGET_MAX_CATEGORIES", 10_000)
+)
+
 # Crispy forms
 CRISPY_TEMPLATE_PACK = "bootstrap4"
@@ -38,4 +38,8 @@ DATABASES = {
     }
 }
 
+# The progress of the ingestion jobs is written through a connection of its own, so
+# it is committed while the job is still writing its documents.
+DATABASES["ingestion_jobs"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
+
 STATIC_ROOT = BASE_DIR / "staticfiles"
@@ -27,3 +27,7 @@ DATABASES = {
         "NAME": "test_django_decoupled_database",
     }
 }
+
+# SQLite takes a single writer at a time, so the progress of the ingestion jobs is
+# written along with their documents.
+INGESTION_JOBS_DATABASE = "default"
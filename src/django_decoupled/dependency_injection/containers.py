@@ -5,6 +5,7 @@ from django_decoupled.application.services import (
     CategoryDomainSerializer,
     DocumentDomainSerializer,
     ExcelFileProcessor,
+    FlatCategoryDomainSerializer,
     WorkspaceDomainSerializer,
 )
 from django_decoupled.infrastructure.data_transformation.processors import (
@@ -18,27 +19,66 @@ from django_decoupled.infrastructure.requestor.executors import (
 from django.conf import settings
 
 from ..application.commands import (
+    AppendChunkCommand,
+    CleanUpIngestionJobsCommand,
+    CompleteChunkedUploadCommand,
     CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
     CreateWorkspaceAndAddDataFromFileCommand,
     CreateWorkspaceCommand,
+    EnqueueIngestionJobCommand,
+    ExpireChunkedUploadsCommand,
+    ImportCorpusCommand,
+    ProcessNextIngestionJobCommand,
+    RetryIngestionJobCommand,
+    StartChunkedUploadCommand,
+    StreamWorkspacesFromUploadExcelFileCommand,
     TrainWorkspaceCommand,
     WorkspaceMetricsCommand,
 )
+from ..application.dtos import IngestionBudget
 from ..application.handlers import (
+    AppendChunkCommandHandler,
+    CleanUpIngestionJobsCommandHandler,
+    CompleteChunkedUploadCommandHandler,
     CreateWorkspaceAndAddDataFromFileCommandHandler,
     CreateWorkspaceFromUploadExcelFileCommandHandler,
     CreateWorkspaceHandler,
+    EnqueueIngestionJobCommandHandler,
+    ExpireChunkedUploadsCommandHandler,
+    ImportCorpusCommandHandler,
+    ProcessNextIngestionJobCommandHandler,
+    RetryIngestionJobCommandHandler,
+    StartChunkedUploadCommandHandler,
+    StreamWorkspacesFromUploadExcelFileCommandHandler,
     TrainWorkspaceHandler,
     WorkspaceMetricsCommandHandler,
 )
-from ..controllers.services.file_readers import ExcelFileReader
+from ..application.identifiers import DocumentIdFactory
+from ..application.normalization import TextNormalizer
+from ..application.validators import WorkspaceFileValidator
+from ..controllers.services.file_readers import (
+    ExcelFileReader,
+    ParallelCorpusReader,
+    ParallelExcelFileReader,
+)
+from ..controllers.services.file_storages import LocalFileStorage
+from ..infrastructure.persistence.ingestion.finders import DjangoIngestionBudgetFinder
+from ..infrastructure.persistence.ingestion.repositories import (
+    DjangoChunkedUploadRepository,
+    DjangoIngestionJobRepository,
+    DjangoIngestionLog,
+)
+from ..infrastructure.persistence.transactions import DjangoUnitOfWork
 from ..infrastructure.persistence.workspaces.finders import DjangoWorkspaceFinder
+from ..infrastructure.persistence.workspaces.mappers import DjangoWorkspaceMapper
 from ..infrastructure.persistence.workspaces.repositories import (
     DjangoWorkspaceRepository,
 )
 from ..infrastructure.persistence.workspaces.serializers import (
     CategoryDBSerializer,
     DocumentDBSerializer,
+    FlatCategoryDBSerializer,
+    FlatWorkspaceDBSerializer,
     WorkspaceDBSerializer,
 )
 from .dispatcher import Command, Dispatcher, Handler
@@ -48,55 +88,192 @@ class Container:
     """Container class."""
 
     config = settings
+
+    # Created first, as the repositories publish the domain events through it. The
+    # command handlers are registered at the end.
+    dispatcher: Dispatcher = Dispatcher(handlers={})
+
+    flat_serializers = config.SERIALIZERS_MODE == "flat"
+
     document_db_serializer = DocumentDBSerializer()
 
-    category_db_serializer = CategoryDBSerializer(
-        document_serializer=document_db_serializer
-    )
-    workspace_db_serializer = WorkspaceDBSerializer(
-        category_serializer=category_db_serializer
-    )
+    category_db_serializer = (
+        FlatCategoryDBSerializer if flat_serializers else CategoryDBSerializer
+    )(document_serializer=document_db_serializer)
+    workspace_db_serializer = (
+        FlatWorkspaceDBSerializer if flat_serializers else WorkspaceDBSerializer
+    )(category_serializer=category_db_serializer)
 
     workspace_finder = DjangoWorkspaceFinder(
         workspace_serializer=workspace_db_serializer,
     )
 
+    document_id_factory = DocumentIdFactory(scheme=config.INGESTION_DOCUMENT_IDS)
+
     workspace_repository = DjangoWorkspaceRepository(
         workspace_finder=workspace_finder,
         workspace_serializer=workspace_db_serializer,
         category_serializer=category_db_serializer,
         document_serializer=document_db_serializer,
+        content_addressed_ids=document_id_factory.is_content_addressed,
+    )
+
+    workspace_mapper = DjangoWorkspaceMapper(
+        publisher=dispatcher,
+        content_addressed_ids=document_id_factory.is_content_addressed,
+    )
+
+    ingestion_log = DjangoIngestionLog()
+
+    unit_of_work = DjangoUnitOfWork()
+
+    ingestion_job_repository = DjangoIngestionJobRepository(
+        lease_timeout=config.INGESTION_JOBS_LEASE_TIMEOUT,
+        database=config.INGESTION_JOBS_DATABASE,
+    )
+
+    chunked_upload_repository = DjangoChunkedUploadRepository()
+
+    ingestion_budget_finder = DjangoIngestionBudgetFinder(
+        default_budget=IngestionBudget(
+            max_file_size=config.INGESTION_BUDGET_MAX_FILE_SIZE,
+            max_rows=config.INGESTION_BUDGET_MAX_ROWS,
+            max_sheets=config.INGESTION_BUDGET_MAX_SHEETS,
+            max_categories=config.INGESTION_BUDGET_MAX_CATEGORIES,
+        )
+    )
+
+    ingestion_file_storage = LocalFileStorage(directory=config.INGESTION_JOBS_DIR)
+
+    document_domain_serializer = DocumentDomainSerializer()
+
+    category_domain_serializer = (
+        FlatCategoryDomainSerializer if flat_serializers else CategoryDomainSerializer
+    )(
+        document_serializer=document_domain_serializer,
+        loader=workspace_finder,
     )
 
     workspace_domain_serializer = WorkspaceDomainSerializer(
-        category_serializer=CategoryDomainSerializer(
-            document_serializer=DocumentDomainSerializer(),
-        ),
+        category_serializer=category_domain_serializer,
+        loader=workspace_finder,
+    )
+
+    file_reader = (
+        ParallelExcelFileReader(max_workers=config.EXCEL_READER_WORKERS)
+        if config.EXCEL_READER_WORKERS > 1
+        else ExcelFileReader()
+    )
+
+    workspace_file_validator = WorkspaceFileValidator(metadata_reader=file_reader)
+
+    text_normalizer = TextNormalizer(
+        casefold=config.INGESTION_NORMALIZE_CASEFOLD,
+        dedup_scope=config.INGESTION_DEDUP_SCOPE,
     )
 
     file_processor = ExcelFileProcessor(
-        workspace_finder=workspace_finder, serializer=workspace_domain_serializer
+        workspace_mapper=workspace_mapper,
+        document_ids=document_id_factory,
     )
 
     create_or_update_workspace_from_upload_excel_file_handler = (
         CreateWorkspaceFromUploadExcelFileCommandHandler(
             workspace_finder=workspace_finder,
+            workspace_mapper=workspace_mapper,
+            file_reader=file_reader,
+            file_processor=file_processor,
+            ingestion_log=ingestion_log,
+            budget_finder=ingestion_budget_finder,
+            unit_of_work=unit_of_work,
+            normalizer=text_normalizer,
+            merge_mode=config.INGESTION_MERGE_MODE,
+        )
+    )
+
+    stream_workspaces_from_upload_excel_file_handler = (
+        StreamWorkspacesFromUploadExcelFileCommandHandler(
             workspace_repository=workspace_repository,
+            bulk_repository=workspace_repository,
+            workspace_finder=workspace_finder,
+            file_reader=file_reader,
             serializer=workspace_domain_serializer,
-            file_reader=ExcelFileReader(),
-            file_processor=file_processor,
+            category_serializer=category_domain_serializer,
+            document_serializer=document_domain_serializer,
+            ingestion_log=ingestion_log,
+            unit_of_work=unit_of_work,
+            publisher=dispatcher,
+            budget_finder=ingestion_budget_finder,
+            normalizer=text_normalizer,
+            batch_size=config.INGESTION_BATCH_SIZE,
+            merge_mode=config.INGESTION_MERGE_MODE,
+            document_ids=document_id_factory,
         )
     )
 
     create_workspace_and_add_data_from_excel_handler = (
         CreateWorkspaceAndAddDataFromFileCommandHandler(
-            workspace_repository=workspace_repository,
-            serializer=workspace_domain_serializer,
-            file_reader=ExcelFileReader(),
+            workspace_mapper=workspace_mapper,
+            file_reader=file_reader,
             file_processor=file_processor,
+            budget_finder=ingestion_budget_finder,
+            normalizer=text_normalizer,
         )
     )
 
+    import_corpus_handler = ImportCorpusCommandHandler(
+        corpus_reader=ParallelCorpusReader(),
+        stream_handler=stream_workspaces_from_upload_excel_file_handler,
+    )
+
+    enqueue_ingestion_job_handler = EnqueueIngestionJobCommandHandler(
+        job_repository=ingestion_job_repository,
+    )
+
+    process_next_ingestion_job_handler = ProcessNextIngestionJobCommandHandler(
+        job_repository=ingestion_job_repository,
+        file_storage=ingestion_file_storage,
+        upload_handler=create_or_update_workspace_from_upload_excel_file_handler,
+        stream_handler=stream_workspaces_from_upload_excel_file_handler,
+        create_workspace_handler=create_workspace_and_add_data_from_excel_handler,
+        streaming_min_file_size=config.INGESTION_STREAMING_MIN_FILE_SIZE,
+    )
+
+    retry_ingestion_job_handler = RetryIngestionJobCommandHandler(
+        job_repository=ingestion_job_repository,
+    )
+
+    clean_up_ingestion_jobs_handler = CleanUpIngestionJobsCommandHandler(
+        job_repository=ingestion_job_repository,
+        file_storage=ingestion_file_storage,
+    )
+
+    start_chunked_upload_handler = StartChunkedUploadCommandHandler(
+        upload_repository=chunked_upload_repository,
+        file_storage=ingestion_file_storage,
+        budget_finder=ingestion_budget_finder,
+    )
+
+    append_chunk_handler = AppendChunkCommandHandler(
+        upload_repository=chunked_upload_repository,
+        file_storage=ingestion_file_storage,
+        unit_of_work=unit_of_work,
+    )
+
+    complete_chunked_upload_handler = CompleteChunkedUploadCommandHandler(
+        upload_repository=chunked_upload_repository,
+        job_repository=ingestion_job_repository,
+        file_storage=ingestion_file_storage,
+        file_validator=workspace_file_validator,
+        budget_finder=ingestion_budget_finder,
+        unit_of_work=unit_of_work,
+    )
+
+    expire_chunked_uploads_handler = ExpireChunkedUploadsCommandHandler(
+        upload_repository=chunked_upload_repository,
+        file_storage=ingestion_file_storage,
+    )
+
     create_workspace_handler = CreateWorkspaceHandler(
         workspace_repository=workspace_repository,
         workspace_finder=workspace_finder,
@@ -112,20 +289,18 @@ class Container:
 
     train_workspace_handler = TrainWorkspaceHandler(
         data_processor=DataProcessorService(),
-        workspace_repository=workspace_repository,
+        workspace_mapper=workspace_mapper,
         workspace_finder=workspace_finder,
         requestor=requestor,
-        serializer=workspace_domain_serializer,
         flux_train_endpoint_url=settings.FLUX_TRAIN_ENDPOINT_URL,
         flux_train_endpoint_method=settings.FLUX_TRAIN_ENDPOINT_METHOD,
     )
 
     workspace_metrics_command_handler = WorkspaceMetricsCommandHandler(
         data_processor=DataProcessorService(),
-        workspace_repository=workspace_repository,
+        workspace_mapper=workspace_mapper,
         workspace_finder=workspace_finder,
         requestor=requestor,
-        serializer=workspace_domain_serializer,
         flux_metrics_endpoint_url=settings.FLUX_METRICS_ENDPOINT_URL,
         flux_metrics_endpoint_method=settings.FLUX_METRICS_ENDPOINT_METHOD,
     )
@@ -134,11 +309,21 @@ class Container:
         CreateWorkspaceCommand: create_workspace_handler,
         CreateWorkspaceAndAddDataFromFileCommand: create_workspace_and_add_data_from_excel_handler,
         CreateOrUpdateWorkspaceFromUploadExcelFileCommand: create_or_update_workspace_from_upload_excel_file_handler,  # noqa: E501
+        StreamWorkspacesFromUploadExcelFileCommand: stream_workspaces_from_upload_excel_file_handler,  # noqa: E501
+        ImportCorpusCommand: import_corpus_handler,
+        EnqueueIngestionJobCommand: enqueue_ingestion_job_handler,
+        ProcessNextIngestionJobCommand: process_next_ingestion_job_handler,
+        RetryIngestionJobCommand: retry_ingestion_job_handler,
+        CleanUpIngestionJobsCommand: clean_up_ingestion_jobs_handler,
+        StartChunkedUploadCommand: start_chunked_upload_handler,
+        AppendChunkCommand: append_chunk_handler,
+        CompleteChunkedUploadCommand: complete_chunked_upload_handler,
+        ExpireChunkedUploadsCommand: expire_chunked_uploads_handler,
         TrainWorkspaceCommand: train_workspace_handler,
         WorkspaceMetricsCommand: workspace_metrics_command_handler,
     }
 
-    dispatcher: Dispatcher = Dispatcher(handlers=handlers)
+    dispatcher.register(handlers=handlers)
 
 
 container = Container()
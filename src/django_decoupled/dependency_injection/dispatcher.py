@@ -3,9 +3,12 @@ from __future__ import annotations
 
 import logging
 from abc import abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, Generic, Type, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterable, List, Type, TypeVar
 
+from ..application.interfaces import IEventPublisher
+from ..domain.events import DomainEvent
 from .expections import NoSuchHandlerError
 
 logger = logging.getLogger(__name__)
@@ -13,6 +16,8 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", covariant=True)
 
+Subscriber = Callable[[DomainEvent], None]
+
 
 class Command(Generic[T]):  # pylint: disable=too-few-public-methods
     """Command class."""
@@ -35,14 +40,25 @@ class NullHandler(Handler):
 
 
 @dataclass
-class Dispatcher:
-    """Command dispatcher."""
+class Dispatcher(IEventPublisher):
+    """
+    Command dispatcher.
+
+    Also delivers the domain events published by the repositories to the
+    subscribers of their type, or of any of its base classes.
+    """
 
     _handlers: Dict[Type[Command], Handler]
+    _subscribers: Dict[Type[DomainEvent], List[Subscriber]]
 
     def __init__(self, handlers: Dict[Type[Command], Handler]) -> None:
         """Class constructor."""
         self._handlers = handlers
+        self._subscribers = defaultdict(list)
+
+    def register(self, handlers: Dict[Type[Command], Handler]) -> None:
+        """Register the handlers of more commands."""
+        self._handlers.update(handlers)
 
     def dispatch(self, command: Command) -> Any:
         """Dispatch the command to his handler."""
@@ -52,3 +68,24 @@ class Dispatcher:
             command_handler = NullHandler()
 
         return command_handler.handle(command)
+
+    def subscribe(self, event_type: Type[DomainEvent], subscriber: Subscriber) -> None:
+        """Call the subscriber with every published event of the type."""
+        self._subscribers[event_type].append(subscriber)
+
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        """
+        Deliver every event to its subscribers.
+
+        The events are published once their changes are committed, so a failing
+        subscriber is logged instead of failing the command that changed them.
+        """
+        for event in events:
+            for event_type in event.__class__.__mro__:
+                for subscriber in self._subscribers.get(event_type, ()):
+                    try:
+                        subscriber(event)
+                    except Exception:  # pylint: disable=broad-except
+                        logger.exception(
+                            "Subscriber '%s' failed handling '%s'.", subscriber, event
+                        )
@@ -0,0 +1,7 @@
+"""Domain events package."""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class DomainEvent:
+    """Base class for Domain Events."""
@@ -0,0 +1,85 @@
+"""Domain events module."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Tuple
+from uuid import UUID
+
+from . import DomainEvent
+
+if TYPE_CHECKING:
+    from ..models.workspaces import (
+        CategoryId,
+        DocumentId,
+        DocumentText,
+        WorkspaceId,
+        WorkspaceModelId,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryAdded(DomainEvent):
+    """A category has been added to a workspace."""
+
+    workspace_id: WorkspaceId
+    category_id: CategoryId
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentAdded(DomainEvent):
+    """A document has been added to a category of a workspace."""
+
+    workspace_id: WorkspaceId
+    category_id: CategoryId
+    document_id: DocumentId
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentsAdded(DomainEvent):
+    """A batch of documents has been added to a category of a workspace."""
+
+    workspace_id: WorkspaceId
+    category_id: CategoryId
+    document_ids: Tuple[UUID, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentsReplaced(DomainEvent):
+    """The documents of a category of a workspace have been replaced by a batch."""
+
+    workspace_id: WorkspaceId
+    category_id: CategoryId
+    document_ids: Tuple[UUID, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentsRemoved(DomainEvent):
+    """A batch of documents has been removed from a category of a workspace."""
+
+    workspace_id: WorkspaceId
+    category_id: CategoryId
+    document_ids: Tuple[UUID, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentTextChanged(DomainEvent):
+    """The text of a document has changed."""
+
+    category_id: CategoryId
+    document_id: DocumentId
+    text: DocumentText
+
+
+@dataclass(frozen=True, slots=True)
+class ModelTrained(DomainEvent):
+    """A model has been trained for a workspace."""
+
+    workspace_id: WorkspaceId
+    model_id: WorkspaceModelId
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsUpdated(DomainEvent):
+    """The metrics of a workspace have been updated."""
+
+    workspace_id: WorkspaceId
@@ -1,5 +1,7 @@
 """Domain exceptions module."""
 
+from typing import Any, List
+
 from . import DomainError
 
 
@@ -13,3 +15,23 @@ class CategoryNameValidationError(DomainError):
 
 class WorkspaceNameValidationError(DomainError):
     """WorkspaceNameValidationError Error."""
+
+
+class ItemsAlreadyExistError(DomainError):
+    """Raised when items added in bulk conflict with a collection, or each other."""
+
+    def __init__(self, ids: List[Any]) -> None:
+        """
+        Class constructor.
+
+        Args:
+            ids (List[Any]): IDs of every conflicting item, once each.
+        """
+        self.ids = ids
+        shown = ", ".join(str(id) for id in ids[:5])
+        more = f" and {len(ids) - 5} more" if len(ids) > 5 else ""
+        super().__init__(f"{len(ids)} items already exist: {shown}{more}.")
+
+
+class DocumentViewUpdateError(DomainError):
+    """Raised when updating a document view, whose changes would be lost."""
@@ -1,21 +1,49 @@
 """Classify models module."""
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from itertools import repeat
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from uuid import UUID
 
+from ..events import DomainEvent
+from ..events.workspaces import (
+    CategoryAdded,
+    DocumentAdded,
+    DocumentsAdded,
+    DocumentsReplaced,
+    DocumentTextChanged,
+    MetricsUpdated,
+    ModelTrained,
+)
 from ..exceptions.workspaces import (
     CategoryNameValidationError,
     DocumentTextValidationError,
+    DocumentViewUpdateError,
+    ItemsAlreadyExistError,
     WorkspaceNameValidationError,
 )
 
 T = TypeVar("T")
 K = TypeVar("K")
 
+_UUID_SIZE = 16
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DocumentId:
     """DocumentId value object."""
 
@@ -37,19 +65,23 @@ class DocumentId:
         return f"{self.__class__.__name__}({self.value})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DocumentText:
     """DocumentText value object."""
 
+    MAX_LENGTH: ClassVar[int] = 2000
+
     value: str
 
     def __post_init__(self):
         """Post init validation for texts."""
-        if len(self.value) > 2000:
-            raise DocumentTextValidationError("Max text lenght (characters): 2000")
+        if len(self.value) > self.MAX_LENGTH:
+            raise DocumentTextValidationError(
+                f"Max text lenght (characters): {self.MAX_LENGTH}"
+            )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkspaceId:
     """WorkspaceId value object."""
 
@@ -71,7 +103,7 @@ class WorkspaceId:
         return f"{self.__class__.__name__}({self.value})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkspaceOwnerId:
     """OwnerId value object."""
 
@@ -93,7 +125,7 @@ class WorkspaceOwnerId:
         return f"{self.__class__.__name__}({self.value})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkspaceModelId:
     """WorkspaceModelId value object."""
 
@@ -108,26 +140,30 @@ class WorkspaceModelId:
         return f"{self.__class__.__name__}({self.value})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkspaceName:
     """WorkspaceName value object."""
 
+    MAX_LENGTH: ClassVar[int] = 100
+
     value: str
 
     def __post_init__(self):
         """Post init validation for texts."""
-        if len(self.value) > 100:
-            raise WorkspaceNameValidationError("Max text lenght (characters): 200")
+        if len(self.value) > self.MAX_LENGTH:
+            raise WorkspaceNameValidationError(
+                f"Max text lenght (characters): {self.MAX_LENGTH}"
+            )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkspaceMetrics:
     """WorkspaceMetrics value object."""
 
     value: Dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryId:
     """CategoryId value object."""
 
@@ -149,27 +185,38 @@ class CategoryId:
         return f"{self.__class__.__name__}({self.value})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CategoryName:
     """CategoryName value object."""
 
+    MAX_LENGTH: ClassVar[int] = 100
+
     value: str
 
     def __post_init__(self):
         """Post init validation for texts."""
-        if len(self.value) > 100:
-            raise CategoryNameValidationError("Max text lenght (characters): 200")
+        if len(self.value) > self.MAX_LENGTH:
+            raise CategoryNameValidationError(
+                f"Max text lenght (characters): {self.MAX_LENGTH}"
+            )
 
 
 class Collection(Generic[K, T]):
     """Collection base interface."""
 
-    _data: Dict[K, T] = {}
+    __slots__ = ("_data",)
+
+    _data: Dict[K, T]
 
     def __init__(self, items: Optional[List[T]] = None) -> None:
         """Class constructor."""
         self._data = {} if items is None else {item.id: item for item in items}  # type: ignore
 
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the items have been loaded."""
+        return True
+
     def add(self, item: T) -> None:
         """
         Add a Item to the collection.
@@ -185,6 +232,32 @@ class Collection(Generic[K, T]):
 
         self._data[item.id] = item  # type: ignore
 
+    def add_many(self, items: Iterable[T]) -> None:
+        """
+        Add a batch of items to the collection.
+
+        Nothing is added if any item already exists, or is repeated in the batch.
+
+        Args:
+            items (Iterable[T]): Items to be added
+
+        Raises
+            ItemsAlreadyExistError: raised with the ID of every conflicting item.
+        """
+        batch: Dict[K, T] = {}
+        conflicts: Dict[K, None] = {}
+
+        for item in items:
+            if item.id in batch or item.id in self._data:  # type: ignore
+                conflicts[item.id] = None  # type: ignore
+
+            batch[item.id] = item  # type: ignore
+
+        if conflicts:
+            raise ItemsAlreadyExistError(ids=list(conflicts))
+
+        self._data.update(batch)
+
     def update(self, item: T) -> None:
         """
         Update a Document in the collection.
@@ -256,12 +329,23 @@ class Collection(Generic[K, T]):
 class Workspace:
     """Domain Workspace model class."""
 
+    __slots__ = (
+        "_id",
+        "_name",
+        "_categories",
+        "_owner_id",
+        "_metrics",
+        "_model_id",
+        "_events",
+    )
+
     _id: WorkspaceId
     _name: WorkspaceName
     _categories: CategoryCollection
     _owner_id: WorkspaceOwnerId
     _metrics: WorkspaceMetrics
-    _model_id: Optional[WorkspaceModelId] = None
+    _model_id: Optional[WorkspaceModelId]
+    _events: List[DomainEvent]
 
     def __init__(
         self,
@@ -279,6 +363,7 @@ class Workspace:
         self._owner_id = owner_id
         self._model_id = model_id
         self._metrics = metrics
+        self._events = []
 
     @property
     def id(self) -> WorkspaceId:
@@ -343,11 +428,92 @@ class Workspace:
     def add_category(self, category: Category) -> None:
         """Add a Category to the workspace."""
         self._categories.add(item=category)
+        self._events.append(
+            CategoryAdded(workspace_id=self._id, category_id=category.id)
+        )
 
     def add_document(self, document: Document) -> None:
         """Add a Category to the workspace."""
         category = self._categories.get(id=document.category)
         category.documents.add(item=document)
+        self._events.append(
+            DocumentAdded(
+                workspace_id=self._id,
+                category_id=document.category,
+                document_id=document.id,
+            )
+        )
+
+    def add_categories(self, categories: Iterable[Category]) -> None:
+        """
+        Add a batch of categories to the workspace.
+
+        Raises
+            ItemsAlreadyExistError: raised with the ID of every conflicting category,
+            and nothing is added.
+        """
+        categories = list(categories)
+        self._categories.add_many(items=categories)
+        self._events.extend(
+            CategoryAdded(workspace_id=self._id, category_id=category.id)
+            for category in categories
+        )
+
+    def add_documents(
+        self, category_id: CategoryId, ids: Iterable[UUID], texts: Iterable[str]
+    ) -> None:
+        """
+        Add a batch of documents to a category of the workspace.
+
+        Raises
+            ItemsAlreadyExistError: raised with the ID of every conflicting document,
+            and nothing is added.
+        """
+        ids = tuple(ids)
+        self._categories.get(id=category_id).documents.add_many(
+            ids=ids, texts=texts, category_id=category_id
+        )
+        self._events.append(
+            DocumentsAdded(
+                workspace_id=self._id, category_id=category_id, document_ids=ids
+            )
+        )
+
+    def replace_documents(
+        self, category_id: CategoryId, ids: Iterable[UUID], texts: Iterable[str]
+    ) -> None:
+        """
+        Replace the documents of a category of the workspace by a batch.
+
+        Raises
+            ItemsAlreadyExistError: raised with the ID of every repeated document,
+            and nothing is replaced.
+        """
+        ids = tuple(ids)
+        self._categories.get(id=category_id).documents.replace(
+            ids=ids, texts=texts, category_id=category_id
+        )
+        self._events.append(
+            DocumentsReplaced(
+                workspace_id=self._id, category_id=category_id, document_ids=ids
+            )
+        )
+
+    def update_document_text(
+        self, category_id: CategoryId, document_id: DocumentId, text: DocumentText
+    ) -> None:
+        """
+        Update the text of a document of the workspace.
+
+        The documents of a collection are read-only views, so the updated document
+        is stored back into its category.
+        """
+        documents = self._categories.get(id=category_id).documents
+        view = documents.get(id=document_id)
+        document = Document(id=view.id, text=view.text, category_id=view.category)
+        document.update_text(text=text)
+        documents.update(item=document)
+        self._events.extend(document.pull_events())
 
     def set_model_id(self, model_id: str) -> None:
         """
@@ -357,6 +523,9 @@ class Workspace:
             model_id (str): model id
         """
         self._model_id = WorkspaceModelId(value=model_id)
+        self._events.append(
+            ModelTrained(workspace_id=self._id, model_id=self._model_id)
+        )
 
     def set_metrics(self, metrics: Dict[str, Any]) -> None:
         """
@@ -366,6 +535,13 @@ class Workspace:
             metrics (Dict[str, Any]): metrics
         """
         self._metrics = WorkspaceMetrics(value=metrics)
+        self._events.append(MetricsUpdated(workspace_id=self._id))
+
+    def pull_events(self) -> List[DomainEvent]:
+        """Return the events recorded since the last call, and forget them."""
+        events, self._events = self._events, []
+
+        return events
 
     def __str__(self) -> str:
         """Nice string representation."""
@@ -385,6 +561,8 @@ class Workspace:
 class Category:
     """Category model."""
 
+    __slots__ = ("_id", "_name", "_workspace_id", "_documents")
+
     _id: CategoryId
     _name: CategoryName
     _workspace_id: WorkspaceId
@@ -459,7 +637,125 @@ class Category:
 
 
 class CategoryCollection(Collection[CategoryId, Category]):
-    """Category collection."""
+    """
+    Category collection.
+
+    Besides the ID, the categories are indexed by name, the key used to merge the
+    categories of a file into a workspace, so two categories can't share a name.
+    """
+
+    __slots__ = ("_names",)
+
+    _names: Dict[str, CategoryId]
+
+    def __init__(self, items: Optional[List[Category]] = None) -> None:
+        """
+        Class constructor.
+
+        Raises
+            ItemsAlreadyExistError: raised with the ID of every category whose name
+            is repeated.
+        """
+        super().__init__(items=items)
+        self._index_names()
+
+    def add(self, item: Category) -> None:
+        """
+        Add a Category to the collection.
+
+        Raises
+            ItemsAlreadyExistError: raised when another category has the same name.
+        """
+        self._check_names(items=[item])
+        super().add(item=item)
+        self._names[item.name.value] = item.id
+
+    def add_many(self, items: Iterable[Category]) -> None:
+        """
+        Add a batch of categories to the collection.
+
+        Raises
+            ItemsAlreadyExistError: raised with the ID of every category whose name
+            is stored or repeated in the batch, and nothing is added.
+        """
+        items = list(items)
+        self._check_names(items=items)
+        super().add_many(items=items)
+        self._names.update((item.name.value, item.id) for item in items)
+
+    def update(self, item: Category) -> None:
+        """
+        Update a Category in the collection, renaming it in the index.
+
+        Raises
+            ItemsAlreadyExistError: raised when another category has the new name.
+        """
+        self._check_names(items=[item])
+        previous = self._data.get(item.id)
+        super().update(item=item)
+
+        if previous is not None:
+            self._names.pop(previous.name.value, None)
+
+        self._names[item.name.value] = item.id
+
+    def remove(self, id: CategoryId) -> None:
+        """Remove a Category from the collection."""
+        category = self._data.get(id)
+        super().remove(id=id)
+
+        if category is not None:
+            self._names.pop(category.name.value, None)
+
+    def get_by_name(self, name: str) -> Category:
+        """
+        Return a Category by name.
+
+        Args:
+            name (str): category name to look for
+
+        Returns
+            Category: a category.
+        """
+        if name not in self._names:
+            raise Exception(f"The item with name '{name}' does not exist.")
+
+        return self._data[self._names[name]]
+
+    def has_name(self, name: str) -> bool:
+        """Check if a category with the name exists within the collection."""
+        return name in self._names
+
+    def _index_names(self) -> None:
+        """Index the categories of the collection by name."""
+        self._names = {}
+        self._check_names(items=self._data.values())
+        self._names = {item.name.value: item.id for item in self._data.values()}
+
+    def _check_names(self, items: Iterable[Category]) -> None:
+        """
+        Check that no category takes the name of another one.
+
+        A category keeps its own name, so only the names stored, or used earlier in
+        the batch, by a category with a different ID are conflicts.
+
+        Raises
+            ItemsAlreadyExistError: raised with the ID of every conflicting category.
+        """
+        names: Dict[str, CategoryId] = {}
+        conflicts: Dict[CategoryId, None] = {}
+
+        for item in items:
+            name = item.name.value
+            owner = names.get(name, self._names.get(name))
+
+            if owner is not None and owner != item.id:
+                conflicts[item.id] = None
+
+            names.setdefault(name, item.id)
+
+        if conflicts:
+            raise ItemsAlreadyExistError(ids=list(conflicts))
 
     def __str__(self) -> str:
         """Nice string representation."""
@@ -470,12 +766,94 @@ class CategoryCollection(Collection[CategoryId, Category]):
         return f"{list(self._data.values())}"
 
 
+class LazyCategoryCollection(CategoryCollection):
+    """
+    Category collection loaded on its first access.
+
+    Workspaces whose categories are not needed, as when only the model ID or the
+    metrics change, are built without reading them.
+    """
+
+    __slots__ = ("_loader",)
+
+    _loader: Optional[Callable[[], Iterable[Category]]]
+
+    def __init__(self, loader: Callable[[], Iterable[Category]]) -> None:
+        """Class constructor."""
+        super().__init__()
+        self._loader = loader
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the categories have been loaded."""
+        return self._loader is None
+
+    def add(self, item: Category) -> None:
+        """Add a Category to the collection."""
+        self._load()
+        super().add(item=item)
+
+    def add_many(self, items: Iterable[Category]) -> None:
+        """Add a batch of categories to the collection."""
+        self._load()
+        super().add_many(items=items)
+
+    def update(self, item: Category) -> None:
+        """Update a Category in the collection."""
+        self._load()
+        super().update(item=item)
+
+    def remove(self, id: CategoryId) -> None:
+        """Remove a Category from the collection."""
+        self._load()
+        super().remove(id=id)
+
+    def get(self, id: CategoryId) -> Category:
+        """Return a Category by ID."""
+        self._load()
+        return super().get(id=id)
+
+    def values(self):
+        """Return the collection values."""
+        self._load()
+        return super().values()
+
+    def get_by_name(self, name: str) -> Category:
+        """Return a Category by name."""
+        self._load()
+        return super().get_by_name(name=name)
+
+    def has_name(self, name: str) -> bool:
+        """Check if a category with the name exists within the collection."""
+        self._load()
+        return super().has_name(name=name)
+
+    def _load(self) -> None:
+        """Load the categories on the first access."""
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            self._data = {item.id: item for item in loader()}
+            self._index_names()
+
+    def __str__(self) -> str:
+        """Nice string representation."""
+        return super().__str__() if self.is_loaded else "[...]"
+
+    def __repr__(self) -> str:
+        """Nice object representation."""
+        return super().__repr__() if self.is_loaded else "[...]"
+
+
 class Document:
     """Document model."""
 
+    __slots__ = ("_id", "_text", "_category_id", "_events")
+
     _id: DocumentId
     _text: DocumentText
     _category_id: CategoryId
+    # Created on the first event, as most documents never record one.
+    _events: Optional[List[DomainEvent]]
 
     def __init__(
         self, id: DocumentId, text: DocumentText, category_id: CategoryId
@@ -484,6 +862,7 @@ class Document:
         self._id = id
         self._text = text
         self._category_id = category_id
+        self._events = None
 
     @property
     def id(self) -> DocumentId:
@@ -519,6 +898,21 @@ class Document:
         """Update the text."""
         self._text = text
 
+        if self._events is None:
+            self._events = []
+
+        self._events.append(
+            DocumentTextChanged(
+                category_id=self._category_id, document_id=self._id, text=text
+            )
+        )
+
+    def pull_events(self) -> List[DomainEvent]:
+        """Return the events recorded since the last call, and forget them."""
+        events, self._events = self._events or [], None
+
+        return events
+
     def __str__(self) -> str:
         """Nice string representation."""
         return f"{self.__class__.__name__}(id={str(self._id.value)}, text='{self._text.value}')"
@@ -528,13 +922,455 @@ class Document:
         return f"{self.__class__.__name__}(id={str(self._id.value)}, text='{self._text.value}')"
 
 
-class DocumentCollection(Collection[DocumentId, Document]):
-    """Document collection."""
+class DocumentView(Document):
+    """
+    Read-only Document built from the columns of a DocumentCollection.
+
+    Changing a view would not change the collection, so the text of a document is
+    updated through Workspace.update_document_text instead.
+    """
+
+    __slots__ = ()
+
+    def update_text(self, text: DocumentText) -> None:
+        """
+        Refuse to update the text of the view.
+
+        Raises
+            DocumentViewUpdateError: always, as the change would be lost.
+        """
+        raise DocumentViewUpdateError(
+            f"The document '{self._id.value}' is a view of its collection, "
+            "update its text through Workspace.update_document_text."
+        )
+
+
+class DocumentCollection:
+    """
+    Document collection.
+
+    Documents are stored by columns, the IDs packed in a bytearray and the texts in
+    a list, so a large category does not keep three objects per document. The
+    documents returned by get and values are read-only views built on demand, so
+    changes are only stored through update.
+
+    The index of the IDs is built on the first lookup by ID. Removed documents
+    leave a hole in the columns until more than half of the rows are holes.
+    """
+
+    __slots__ = ("_ids", "_texts", "_category_ids", "_index", "_removed")
+
+    _ids: bytearray
+    _texts: List[Optional[str]]
+    _category_ids: List[Optional[CategoryId]]
+    _index: Optional[Dict[bytes, int]]
+    _removed: int
+
+    def __init__(self, items: Optional[List[Document]] = None) -> None:
+        """Class constructor."""
+        self._ids = bytearray()
+        self._texts = []
+        self._category_ids = []
+        self._index = None
+        self._removed = 0
+
+        if items:
+            self._extend(
+                rows=((item.id.value, item.text.value, item.category) for item in items)
+            )
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the documents have been loaded."""
+        return True
+
+    def add(self, item: Document) -> None:
+        """
+        Add a Document to the collection.
+
+        Args:
+            item (Document): Document to be added
+
+        Raises
+            Exception: raised when the document already exists in the collection.
+        """
+        if self._exists(id=item.id):
+            raise Exception(
+                f"The item with ID '{item.id}' already exists in the collection."
+            )
+
+        self._extend(rows=((item.id.value, item.text.value, item.category),))
+
+    def extend(
+        self, ids: Iterable[UUID], texts: Iterable[str], category_id: CategoryId
+    ) -> None:
+        """
+        Add the documents of a category in bulk, without building a Document per row.
+
+        As in the constructor, a repeated ID keeps the position of its first row and
+        the text of the last one.
+
+        Args:
+            ids (Iterable[UUID]): IDs of the documents.
+            texts (Iterable[str]): texts of the documents, in the order of the IDs.
+            category_id (CategoryId): category of the documents.
+
+        Raises
+            DocumentTextValidationError: raised when a text is too long.
+        """
+        self._extend(rows=((id, text, category_id) for id, text in zip(ids, texts)))
+
+    def add_many(
+        self, ids: Iterable[UUID], texts: Iterable[str], category_id: CategoryId
+    ) -> None:
+        """
+        Add a batch of documents of a category.
+
+        Unlike extend, nothing is added if any ID already exists or is repeated in
+        the batch.
+
+        Args:
+            ids (Iterable[UUID]): IDs of the documents.
+            texts (Iterable[str]): texts of the documents, in the order of the IDs.
+            category_id (CategoryId): category of the documents.
+
+        Raises
+            DocumentTextValidationError: raised when a text is too long.
+            ItemsAlreadyExistError: raised with the ID of every conflicting document.
+        """
+        stored = self._get_index() if len(self._texts) > self._removed else {}
+        keys, texts = self._check_batch(ids=ids, texts=texts, stored=stored)
+        self._append_batch(keys=keys, texts=texts, category_id=category_id)
+
+    def replace(
+        self, ids: Iterable[UUID], texts: Iterable[str], category_id: CategoryId
+    ) -> None:
+        """
+        Replace every document by a batch of documents of a category.
+
+        The collection is left as it was if the batch is not valid.
+
+        Raises
+            DocumentTextValidationError: raised when a text is too long.
+            ItemsAlreadyExistError: raised with the ID of every repeated document.
+        """
+        keys, texts = self._check_batch(ids=ids, texts=texts, stored={})
+
+        self._ids = bytearray()
+        self._texts = []
+        self._category_ids = []
+        self._index = None
+        self._removed = 0
+        self._append_batch(keys=keys, texts=texts, category_id=category_id)
+
+    def update(self, item: Document) -> None:
+        """
+        Update a Document in the collection.
+
+        Args:
+            item (Document): document to be updated
+
+        Raises
+            Exception: raised when the document to update does not exist within the
+            collection.
+        """
+        if not self._exists(id=item.id):
+            raise Exception(f"The item with ID '{item.id.value}' does not exist.")
+
+        position = self._get_index()[item.id.value.bytes]
+        self._texts[position] = item.text.value
+        self._category_ids[position] = item.category
+
+    def remove(self, id: DocumentId) -> None:
+        """
+        Remove a Document from the collection.
+
+        Args:
+            id (DocumentId): document ID
+
+        Raises
+            Exception: raised when the document does not exist within the collection.
+        """
+        if not self._exists(id=id):
+            raise Exception(f"The item with ID '{id.value}' does not exist.")
+
+        position = self._get_index().pop(id.value.bytes)
+        self._texts[position] = None
+        self._category_ids[position] = None
+        self._removed += 1
+
+        if self._removed * 2 > len(self._texts):
+            self._compact()
+
+    def get(self, id: DocumentId) -> Document:
+        """
+        Return a Document by ID.
+
+        Args:
+            id (DocumentId): document ID to look for
+
+        Returns
+            Document: a view of the document.
+        """
+        if not self._exists(id=id):
+            raise Exception(f"The item with ID '{id.value}' does not exist.")
+
+        return self._view(position=self._get_index()[id.value.bytes])
+
+    def values(self) -> Iterator[Document]:
+        """Return the collection values."""
+        for position, text in enumerate(self._texts):
+            if text is not None:
+                yield self._view(position=position)
+
+    def rows(self) -> Iterator[Tuple[UUID, str]]:
+        """Return the ID and text of every document, without building Documents."""
+        ids = self._ids
+
+        for position, text in enumerate(self._texts):
+            if text is not None:
+                offset = position * _UUID_SIZE
+                yield UUID(bytes=bytes(ids[offset : offset + _UUID_SIZE])), text
+
+    def texts(self) -> Iterator[str]:
+        """Return the text of every document."""
+        return (text for text in self._texts if text is not None)
+
+    def _exists(self, id: DocumentId) -> bool:
+        """Check if a document already exists within the collection."""
+        return id.value.bytes in self._get_index()
+
+    def _view(self, position: int) -> Document:
+        """Build a read-only view of the Document stored in a position."""
+        offset = position * _UUID_SIZE
+
+        return DocumentView(
+            id=DocumentId(
+                value=UUID(bytes=bytes(self._ids[offset : offset + _UUID_SIZE]))
+            ),
+            text=DocumentText(value=self._texts[position]),  # type: ignore
+            category_id=self._category_ids[position],  # type: ignore
+        )
+
+    @staticmethod
+    def _check_batch(
+        ids: Iterable[UUID], texts: Iterable[str], stored: Dict[bytes, int]
+    ) -> Tuple[List[bytes], List[str]]:
+        """Validate a batch as a whole, returning the packed IDs and the texts."""
+        keys = [id.bytes for id in ids]
+        texts = list(texts)
+
+        if len(keys) != len(texts):
+            raise ValueError(f"Got {len(keys)} document IDs for {len(texts)} texts.")
+
+        if max(map(len, texts), default=0) > DocumentText.MAX_LENGTH:
+            raise DocumentTextValidationError(
+                f"Max text lenght (characters): {DocumentText.MAX_LENGTH}"
+            )
+
+        batch = set(keys)
+
+        if len(batch) < len(keys) or not batch.isdisjoint(stored):
+            repeated = Counter(keys)
+            raise ItemsAlreadyExistError(
+                ids=[
+                    DocumentId(value=UUID(bytes=key))
+                    for key in dict.fromkeys(keys)
+                    if repeated[key] > 1 or key in stored
+                ]
+            )
+
+        return keys, texts
+
+    def _append_batch(
+        self, keys: List[bytes], texts: List[str], category_id: CategoryId
+    ) -> None:
+        """Append a validated batch to the columns."""
+        start = len(self._texts)
+        self._ids += b"".join(keys)
+        self._texts.extend(texts)
+        self._category_ids.extend(repeat(category_id, len(texts)))
+
+        if self._index is not None:
+            self._index.update(zip(keys, range(start, start + len(keys))))
+
+    def _extend(self, rows: Iterable[Tuple[UUID, str, CategoryId]]) -> None:
+        """
+        Append rows to the columns, replacing the text of the IDs already stored.
+
+        The index is needed to find the IDs already stored, so it is built, and
+        kept up to date, by the first addition.
+        """
+        index = self._get_index()
+
+        for id, text, category_id in rows:
+            if len(text) > DocumentText.MAX_LENGTH:
+                raise DocumentTextValidationError(
+                    f"Max text lenght (characters): {DocumentText.MAX_LENGTH}"
+                )
+
+            key = id.bytes
+            position = index.get(key)
+
+            if position is None:
+                index[key] = len(self._texts)
+                self._ids += key
+                self._texts.append(text)
+                self._category_ids.append(category_id)
+            else:
+                self._texts[position] = text
+                self._category_ids[position] = category_id
+
+    def _get_index(self) -> Dict[bytes, int]:
+        """Return the index of the IDs, building it on the first lookup."""
+        if self._index is None:
+            self._index = self._build_index()
+
+        return self._index
+
+    def _build_index(self) -> Dict[bytes, int]:
+        """Build the position of every stored ID."""
+        ids = self._ids
+
+        return {
+            bytes(ids[position * _UUID_SIZE : (position + 1) * _UUID_SIZE]): position
+            for position, text in enumerate(self._texts)
+            if text is not None
+        }
+
+    def _compact(self) -> None:
+        """Drop the holes left by the removed documents."""
+        positions = [
+            position for position, text in enumerate(self._texts) if text is not None
+        ]
+        ids = self._ids
+
+        self._ids = bytearray().join(
+            ids[position * _UUID_SIZE : (position + 1) * _UUID_SIZE]
+            for position in positions
+        )
+        self._texts = [self._texts[position] for position in positions]
+        self._category_ids = [self._category_ids[position] for position in positions]
+        self._index = None
+        self._removed = 0
+
+    def __len__(self) -> int:
+        """Return the number of documents."""
+        return len(self._texts) - self._removed
 
     def __str__(self) -> str:
         """Nice string representation."""
-        return f"{list(self._data.values())}"
+        return f"{list(self.values())}"
 
     def __repr__(self) -> str:
         """Nice object representation."""
-        return f"{list(self._data.values())}"
+        return f"{list(self.values())}"
+
+
+class LazyDocumentCollection(DocumentCollection):
+    """
+    Document collection loaded on its first access.
+
+    Only the categories whose documents are read or changed load them, so the
+    rest of the corpus of a workspace stays in the database.
+    """
+
+    __slots__ = ("_loader", "_category_id")
+
+    _loader: Optional[Callable[[], Iterable[Tuple[UUID, str]]]]
+    _category_id: CategoryId
+
+    def __init__(
+        self, category_id: CategoryId, loader: Callable[[], Iterable[Tuple[UUID, str]]]
+    ) -> None:
+        """
+        Class constructor.
+
+        Args:
+            category_id (CategoryId): category of the documents.
+            loader (Callable[[], Iterable[Tuple[UUID, str]]]): returns the ID and
+                text of every document of the category.
+        """
+        super().__init__()
+        self._category_id = category_id
+        self._loader = loader
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the documents have been loaded."""
+        return self._loader is None
+
+    def add(self, item: Document) -> None:
+        """Add a Document to the collection."""
+        self._load()
+        super().add(item=item)
+
+    def add_many(
+        self, ids: Iterable[UUID], texts: Iterable[str], category_id: CategoryId
+    ) -> None:
+        """Add a batch of documents to the collection."""
+        self._load()
+        super().add_many(ids=ids, texts=texts, category_id=category_id)
+
+    def replace(
+        self, ids: Iterable[UUID], texts: Iterable[str], category_id: CategoryId
+    ) -> None:
+        """Replace every document by a batch, without loading the stored ones."""
+        super().replace(ids=ids, texts=texts, category_id=category_id)
+        self._loader = None
+
+    def extend(
+        self, ids: Iterable[UUID], texts: Iterable[str], category_id: CategoryId
+    ) -> None:
+        """Add the documents of a category in bulk."""
+        self._load()
+        super().extend(ids=ids, texts=texts, category_id=category_id)
+
+    def update(self, item: Document) -> None:
+        """Update a Document in the collection."""
+        self._load()
+        super().update(item=item)
+
+    def remove(self, id: DocumentId) -> None:
+        """Remove a Document from the collection."""
+        self._load()
+        super().remove(id=id)
+
+    def get(self, id: DocumentId) -> Document:
+        """Return a Document by ID."""
+        self._load()
+        return super().get(id=id)
+
+    def values(self) -> Iterator[Document]:
+        """Return the collection values."""
+        self._load()
+        return super().values()
+
+    def rows(self) -> Iterator[Tuple[UUID, str]]:
+        """Return the ID and text of every document."""
+        self._load()
+        return super().rows()
+
+    def texts(self) -> Iterator[str]:
+        """Return the text of every document."""
+        self._load()
+        return super().texts()
+
+    def _load(self) -> None:
+        """Load the documents on the first access."""
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            self._extend(rows=((id, text, self._category_id) for id, text in loader()))
+
+    def __len__(self) -> int:
+        """Return the number of documents."""
+        self._load()
+        return super().__len__()
+
+    def __str__(self) -> str:
+        """Nice string representation."""
+        return super().__str__() if self.is_loaded else "[...]"
+
+    def __repr__(self) -> str:
+        """Nice object representation."""
+        return super().__repr__() if self.is_loaded else "[...]"
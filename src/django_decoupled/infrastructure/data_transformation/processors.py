@@ -1,4 +1,5 @@
 """Data processor module."""
+from itertools import repeat
 from typing import List
 
 from django_decoupled.application.exceptions import TrainDatasetDataError
@@ -16,10 +17,20 @@ class DataProcessorService(IDataProcessor[WorkspaceDTO, TrainDataSet]):
         classes: List[str] = []
 
         for workspace in workspaces:
+            if workspace.categories is None:
+                raise TrainDatasetDataError(
+                    f"The categories of the workspace '{workspace.id}' are not loaded."
+                )
+
             for category in workspace.categories:
-                for document in category.documents:
-                    texts.append(document.text)
-                    classes.append(category.name)
+                if category.documents is None:
+                    raise TrainDatasetDataError(
+                        f"The documents of the category '{category.id}' are not loaded."
+                    )
+
+                start = len(texts)
+                texts.extend(document.text for document in category.documents)
+                classes.extend(repeat(category.name, len(texts) - start))
 
         if len(texts) != len(classes):
             raise TrainDatasetDataError
@@ -0,0 +1 @@
+"""Ingestion persistence package."""
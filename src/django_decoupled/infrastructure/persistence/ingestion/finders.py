@@ -0,0 +1,32 @@
+"""Ingestion finders module."""
+from dataclasses import fields, replace
+
+from ....application.dtos import IngestionBudget
+from ....application.interfaces import IIngestionBudgetFinder
+from .models import IngestionBudget as IngestionBudgetModel
+
+
+class DjangoIngestionBudgetFinder(IIngestionBudgetFinder[IngestionBudget]):
+    """DjangoIngestionBudgetFinder class."""
+
+    _default_budget: IngestionBudget
+
+    def __init__(self, default_budget: IngestionBudget) -> None:
+        """Class constructor."""
+        self._default_budget = default_budget
+
+    def get(self, owner_id: str) -> IngestionBudget:
+        """Return the budget of an owner, filling its empty limits with the defaults."""
+        overrides = (
+            IngestionBudgetModel.objects.filter(owner_id=owner_id)
+            .values(*(field.name for field in fields(IngestionBudget)))
+            .first()
+        )
+
+        if overrides is None:
+            return self._default_budget
+
+        return replace(
+            self._default_budget,
+            **{name: value for name, value in overrides.items() if value is not None},
+        )
@@ -0,0 +1,201 @@
+"""Ingestion models module."""
+import uuid
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class IngestionLog(models.Model):
+    """IngestionLog model class."""
+
+    id = models.UUIDField(
+        primary_key=True, default=uuid.uuid4, unique=True, editable=False
+    )
+    workspace = models.OneToOneField(
+        "Workspace", on_delete=models.CASCADE, related_name="ingestion_log"
+    )
+    sheet_hash = models.CharField(_("sheet hash"), max_length=64)
+    file_hash = models.CharField(_("file hash"), max_length=64, db_index=True)
+    sheet_count = models.PositiveIntegerField(_("sheet count"))
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+
+    class Meta:
+        """IngestionLog Meta class."""
+
+        verbose_name = _("Ingestion log")
+        verbose_name_plural = _("ingestion logs")
+        ordering = ["-updated_at"]
+        app_label = "workspaces"
+
+    def __str__(self) -> str:
+        """Nice object string representation."""
+        return f"{self.workspace_id}"
+
+    def __repr__(self) -> str:
+        """Nice object representation."""
+        return (
+            f"IngestionLog(workspace={self.workspace_id}, file_hash={self.file_hash})"
+        )
+
+
+class IngestionJob(models.Model):
+    """
+    IngestionJob model class.
+
+    The file of a failed job is kept, so the job can be retried, until the job is
+    abandoned.
+    """
+
+    class Status(models.TextChoices):
+        """Status choices."""
+
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        SUCCEEDED = "succeeded", _("Succeeded")
+        FAILED = "failed", _("Failed")
+        ABANDONED = "abandoned", _("Abandoned")
+
+    id = models.UUIDField(
+        primary_key=True, default=uuid.uuid4, unique=True, editable=False
+    )
+    owner = models.ForeignKey(
+        "users.User", on_delete=models.CASCADE, related_name="ingestion_jobs"
+    )
+    file_path = models.CharField(_("file path"), max_length=1024)
+    workspace_name = models.CharField(
+        _("workspace name"), max_length=255, null=True, blank=True
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+        db_index=True,
+    )
+    rows_parsed = models.PositiveIntegerField(_("rows parsed"), default=0)
+    rows_written = models.PositiveIntegerField(_("rows written"), default=0)
+    result = models.JSONField(_("result"), default=dict, blank=True)
+    error = models.TextField(_("error"), null=True, blank=True)
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+
+    class Meta:
+        """IngestionJob Meta class."""
+
+        verbose_name = _("Ingestion job")
+        verbose_name_plural = _("ingestion jobs")
+        ordering = ["-created_at"]
+        app_label = "workspaces"
+
+    def __str__(self) -> str:
+        """Nice object string representation."""
+        return f"{self.id}"
+
+    def __repr__(self) -> str:
+        """Nice object representation."""
+        return f"IngestionJob(id={self.id}, status={self.status})"
+
+    @property
+    def is_finished(self) -> bool:
+        """Check if the job is not going to change anymore."""
+        return self.status in (
+            self.Status.SUCCEEDED,
+            self.Status.FAILED,
+            self.Status.ABANDONED,
+        )
+
+
+class ChunkedUpload(models.Model):
+    """
+    ChunkedUpload model class.
+
+    Tracks a file uploaded in chunks. The chunks are appended to the stored file,
+    whose size is the offset where the next chunk must start, so an interrupted
+    upload is resumed from the last byte received.
+    """
+
+    class Status(models.TextChoices):
+        """Status choices."""
+
+        UPLOADING = "uploading", _("Uploading")
+        COMPLETED = "completed", _("Completed")
+
+    id = models.UUIDField(
+        primary_key=True, default=uuid.uuid4, unique=True, editable=False
+    )
+    owner = models.ForeignKey(
+        "users.User", on_delete=models.CASCADE, related_name="chunked_uploads"
+    )
+    filename = models.CharField(_("filename"), max_length=255)
+    file_path = models.CharField(_("file path"), max_length=1024)
+    size = models.PositiveBigIntegerField(_("size"))
+    status = models.CharField(
+        _("status"),
+        max_length=16,
+        choices=Status.choices,
+        default=Status.UPLOADING,
+    )
+    job = models.OneToOneField(
+        IngestionJob,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="chunked_upload",
+    )
+    created_at = models.DateTimeField(_("created at"), auto_now_add=True)
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+
+    class Meta:
+        """ChunkedUpload Meta class."""
+
+        verbose_name = _("Chunked upload")
+        verbose_name_plural = _("chunked uploads")
+        ordering = ["-created_at"]
+        app_label = "workspaces"
+
+    def __str__(self) -> str:
+        """Nice object string representation."""
+        return f"{self.id}"
+
+    def __repr__(self) -> str:
+        """Nice object representation."""
+        return f"ChunkedUpload(id={self.id}, status={self.status})"
+
+
+class IngestionBudget(models.Model):
+    """
+    IngestionBudget model class.
+
+    Per owner overrides of the default ingestion budgets. An empty limit falls back
+    to the default one.
+    """
+
+    id = models.UUIDField(
+        primary_key=True, default=uuid.uuid4, unique=True, editable=False
+    )
+    owner = models.OneToOneField(
+        "users.User", on_delete=models.CASCADE, related_name="ingestion_budget"
+    )
+    max_file_size = models.PositiveBigIntegerField(
+        _("max file size"), null=True, blank=True
+    )
+    max_rows = models.PositiveIntegerField(_("max rows"), null=True, blank=True)
+    max_sheets = models.PositiveIntegerField(_("max sheets"), null=True, blank=True)
+    max_categories = models.PositiveIntegerField(
+        _("max categories"), null=True, blank=True
+    )
+
+    class Meta:
+        """IngestionBudget Meta class."""
+
+        verbose_name = _("Ingestion budget")
+        verbose_name_plural = _("ingestion budgets")
+        app_label = "workspaces"
+
+    def __str__(self) -> str:
+        """Nice object string representation."""
+        return f"{self.owner_id}"
+
+    def __repr__(self) -> str:
+        """Nice object representation."""
+        return f"IngestionBudget(owner={self.owner_id})"
@@ -0,0 +1,264 @@
+"""Ingestion repositories module."""
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from ....application.dtos import ChunkedUploadDTO, IngestionJobDTO
+from ....application.interfaces import (
+    IChunkedUploadRepository,
+    IIngestionJobRepository,
+    IIngestionLog,
+)
+from ..workspaces.models import Workspace
+from .models import ChunkedUpload, IngestionJob, IngestionLog
+
+
+class DjangoIngestionLog(IIngestionLog):
+    """DjangoIngestionLog class."""
+
+    def is_file_unchanged(self, owner_id: str, file_hash: str) -> bool:
+        """
+        Check if every sheet of the file is still stored as it was ingested.
+
+        A sheet log is deleted along with its workspace and overwritten when the
+        sheet is ingested from another file, so the file is unchanged only while
+        all the sheet logs recorded for it still point to its hash.
+        """
+        logs = IngestionLog.objects.filter(
+            workspace__owner_id=owner_id, file_hash=file_hash
+        ).values_list("sheet_count", flat=True)
+
+        sheet_counts = list(logs)
+
+        return bool(sheet_counts) and all(
+            sheet_count == len(sheet_counts) for sheet_count in sheet_counts
+        )
+
+    def get_sheet_hashes(self, owner_id: str, names: List[str]) -> Dict[str, str]:
+        """Return the fingerprint of the last ingestion of every sheet by name."""
+        logs = IngestionLog.objects.filter(
+            workspace__owner_id=owner_id, workspace__name__in=names
+        ).values_list("workspace__name", "sheet_hash")
+
+        return dict(logs)
+
+    def record(
+        self,
+        owner_id: str,
+        sheet_hashes: Dict[str, str],
+        file_hash: str,
+    ) -> None:
+        """Record the fingerprints of an ingested file and its sheets."""
+        workspaces = list(
+            Workspace.objects.filter(
+                owner_id=owner_id, name__in=list(sheet_hashes)
+            ).only("id", "name")
+        )
+
+        for workspace in workspaces:
+            IngestionLog.objects.update_or_create(
+                workspace=workspace,
+                defaults={
+                    "sheet_hash": sheet_hashes[workspace.name],
+                    "file_hash": file_hash,
+                    "sheet_count": len(workspaces),
+                },
+            )
+
+
+class DjangoIngestionJobRepository(IIngestionJobRepository[IngestionJobDTO]):
+    """
+    DjangoIngestionJobRepository class.
+
+    Jobs left running without progress for longer than 'lease_timeout' seconds, as
+    when their worker dies, are claimed again as if they were pending. The progress
+    is written through the 'database' connection, so it is committed, and seen by
+    the other workers, while the job is still writing its documents.
+    """
+
+    _lease_timeout: int
+    _database: str
+
+    def __init__(self, lease_timeout: int, database: str = DEFAULT_DB_ALIAS) -> None:
+        """Class constructor."""
+        self._lease_timeout = lease_timeout
+        self._database = database
+
+    def enqueue(
+        self, owner_id: str, file_path: str, workspace_name: Optional[str] = None
+    ) -> str:
+        """Create a pending job and return its ID."""
+        job = IngestionJob.objects.create(
+            owner_id=owner_id, file_path=file_path, workspace_name=workspace_name
+        )
+
+        return str(job.id)
+
+    def claim_next(self) -> Optional[IngestionJobDTO]:
+        """
+        Mark the oldest pending, or abandoned, job as running and return it.
+
+        The row is locked while it is claimed and locked rows are skipped, so
+        several workers can poll the queue without claiming the same job.
+        """
+        lease_expired_at = timezone.now() - timedelta(seconds=self._lease_timeout)
+
+        with transaction.atomic():
+            job = (
+                IngestionJob.objects.select_for_update(skip_locked=True)
+                .filter(
+                    Q(status=IngestionJob.Status.PENDING)
+                    | Q(
+                        status=IngestionJob.Status.RUNNING,
+                        updated_at__lt=lease_expired_at,
+                    )
+                )
+                .order_by("created_at")
+                .first()
+            )
+
+            if job is None:
+                return None
+
+            job.status = IngestionJob.Status.RUNNING
+            job.save(update_fields=["status", "updated_at"])
+
+        return IngestionJobDTO(
+            id=str(job.id),
+            owner=str(job.owner_id),
+            file_path=job.file_path,
+            status=job.status,
+            workspace_name=job.workspace_name,
+        )
+
+    def update_progress(self, job_id: str, rows_parsed: int, rows_written: int) -> None:
+        """Update the progress counters of a running job, renewing its lease."""
+        IngestionJob.objects.using(self._database).filter(id=job_id).update(
+            rows_parsed=rows_parsed,
+            rows_written=rows_written,
+            updated_at=timezone.now(),
+        )
+
+    def complete(self, job_id: str, result: Dict[str, Any]) -> None:
+        """Mark a job as succeeded."""
+        job = IngestionJob.objects.get(id=job_id)
+        job.status = IngestionJob.Status.SUCCEEDED
+        job.result = result
+        job.save(update_fields=["status", "result", "updated_at"])
+
+    def fail(self, job_id: str, error: str) -> None:
+        """Mark a job as failed."""
+        job = IngestionJob.objects.get(id=job_id)
+        job.status = IngestionJob.Status.FAILED
+        job.error = error
+        job.save(update_fields=["status", "error", "updated_at"])
+
+    def retry(self, job_id: str) -> bool:
+        """Mark a failed job as pending again, returning whether it had failed."""
+        return bool(
+            IngestionJob.objects.filter(
+                id=job_id, status=IngestionJob.Status.FAILED
+            ).update(
+                status=IngestionJob.Status.PENDING,
+                rows_parsed=0,
+                rows_written=0,
+                error=None,
+                updated_at=timezone.now(),
+            )
+        )
+
+    def abandon_failed(self, older_than: int) -> List[str]:
+        """
+        Mark the jobs failed for longer than 'older_than' seconds as abandoned.
+
+        Returns
+            List[str]: paths of the files of the jobs abandoned.
+        """
+        with transaction.atomic():
+            jobs = IngestionJob.objects.select_for_update(skip_locked=True).filter(
+                status=IngestionJob.Status.FAILED,
+                updated_at__lt=timezone.now() - timedelta(seconds=older_than),
+            )
+            abandoned = dict(jobs.values_list("id", "file_path"))
+
+            IngestionJob.objects.filter(id__in=abandoned).update(
+                status=IngestionJob.Status.ABANDONED, updated_at=timezone.now()
+            )
+
+        return list(abandoned.values())
+
+
+class DjangoChunkedUploadRepository(IChunkedUploadRepository[ChunkedUploadDTO]):
+    """
+    DjangoChunkedUploadRepository class.
+
+    The 'updated_at' of an upload is renewed with every chunk, so the uploads left
+    without chunks for longer than the expiry are the abandoned ones.
+    """
+
+    def create(
+        self, owner_id: str, filename: str, file_path: str, size: int
+    ) -> ChunkedUploadDTO:
+        """Create an upload expecting 'size' bytes."""
+        upload = ChunkedUpload.objects.create(
+            owner_id=owner_id, filename=filename, file_path=file_path, size=size
+        )
+
+        return self._to_dto(upload=upload)
+
+    def get(
+        self, id: str, owner_id: str, lock: bool = False
+    ) -> Optional[ChunkedUploadDTO]:
+        """Return an upload of the owner, locking its row until the transaction ends."""
+        uploads = (
+            ChunkedUpload.objects.select_for_update() if lock else ChunkedUpload.objects
+        )
+        upload = uploads.filter(id=id, owner_id=owner_id).first()
+
+        return self._to_dto(upload=upload) if upload is not None else None
+
+    def touch(self, id: str) -> None:
+        """Renew the expiry of an upload."""
+        ChunkedUpload.objects.filter(id=id).update(updated_at=timezone.now())
+
+    def complete(self, id: str, job_id: str) -> None:
+        """Mark an upload as completed by the job ingesting it."""
+        ChunkedUpload.objects.filter(id=id).update(
+            status=ChunkedUpload.Status.COMPLETED,
+            job_id=job_id,
+            updated_at=timezone.now(),
+        )
+
+    def expire(self, older_than: int) -> List[str]:
+        """
+        Delete the uploads without chunks for longer than 'older_than' seconds.
+
+        Returns
+            List[str]: paths of the partial files of the uploads deleted.
+        """
+        with transaction.atomic():
+            uploads = ChunkedUpload.objects.select_for_update(skip_locked=True).filter(
+                status=ChunkedUpload.Status.UPLOADING,
+                updated_at__lt=timezone.now() - timedelta(seconds=older_than),
+            )
+            expired = dict(uploads.values_list("id", "file_path"))
+
+            ChunkedUpload.objects.filter(id__in=expired).delete()
+
+        return list(expired.values())
+
+    @staticmethod
+    def _to_dto(upload: ChunkedUpload) -> ChunkedUploadDTO:
+        """Return the DTO of an upload."""
+        return ChunkedUploadDTO(
+            id=str(upload.id),
+            owner=str(upload.owner_id),
+            filename=upload.filename,
+            file_path=upload.file_path,
+            size=upload.size,
+            status=upload.status,
+            job_id=str(upload.job_id) if upload.job_id else None,
+        )
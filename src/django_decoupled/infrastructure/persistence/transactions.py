@@ -0,0 +1,18 @@
+"""Transactions module."""
+from typing import Callable, ContextManager
+
+from django.db import transaction
+
+from ...application.interfaces import IUnitOfWork
+
+
+class DjangoUnitOfWork(IUnitOfWork):
+    """DjangoUnitOfWork class."""
+
+    def atomic(self) -> ContextManager[None]:
+        """Return a database transaction, rolled back if its context fails."""
+        return transaction.atomic()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Call the callback once the outermost transaction is committed."""
+        transaction.on_commit(callback)
@@ -1,13 +1,20 @@
 """Finders module."""
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from django_decoupled.application.dtos import CategoryDTO, DocumentDTO, WorkspaceDTO
-from django_decoupled.application.interfaces import IDBSerializer, IFinder
+from django_decoupled.application.interfaces import (
+    ICollectionLoader,
+    IDBSerializer,
+    IFinder,
+    IWorkspaceFinder,
+)
 
 from .models import Category, Document, Workspace
 
 
-class DjangoWorkspaceFinder(IFinder[WorkspaceDTO]):
+class DjangoWorkspaceFinder(
+    IWorkspaceFinder[WorkspaceDTO], ICollectionLoader[CategoryDTO, DocumentDTO]
+):
     """DjangoWorkspaceFinder class."""
 
     _workspace_serializer: IDBSerializer[Workspace, WorkspaceDTO]
@@ -39,6 +46,61 @@ class DjangoWorkspaceFinder(IFinder[WorkspaceDTO]):
             else None
         )
 
+    def get_by_name_without_documents(
+        self, name: str, owner_id: str
+    ) -> Optional[WorkspaceDTO]:
+        """Get a Workspace by name, with its categories but without documents."""
+        workspace = Workspace.objects.filter(name=name, owner=owner_id).first()
+
+        if workspace is None:
+            return None
+
+        return WorkspaceDTO(
+            id=str(workspace.id),
+            name=workspace.name,
+            owner=str(workspace.owner_id),
+            categories=self.load_categories(workspace_id=str(workspace.id)),
+            model_id=workspace.model_id,
+            metrics=workspace.metrics,
+        )
+
+    def get_without_categories(self, id: str, owner_id: str) -> Optional[WorkspaceDTO]:
+        """Get a Workspace by ID, without its categories."""
+        workspace = Workspace.objects.filter(id=id, owner=owner_id).first()
+
+        if workspace is None:
+            return None
+
+        return WorkspaceDTO(
+            id=str(workspace.id),
+            name=workspace.name,
+            owner=str(workspace.owner_id),
+            categories=None,
+            model_id=workspace.model_id,
+            metrics=workspace.metrics,
+        )
+
+    def load_categories(self, workspace_id: str) -> List[CategoryDTO]:
+        """Return the categories of a workspace, without their documents."""
+        return [
+            CategoryDTO(
+                id=str(category.id),
+                name=category.name,
+                workspace_id=str(category.workspace_id),
+                documents=None,
+            )
+            for category in Category.objects.filter(workspace_id=workspace_id)
+        ]
+
+    def load_documents(self, category_id: str) -> Iterator[DocumentDTO]:
+        """Yield the documents of a category."""
+        for document_id, text in (
+            Document.objects.filter(category_id=category_id)
+            .values_list("id", "text")
+            .iterator()
+        ):
+            yield DocumentDTO(id=str(document_id), text=text, category_id=category_id)
+
     def get_all(self, owner_id: str) -> List[WorkspaceDTO]:
         """Get all workspaces by onwer ID."""
         workspaces = Workspace.objects.filter(owner=owner_id)
@@ -0,0 +1,252 @@
+"""Mappers module."""
+from functools import partial
+from typing import Any, Dict, Iterator, Optional, Tuple
+from uuid import UUID
+
+from django.db import transaction
+
+from ....application.exceptions import (
+    WorkspaceAlreadyExistsError,
+    WorkspaceDoesNotExistsError,
+)
+from ....application.interfaces import IAggregateMapper, IEventPublisher
+from ....domain.models.workspaces import Category as DomainCategory
+from ....domain.models.workspaces import (
+    CategoryCollection,
+    CategoryId,
+    CategoryName,
+    LazyCategoryCollection,
+    LazyDocumentCollection,
+    WorkspaceId,
+    WorkspaceMetrics,
+    WorkspaceModelId,
+    WorkspaceName,
+    WorkspaceOwnerId,
+)
+from ....domain.models.workspaces import Workspace as DomainWorkspace
+from .models import Category, Document, Workspace
+
+_WORKSPACE_FIELDS = ("id", "name", "owner_id", "model_id", "metrics")
+
+
+class DjangoWorkspaceMapper(IAggregateMapper[DomainWorkspace]):
+    """
+    DjangoWorkspaceMapper class.
+
+    Builds domain workspaces from the rows of 'values()' queries, and writes them
+    back, with the native UUIDs of the database. The DTOs, with their string IDs,
+    are left to the application boundary.
+
+    The workspaces are returned with lazy collections, so a document is only read
+    when its category is used. The events recorded by a saved workspace are
+    published once the transaction commits.
+
+    With content-addressed document IDs, a new document whose ID is already stored
+    is skipped. Otherwise an ID conflict is an error.
+    """
+
+    _publisher: Optional[IEventPublisher]
+    _content_addressed_ids: bool
+
+    def __init__(
+        self,
+        publisher: Optional[IEventPublisher] = None,
+        content_addressed_ids: bool = False,
+    ) -> None:
+        """Class constructor."""
+        self._publisher = publisher
+        self._content_addressed_ids = content_addressed_ids
+
+    def get(self, id: str, owner_id: str) -> Optional[DomainWorkspace]:
+        """Get a Workspace by ID, loading its categories on first access."""
+        row = (
+            Workspace.objects.filter(id=id, owner=owner_id)
+            .values(*_WORKSPACE_FIELDS)
+            .first()
+        )
+
+        return self._to_domain(row=row, categories=None)
+
+    def get_by_name(self, name: str, owner_id: str) -> Optional[DomainWorkspace]:
+        """Get a Workspace by name, loading the documents of a category on access."""
+        row = (
+            Workspace.objects.filter(name=name, owner=owner_id)
+            .values(*_WORKSPACE_FIELDS)
+            .first()
+        )
+
+        if row is None:
+            return None
+
+        return self._to_domain(
+            row=row,
+            categories=CategoryCollection(
+                items=list(self._load_categories(workspace_id=row["id"]))
+            ),
+        )
+
+    def save(self, aggregate: DomainWorkspace) -> None:
+        """Save a new Workspace with its categories and documents."""
+        if Workspace.objects.filter(
+            name=aggregate.name.value, owner_id=aggregate.owner.value
+        ).exists():
+            raise WorkspaceAlreadyExistsError(message=str(aggregate.id.value))
+
+        Workspace.objects.create(**self._workspace_fields(workspace=aggregate))
+        Category.objects.bulk_create(
+            [
+                Category(
+                    id=category.id.value,
+                    name=category.name.value,
+                    workspace_id=aggregate.id.value,
+                )
+                for category in aggregate.categories.values()
+            ]
+        )
+        Document.objects.bulk_create(
+            [
+                Document(id=document_id, text=text, category_id=category.id.value)
+                for category in aggregate.categories.values()
+                for document_id, text in category.documents.rows()
+            ],
+            ignore_conflicts=self._content_addressed_ids,
+        )
+        self._publish_events(aggregate=aggregate)
+
+    def update(self, aggregate: DomainWorkspace) -> None:
+        """
+        Update a Workspace.
+
+        Only the documents added, removed or whose text changed are written, and
+        the categories or documents that were never loaded are left as they are
+        stored.
+        """
+        fields = self._workspace_fields(workspace=aggregate)
+
+        if not Workspace.objects.filter(
+            name=fields["name"], owner_id=fields["owner_id"]
+        ).exists():
+            raise WorkspaceDoesNotExistsError(message=str(aggregate.id.value))
+
+        Workspace.objects.update_or_create(id=fields.pop("id"), defaults=fields)
+
+        if aggregate.categories.is_loaded:
+            self._update_categories(aggregate=aggregate)
+
+        self._publish_events(aggregate=aggregate)
+
+    def _update_categories(self, aggregate: DomainWorkspace) -> None:
+        """
+        Update the loaded categories, writing only the documents that changed.
+
+        A category whose documents were never loaded has not changed, so it is not
+        written at all.
+        """
+        for category in aggregate.categories.values():
+            if not category.documents.is_loaded:
+                continue
+
+            category_db, category_created = Category.objects.update_or_create(
+                id=category.id.value,
+                defaults={
+                    "name": category.name.value,
+                    "workspace_id": aggregate.id.value,
+                },
+            )
+
+            stored = (
+                {}
+                if category_created
+                else dict(category_db.documents.values_list("id", "text"))
+            )
+            rows = dict(category.documents.rows())
+
+            if stored.keys() - rows.keys():
+                Document.objects.filter(id__in=stored.keys() - rows.keys()).delete()
+
+            Document.objects.bulk_create(
+                [
+                    Document(id=document_id, text=text, category_id=category.id.value)
+                    for document_id, text in rows.items()
+                    if document_id not in stored
+                ],
+                ignore_conflicts=self._content_addressed_ids,
+            )
+            Document.objects.bulk_update(
+                [
+                    Document(id=document_id, text=text, category_id=category.id.value)
+                    for document_id, text in rows.items()
+                    if document_id in stored and stored[document_id] != text
+                ],
+                fields=["text"],
+            )
+
+    def _publish_events(self, aggregate: DomainWorkspace) -> None:
+        """Publish the events recorded by the workspace after the commit."""
+        events = aggregate.pull_events()
+
+        if events and self._publisher is not None:
+            transaction.on_commit(partial(self._publisher.publish, events=events))
+
+    def _to_domain(
+        self,
+        row: Optional[Dict[str, Any]],
+        categories: Optional[CategoryCollection],
+    ) -> Optional[DomainWorkspace]:
+        """Build a domain Workspace from a row, with lazy categories if not given."""
+        if row is None:
+            return None
+
+        workspace_id = row["id"]
+
+        return DomainWorkspace(
+            id=WorkspaceId(value=workspace_id),
+            name=WorkspaceName(value=row["name"]),
+            owner_id=WorkspaceOwnerId(value=row["owner_id"]),
+            categories=LazyCategoryCollection(
+                loader=lambda: self._load_categories(workspace_id=workspace_id)
+            )
+            if categories is None
+            else categories,
+            model_id=WorkspaceModelId(value=row["model_id"])
+            if row["model_id"] is not None
+            else None,
+            metrics=WorkspaceMetrics(value=row["metrics"] or {}),
+        )
+
+    def _load_categories(self, workspace_id: UUID) -> Iterator[DomainCategory]:
+        """Yield the categories of a workspace, loading their documents on access."""
+        for category_id, name in Category.objects.filter(
+            workspace_id=workspace_id
+        ).values_list("id", "name"):
+            yield DomainCategory(
+                id=CategoryId(value=category_id),
+                name=CategoryName(value=name),
+                workspace_id=WorkspaceId(value=workspace_id),
+                documents=LazyDocumentCollection(
+                    category_id=CategoryId(value=category_id),
+                    loader=partial(self._load_documents, category_id=category_id),
+                ),
+            )
+
+    @staticmethod
+    def _load_documents(category_id: UUID) -> Iterator[Tuple[UUID, str]]:
+        """Yield the ID and text of every document of a category."""
+        return (
+            Document.objects.filter(category_id=category_id)
+            .values_list("id", "text")
+            .iterator()
+        )
+
+    @staticmethod
+    def _workspace_fields(workspace: DomainWorkspace) -> Dict[str, Any]:
+        """Return the fields of the row of a workspace."""
+        return {
+            "id": workspace.id.value,
+            "name": workspace.name.value,
+            "owner_id": workspace.owner.value,
+            "model_id": workspace.model_id.value
+            if workspace.model_id is not None
+            else None,
+            "metrics": workspace.metrics.value,
+        }
@@ -1,16 +1,14 @@
 """Workspace models module."""
-import uuid
-
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from ....application.identifiers import uuid7
+
 
 class Document(models.Model):
     """Document model class."""
 
-    id = models.UUIDField(
-        primary_key=True, default=uuid.uuid4, unique=True, editable=False
-    )
+    id = models.UUIDField(primary_key=True, default=uuid7, unique=True, editable=False)
     text = models.TextField(_("text"), null=False, blank=False)
 
     category = models.ForeignKey(
@@ -37,9 +35,7 @@ class Document(models.Model):
 class Category(models.Model):
     """Category model class."""
 
-    id = models.UUIDField(
-        primary_key=True, default=uuid.uuid4, unique=True, editable=False
-    )
+    id = models.UUIDField(primary_key=True, default=uuid7, unique=True, editable=False)
     name = models.CharField(_("name"), max_length=150, null=False, blank=False)
 
     workspace = models.ForeignKey(
@@ -66,9 +62,7 @@ class Category(models.Model):
 class Workspace(models.Model):
     """Workspace model class."""
 
-    id = models.UUIDField(
-        primary_key=True, default=uuid.uuid4, unique=True, editable=False
-    )
+    id = models.UUIDField(primary_key=True, default=uuid7, unique=True, editable=False)
     name = models.CharField(_("name"), max_length=150, null=False, blank=False)
 
     owner = models.ForeignKey(
@@ -1,90 +1,121 @@
 """Repositories module."""
-import uuid
-from dataclasses import asdict
-from typing import List
+from typing import Iterator, List, Tuple
 from uuid import UUID
 
 from ....application.dtos import CategoryDTO, DocumentDTO, WorkspaceDTO
 from ....application.exceptions import (
     WorkspaceAlreadyExistsError,
-    WorkspaceDoesNotExistsError,
+    WorkspaceNotLoadedError,
+)
+from ....application.identifiers import uuid7
+from ....application.interfaces import (
+    IBulkRepository,
+    IDBSerializer,
+    IFinder,
+    IRepository,
 )
-from ....application.interfaces import IDBSerializer, IFinder, IRepository
 from .models import Category, Document, Workspace
 
 
-class DjangoWorkspaceRepository(IRepository[WorkspaceDTO]):
-    """DjangoWorkspaceRepository class."""
+class DjangoWorkspaceRepository(
+    IRepository[WorkspaceDTO], IBulkRepository[CategoryDTO, DocumentDTO]
+):
+    """
+    DjangoWorkspaceRepository class.
+
+    With content-addressed document IDs, a document whose ID is already stored has
+    the same text, so it is skipped. Otherwise an ID conflict is an error.
+    """
 
     _workspace_finder: IFinder[WorkspaceDTO]
     _workspace_serializer: IDBSerializer[Workspace, WorkspaceDTO]
     _category_serializer: IDBSerializer[Category, CategoryDTO]
     _document_serializer: IDBSerializer[Document, DocumentDTO]
+    _content_addressed_ids: bool
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         workspace_finder: IFinder[WorkspaceDTO],
         workspace_serializer: IDBSerializer[Workspace, WorkspaceDTO],
         category_serializer: IDBSerializer[Category, CategoryDTO],
         document_serializer: IDBSerializer[Document, DocumentDTO],
+        content_addressed_ids: bool = False,
     ) -> None:
         """Class constructor."""
         self._workspace_finder = workspace_finder
         self._workspace_serializer = workspace_serializer
         self._category_serializer = category_serializer
         self._document_serializer = document_serializer
+        self._content_addressed_ids = content_addressed_ids
 
     @staticmethod
     def generate_uuid() -> UUID:
-        """Generate an uuid."""
-        return uuid.uuid4()
+        """Generate a time-ordered uuid, so the new rows are inserted together."""
+        return uuid7()
 
     def save(self, workspace: WorkspaceDTO) -> None:
-        """Save a workspace obj in the database."""
+        """
+        Save a workspace obj in the database.
+
+        A new workspace has nothing stored to fall back on, so all of its categories
+        and documents must be loaded.
+        """
         if self._workspace_finder.exists(name=workspace.name, owner_id=workspace.owner):
             raise WorkspaceAlreadyExistsError(message=workspace.id)
 
-        workspace_db = self._workspace_serializer.deserialize(workspace)
-        workspace_db.save()
+        if workspace.categories is None:
+            raise WorkspaceNotLoadedError(message=workspace.id)
 
         categories: List[Category] = []
         documents: List[Document] = []
 
         for category in workspace.categories:
+            if category.documents is None:
+                raise WorkspaceNotLoadedError(message=workspace.id)
+
             categories.append(self._category_serializer.deserialize(category))
             for document in category.documents:
                 documents.append(self._document_serializer.deserialize(document))
 
+        workspace_db = self._workspace_serializer.deserialize(workspace)
+        workspace_db.save()
+
         Category.objects.bulk_create(categories)
-        Document.objects.bulk_create(documents)
+        Document.objects.bulk_create(
+            documents, ignore_conflicts=self._content_addressed_ids
+        )
 
-    def update(self, workspace: WorkspaceDTO) -> None:
-        """Update a workspace object in the database."""
-        if not self._workspace_finder.exists(
-            name=workspace.name, owner_id=workspace.owner
-        ):
-            raise WorkspaceDoesNotExistsError(message=workspace.id)
-
-        Workspace.objects.update_or_create(
-            id=workspace.id,
-            defaults={
-                "name": workspace.name,
-                "owner_id": workspace.owner,
-                "model_id": workspace.model_id,
-                "metrics": workspace.metrics,
-            },
+    def save_categories(self, categories: List[CategoryDTO]) -> None:
+        """Save a batch of categories in the database."""
+        Category.objects.bulk_create(
+            [self._category_serializer.deserialize(category) for category in categories]
         )
 
-        for category in workspace.categories:
-            category_db, category_created = Category.objects.update_or_create(
-                id=category.id,
-                defaults={"name": category.name, "workspace_id": category.workspace_id},
-            )
-
-            if not category_created:
-                category_db.documents.all().delete()
-
-            documents = [
-                Document(**asdict(document)) for document in category.documents
-            ]
-            Document.objects.bulk_create(documents)
+    def save_documents(self, documents: List[DocumentDTO]) -> None:
+        """
+        Save a batch of documents in the database.
+
+        With content-addressed IDs the documents already stored are skipped, so
+        ingesting the same documents again is a no-op.
+        """
+        Document.objects.bulk_create(
+            [self._document_serializer.deserialize(document) for document in documents],
+            ignore_conflicts=self._content_addressed_ids,
+        )
+
+    def delete_documents(self, category_id: str) -> None:
+        """Delete all the documents of a category."""
+        Document.objects.filter(category_id=category_id).delete()
+
+    def delete_documents_by_id(self, ids: List[str]) -> None:
+        """Delete a batch of documents by ID."""
+        Document.objects.filter(id__in=ids).delete()
+
+    def iter_document_texts(self, category_id: str) -> Iterator[Tuple[str, str]]:
+        """Yield the text and ID of every document of a category."""
+        for text, document_id in (
+            Document.objects.filter(category_id=category_id)
+            .values_list("text", "id")
+            .iterator()
+        ):
+            yield text, str(document_id)
@@ -1,6 +1,12 @@
 """Serializers module."""
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import Callable, Dict, List
+from uuid import UUID
 
-from ....application.dtos import CategoryDTO, DocumentDTO, WorkspaceDTO
+from django.db.models import Count
+
+from ....application.dtos import CategoryDTO, DocumentDTO, LazySequence, WorkspaceDTO
 from ....application.interfaces import IDBSerializer
 from .models import Category, Document, Workspace
 
@@ -37,15 +43,18 @@ class CategoryDBSerializer(IDBSerializer[Category, CategoryDTO]):
         self._document_serializer = document_serializer
 
     def serialize(self, database_obj: Category) -> CategoryDTO:
-        """Serialize a database object into a CategoryDTO."""
+        """Serialize a database object into a CategoryDTO, reading its documents on use."""
         return CategoryDTO(
             id=str(database_obj.id),
             name=database_obj.name,
             workspace_id=str(database_obj.workspace_id),
-            documents=[
-                self._document_serializer.serialize(database_obj=document)
-                for document in database_obj.documents.all()
-            ],
+            documents=LazySequence(
+                loader=lambda: [
+                    self._document_serializer.serialize(database_obj=document)
+                    for document in database_obj.documents.all()
+                ],
+                length=database_obj.documents.count,
+            ),
         )
 
     def deserialize(self, dto: CategoryDTO) -> Category:
@@ -88,3 +97,100 @@ class WorkspaceDBSerializer(IDBSerializer[Workspace, WorkspaceDTO]):
             model_id=dto.model_id,
             metrics=dto.metrics,
         )
+
+
+class FlatCategoryDBSerializer(CategoryDBSerializer):
+    """
+    FlatCategoryDBSerializer class.
+
+    Reads the ID and text of the documents of a category, in their usual order,
+    instead of building and serializing a model instance per row.
+    """
+
+    def serialize(self, database_obj: Category) -> CategoryDTO:
+        """Serialize a database object into a CategoryDTO, reading its documents on use."""
+        category_id = str(database_obj.id)
+
+        return CategoryDTO(
+            id=category_id,
+            name=database_obj.name,
+            workspace_id=str(database_obj.workspace_id),
+            documents=LazySequence(
+                loader=lambda: [
+                    DocumentDTO(id=str(document_id), text=text, category_id=category_id)
+                    for document_id, text in database_obj.documents.values_list(
+                        "id", "text"
+                    )
+                ],
+                length=database_obj.documents.count,
+            ),
+        )
+
+
+class FlatWorkspaceDBSerializer(WorkspaceDBSerializer):
+    """
+    FlatWorkspaceDBSerializer class.
+
+    Reads the documents of all the categories of a workspace in a single query,
+    instead of a query per category, grouping them by category in a flat loop. The
+    query runs when the documents of any category are first used, and the number of
+    documents of every category is read along with the categories.
+    """
+
+    def serialize(self, database_obj: Workspace) -> WorkspaceDTO:
+        """Serialize a database object into a WorkspaceDTO."""
+        workspace_id = str(database_obj.id)
+        documents = lru_cache(maxsize=None)(
+            partial(self._group_documents, workspace_id=database_obj.id)
+        )
+        categories = []
+
+        for category_id, name, documents_count in database_obj.categories.annotate(
+            documents_count=Count("documents")
+        ).values_list("id", "name", "documents_count"):
+            categories.append(
+                CategoryDTO(
+                    id=str(category_id),
+                    name=name,
+                    workspace_id=workspace_id,
+                    documents=LazySequence(
+                        loader=partial(
+                            _category_documents,
+                            documents=documents,
+                            category_id=str(category_id),
+                        ),
+                        length=documents_count,
+                    ),
+                )
+            )
+
+        return WorkspaceDTO(
+            id=workspace_id,
+            name=database_obj.name,
+            owner=str(database_obj.owner_id),
+            categories=categories,
+            model_id=str(database_obj.model_id),
+            metrics=database_obj.metrics,
+        )
+
+    @staticmethod
+    def _group_documents(workspace_id: UUID) -> Dict[str, List[DocumentDTO]]:
+        """Return the documents of a workspace, by the ID of their category."""
+        documents: Dict[str, List[DocumentDTO]] = defaultdict(list)
+
+        for category_uuid, document_id, text in Document.objects.filter(
+            category__workspace_id=workspace_id
+        ).values_list("category_id", "id", "text"):
+            category_id = str(category_uuid)
+            documents[category_id].append(
+                DocumentDTO(id=str(document_id), text=text, category_id=category_id)
+            )
+
+        return documents
+
+
+def _category_documents(
+    documents: Callable[[], Dict[str, List[DocumentDTO]]], category_id: str
+) -> List[DocumentDTO]:
+    """Return the documents of a category from the documents of its workspace."""
+    return documents().get(category_id, [])
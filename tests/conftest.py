@@ -0,0 +1,73 @@
+"""Shared fixtures of the tests."""
+import io
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+import xlsxwriter
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+Rows = List[Tuple[Optional[str], Optional[str]]]
+
+
+def build_workbook(
+    sheets: Dict[str, Rows], name: str = "file.xlsx"
+) -> SimpleUploadedFile:
+    """
+    Return an uploaded xlsx file with a sheet per item.
+
+    The first row of every sheet is the header, and the rows are the category and
+    the text of a document.
+    """
+    content = io.BytesIO()
+    workbook = xlsxwriter.Workbook(content, {"in_memory": True})
+
+    for sheet_name, rows in sheets.items():
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, ["Category", "Text"])
+
+        for row_number, row in enumerate(rows, start=1):
+            worksheet.write_row(row_number, 0, row)
+
+    workbook.close()
+
+    return SimpleUploadedFile(name, content.getvalue())
+
+
+@pytest.fixture
+def workbook():
+    """Return the builder of uploaded xlsx files."""
+    return build_workbook
+
+
+@pytest.fixture
+def owner(django_user_model):
+    """Return a stored user owning the workspaces."""
+    return django_user_model.objects.create_user(
+        email="owner@example.com",
+        password="password",
+        first_name="first",
+        last_name="last",
+    )
+
+
+@pytest.fixture
+def stored():
+    """Return the reader of the stored workspaces of an owner."""
+    # pylint: disable=import-outside-toplevel
+    from django_decoupled.infrastructure.persistence.workspaces.models import Document
+
+    def read(owner) -> Dict[str, Dict[str, List[str]]]:
+        """Return the sorted texts of every category of every workspace, by name."""
+        workspaces: Dict[str, Dict[str, List[str]]] = {}
+
+        for workspace, category, text in Document.objects.filter(
+            category__workspace__owner=owner
+        ).values_list("category__workspace__name", "category__name", "text"):
+            workspaces.setdefault(workspace, {}).setdefault(category, []).append(text)
+
+        return {
+            workspace: {name: sorted(texts) for name, texts in categories.items()}
+            for workspace, categories in workspaces.items()
+        }
+
+    return read
@@ -0,0 +1,170 @@
+"""Ingestion budgets tests module."""
+import io
+
+import pytest
+
+from django_decoupled.application.budgets import IngestionGuard
+from django_decoupled.application.commands import (
+    CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
+    StreamWorkspacesFromUploadExcelFileCommand,
+)
+from django_decoupled.application.dtos import (
+    FileCategory,
+    FileRow,
+    FileWorkspace,
+    IngestionBudget,
+    SheetMetadata,
+)
+from django_decoupled.application.exceptions import IngestionBudgetExceededError
+from django_decoupled.dependency_injection.containers import container
+from django_decoupled.infrastructure.persistence.ingestion.finders import (
+    DjangoIngestionBudgetFinder,
+)
+from django_decoupled.infrastructure.persistence.ingestion.models import (
+    IngestionBudget as IngestionBudgetModel,
+)
+
+
+def row(workspace="workspace", category="category", number=2):
+    """Return a row of a file."""
+    return FileRow(workspace=workspace, category=category, text="text", row=number)
+
+
+def test_file_size_is_checked_without_reading_the_file():
+    """The file is rewound after its size is checked."""
+    guard = IngestionGuard(budget=IngestionBudget(max_file_size=10))
+    file = io.BytesIO(b"x" * 10)
+
+    guard.check_file(file=file)
+
+    assert file.tell() == 0
+
+    with pytest.raises(IngestionBudgetExceededError) as error:
+        guard.check_file(file=io.BytesIO(b"x" * 11))
+
+    assert (
+        error.value.message == "The upload exceeds the maximum file size allowed (10)."
+    )
+
+
+def test_an_empty_budget_has_no_limits():
+    """A limit of None is not checked."""
+    guard = IngestionGuard(budget=IngestionBudget())
+
+    guard.check_file_size(size=10**12)
+    guard.check_sheets(sheets=[SheetMetadata(name=str(i)) for i in range(100)])
+
+    assert len(list(guard.guard_rows(row(number=i) for i in range(1000)))) == 1000
+
+
+@pytest.mark.parametrize(
+    "budget, rows",
+    [
+        (IngestionBudget(max_rows=2), [row(), row(), row()]),
+        (IngestionBudget(max_sheets=1), [row(), row(workspace="other")]),
+        (IngestionBudget(max_categories=1), [row(), row(category="other")]),
+    ],
+)
+def test_streamed_rows_are_aborted_at_the_first_row_over_budget(budget, rows):
+    """The rows before the one over budget are yielded, and the rest never read."""
+    consumed = []
+
+    def read():
+        for file_row in rows + [row(workspace="never read")]:
+            consumed.append(file_row)
+            yield file_row
+
+    guarded = IngestionGuard(budget=budget).guard_rows(read())
+
+    with pytest.raises(IngestionBudgetExceededError):
+        for _ in guarded:
+            pass
+
+    assert len(consumed) == len(rows)
+
+
+def test_parsed_workspaces_are_checked_before_being_processed():
+    """The categories and texts of every workspace are added up."""
+    file_workspaces = [
+        FileWorkspace(
+            name=name,
+            categories=[
+                FileCategory(name="a", texts=["1", "2"]),
+                FileCategory(name="b", texts=["3"]),
+            ],
+        )
+        for name in ("first", "second")
+    ]
+
+    IngestionGuard(
+        budget=IngestionBudget(max_sheets=2, max_categories=4, max_rows=6)
+    ).check_workspaces(file_workspaces=file_workspaces)
+
+    for budget in (
+        IngestionBudget(max_sheets=1),
+        IngestionBudget(max_categories=3),
+        IngestionBudget(max_rows=5),
+    ):
+        with pytest.raises(IngestionBudgetExceededError):
+            IngestionGuard(budget=budget).check_workspaces(
+                file_workspaces=file_workspaces
+            )
+
+
+def test_declared_sheet_sizes_are_checked_from_the_metadata():
+    """Sheets without a declared size count as empty."""
+    sheets = [SheetMetadata(name="first", rows=5), SheetMetadata(name="second")]
+
+    IngestionGuard(budget=IngestionBudget(max_rows=5)).check_sheets(sheets=sheets)
+
+    with pytest.raises(IngestionBudgetExceededError):
+        IngestionGuard(budget=IngestionBudget(max_rows=4)).check_sheets(sheets=sheets)
+
+
+@pytest.mark.django_db
+def test_the_budget_of_an_owner_overrides_the_default_limits(owner):
+    """The empty limits of a stored budget are the default ones."""
+    finder = DjangoIngestionBudgetFinder(
+        default_budget=IngestionBudget(max_file_size=100, max_rows=10)
+    )
+
+    assert finder.get(owner_id=str(owner.id)) == IngestionBudget(
+        max_file_size=100, max_rows=10
+    )
+
+    IngestionBudgetModel.objects.create(owner=owner, max_rows=20, max_sheets=2)
+
+    assert finder.get(owner_id=str(owner.id)) == IngestionBudget(
+        max_file_size=100, max_rows=20, max_sheets=2
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "handler, command_class",
+    [
+        (
+            container.create_or_update_workspace_from_upload_excel_file_handler,
+            CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
+        ),
+        (
+            container.stream_workspaces_from_upload_excel_file_handler,
+            StreamWorkspacesFromUploadExcelFileCommand,
+        ),
+    ],
+)
+def test_uploads_over_the_budget_of_their_owner_store_nothing(
+    owner, workbook, stored, handler, command_class
+):
+    """Both the parsed and the streamed uploads enforce the budget."""
+    IngestionBudgetModel.objects.create(owner=owner, max_categories=1)
+
+    with pytest.raises(IngestionBudgetExceededError):
+        handler.handle(
+            command_class(
+                file_bytes=workbook({"workspace": [("a", "text"), ("b", "text")]}),
+                owner=str(owner.id),
+            )
+        )
+
+    assert stored(owner) == {}
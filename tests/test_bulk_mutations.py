@@ -0,0 +1,148 @@
+"""Workspace bulk mutations tests module."""
+import pytest
+
+from django_decoupled.application.identifiers import uuid7
+from django_decoupled.domain.events.workspaces import (
+    CategoryAdded,
+    DocumentsAdded,
+    DocumentsReplaced,
+)
+from django_decoupled.domain.exceptions.workspaces import (
+    DocumentTextValidationError,
+    ItemsAlreadyExistError,
+)
+from django_decoupled.domain.models.workspaces import (
+    Category,
+    CategoryCollection,
+    CategoryId,
+    CategoryName,
+    DocumentCollection,
+    DocumentText,
+    Workspace,
+    WorkspaceId,
+    WorkspaceName,
+    WorkspaceOwnerId,
+)
+
+
+def new_category(workspace_id, name):
+    """Return a new category of a workspace, without documents."""
+    return Category(
+        id=CategoryId(value=uuid7()),
+        name=CategoryName(value=name),
+        workspace_id=workspace_id,
+        documents=DocumentCollection(),
+    )
+
+
+@pytest.fixture
+def workspace():
+    """Return a new workspace with a category named 'a'."""
+    workspace_id = WorkspaceId(value=uuid7())
+
+    return Workspace(
+        id=workspace_id,
+        name=WorkspaceName(value="workspace"),
+        owner_id=WorkspaceOwnerId(value=uuid7()),
+        categories=CategoryCollection(items=[new_category(workspace_id, "a")]),
+    )
+
+
+@pytest.fixture
+def category(workspace):
+    """Return the category of the workspace."""
+    return workspace.categories.get_by_name(name="a")
+
+
+def test_categories_are_added_in_a_batch(workspace):
+    """Every category of the batch records its event."""
+    categories = [new_category(workspace.id, name) for name in ("b", "c")]
+
+    workspace.add_categories(categories=categories)
+
+    assert workspace.categories.has_name(name="b")
+    assert workspace.categories.has_name(name="c")
+    assert workspace.pull_events() == [
+        CategoryAdded(workspace_id=workspace.id, category_id=category.id)
+        for category in categories
+    ]
+
+
+def test_conflicting_categories_add_nothing(workspace, category):
+    """The ID of every stored or repeated category is reported."""
+    new = new_category(workspace.id, "b")
+
+    with pytest.raises(ItemsAlreadyExistError) as error:
+        workspace.add_categories(categories=[new, category, new])
+
+    assert set(error.value.ids) == {new.id, category.id}
+    assert not workspace.categories.has_name(name="b")
+    assert workspace.pull_events() == []
+
+
+def test_documents_are_added_in_a_batch_with_a_single_event(workspace, category):
+    """The event holds the IDs of the batch."""
+    ids = (uuid7(), uuid7())
+
+    workspace.add_documents(category_id=category.id, ids=ids, texts=["a", "b"])
+
+    assert list(category.documents.rows()) == [(ids[0], "a"), (ids[1], "b")]
+    assert workspace.pull_events() == [
+        DocumentsAdded(
+            workspace_id=workspace.id, category_id=category.id, document_ids=ids
+        )
+    ]
+
+
+def test_invalid_document_batches_add_nothing(workspace, category):
+    """A batch with a stored ID or a text too long leaves the category as it was."""
+    stored = uuid7()
+    workspace.add_documents(category_id=category.id, ids=[stored], texts=["text"])
+    workspace.pull_events()
+
+    with pytest.raises(ItemsAlreadyExistError):
+        workspace.add_documents(
+            category_id=category.id, ids=[uuid7(), stored], texts=["a", "b"]
+        )
+
+    with pytest.raises(DocumentTextValidationError):
+        workspace.add_documents(
+            category_id=category.id,
+            ids=[uuid7(), uuid7()],
+            texts=["a", "x" * (DocumentText.MAX_LENGTH + 1)],
+        )
+
+    assert list(category.documents.rows()) == [(stored, "text")]
+    assert workspace.pull_events() == []
+
+
+def test_documents_are_replaced_in_a_batch(workspace, category):
+    """The stored documents are dropped, and a single event recorded."""
+    workspace.add_documents(category_id=category.id, ids=[uuid7()], texts=["old"])
+    workspace.pull_events()
+    ids = (uuid7(),)
+
+    workspace.replace_documents(category_id=category.id, ids=ids, texts=["new"])
+
+    assert list(category.documents.texts()) == ["new"]
+    assert workspace.pull_events() == [
+        DocumentsReplaced(
+            workspace_id=workspace.id, category_id=category.id, document_ids=ids
+        )
+    ]
+
+
+def test_a_batch_repeating_an_id_replaces_nothing(workspace, category):
+    """The repeated ID is reported."""
+    workspace.add_documents(category_id=category.id, ids=[uuid7()], texts=["old"])
+    workspace.pull_events()
+    repeated = uuid7()
+
+    with pytest.raises(ItemsAlreadyExistError) as error:
+        workspace.replace_documents(
+            category_id=category.id, ids=[repeated, repeated], texts=["a", "b"]
+        )
+
+    assert [id.value for id in error.value.ids] == [repeated]
+    assert list(category.documents.texts()) == ["old"]
+    assert workspace.pull_events() == []
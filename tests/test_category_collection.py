@@ -0,0 +1,111 @@
+"""Category collection tests module."""
+import pytest
+
+from django_decoupled.application.identifiers import uuid7
+from django_decoupled.domain.exceptions.workspaces import ItemsAlreadyExistError
+from django_decoupled.domain.models.workspaces import (
+    Category,
+    CategoryCollection,
+    CategoryId,
+    CategoryName,
+    DocumentCollection,
+    LazyCategoryCollection,
+    WorkspaceId,
+)
+
+WORKSPACE_ID = WorkspaceId(value=uuid7())
+
+
+def new_category(name, id=None):
+    """Return a category without documents."""
+    return Category(
+        id=id or CategoryId(value=uuid7()),
+        name=CategoryName(value=name),
+        workspace_id=WORKSPACE_ID,
+        documents=DocumentCollection(),
+    )
+
+
+@pytest.fixture
+def category():
+    """Return the category named 'a' of the collection."""
+    return new_category("a")
+
+
+@pytest.fixture
+def categories(category):
+    """Return a collection with a category named 'a'."""
+    return CategoryCollection(items=[category])
+
+
+def test_categories_are_found_by_name(categories, category):
+    """The name index follows the additions and removals."""
+    other = new_category("b")
+
+    categories.add(item=other)
+
+    assert categories.get_by_name(name="a") is category
+    assert categories.get_by_name(name="b") is other
+
+    categories.remove(id=category.id)
+
+    assert not categories.has_name(name="a")
+
+    with pytest.raises(Exception):
+        categories.get_by_name(name="a")
+
+
+def test_renamed_categories_are_found_by_their_new_name(categories, category):
+    """The old name is free again."""
+    renamed = new_category("renamed", id=category.id)
+
+    categories.update(item=renamed)
+
+    assert categories.get_by_name(name="renamed") is renamed
+    assert not categories.has_name(name="a")
+
+    categories.add(item=new_category("a"))
+
+    assert categories.has_name(name="a")
+
+
+def test_a_stored_name_is_rejected(categories, category):
+    """Adding or renaming to the name of another category changes nothing."""
+    other = new_category("b")
+    categories.add(item=other)
+
+    with pytest.raises(ItemsAlreadyExistError) as error:
+        categories.add(item=new_category("a"))
+
+    with pytest.raises(ItemsAlreadyExistError):
+        categories.update(item=new_category("a", id=other.id))
+
+    assert categories.get_by_name(name="a") is category
+    assert categories.get_by_name(name="b") is other
+    assert len(list(categories.values())) == 2
+    assert error.value.ids[0] not in {category.id, other.id}
+
+
+def test_a_batch_with_a_stored_or_repeated_name_adds_nothing(categories):
+    """The ID of every category taking a name is reported."""
+    first, second, third = new_category("b"), new_category("b"), new_category("a")
+
+    with pytest.raises(ItemsAlreadyExistError) as error:
+        categories.add_many(items=[first, second, third])
+
+    assert error.value.ids == [second.id, third.id]
+    assert not categories.has_name(name="b")
+    assert len(list(categories.values())) == 1
+
+
+def test_collections_are_not_built_with_repeated_names():
+    """Loaded categories are checked too."""
+    with pytest.raises(ItemsAlreadyExistError):
+        CategoryCollection(items=[new_category("a"), new_category("a")])
+
+    categories = LazyCategoryCollection(
+        loader=lambda: [new_category("a"), new_category("a")]
+    )
+
+    with pytest.raises(ItemsAlreadyExistError):
+        categories.has_name(name="a")
@@ -0,0 +1,191 @@
+"""Chunked uploads tests module."""
+import os
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from django_decoupled.dependency_injection.containers import container
+from django_decoupled.infrastructure.persistence.ingestion.models import (
+    ChunkedUpload,
+    IngestionBudget,
+    IngestionJob,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def file_storage(tmp_path, monkeypatch):
+    """Store the uploaded files in a temporary directory."""
+    monkeypatch.setattr(container.ingestion_file_storage, "_directory", str(tmp_path))
+
+    return container.ingestion_file_storage
+
+
+@pytest.fixture
+def uploader(client, owner):
+    """Return the client of the owner."""
+    client.force_login(owner)
+
+    return client
+
+
+def start(client, content, size=None):
+    """Start the upload of some content and return its response."""
+    return client.post(
+        reverse("workspaces:chunked-upload"),
+        {"filename": "file.xlsx", "size": len(content) if size is None else size},
+    )
+
+
+def send(client, upload_id, chunk, offset):
+    """Send a chunk of an upload and return its response."""
+    return client.patch(
+        reverse("workspaces:chunked-upload-detail", kwargs={"pk": upload_id}),
+        data=chunk,
+        content_type="application/octet-stream",
+        HTTP_UPLOAD_OFFSET=str(offset),
+    )
+
+
+def complete(client, upload_id):
+    """Complete an upload and return its response."""
+    return client.post(
+        reverse("workspaces:chunked-upload-complete", kwargs={"pk": upload_id})
+    )
+
+
+def upload(client, content, chunk_size=1024):
+    """Upload some content in chunks and return the ID of the upload."""
+    upload_id = start(client, content).json()["id"]
+
+    for offset in range(0, len(content), chunk_size):
+        assert (
+            send(client, upload_id, content[offset : offset + chunk_size], offset)
+        ).status_code == 200
+
+    return upload_id
+
+
+def test_an_upload_is_resumed_from_the_bytes_received(uploader, workbook):
+    """A chunk not starting at the bytes received is rejected with the offset."""
+    content = workbook({"workspace": [("a", "text")]}).read()
+    upload_id = start(uploader, content).json()["id"]
+
+    assert send(uploader, upload_id, content[:100], 0).json()["offset"] == 100
+
+    response = send(uploader, upload_id, content[:100], 0)
+
+    assert response.status_code == 409
+    assert response.json()["offset"] == 100
+    assert send(uploader, upload_id, content[100:], 100).status_code == 200
+    assert uploader.get(
+        reverse("workspaces:chunked-upload-detail", kwargs={"pk": upload_id})
+    ).json()["offset"] == len(content)
+
+
+def test_chunks_cannot_exceed_the_declared_size(uploader):
+    """The bytes after the declared size are rejected."""
+    upload_id = start(uploader, b"", size=10).json()["id"]
+
+    assert send(uploader, upload_id, b"x" * 11, 0).status_code == 400
+
+
+def test_the_uploads_of_other_owners_are_not_found(uploader, django_user_model):
+    """An upload is only visible to its owner."""
+    upload_id = start(uploader, b"content").json()["id"]
+    uploader.force_login(
+        django_user_model.objects.create_user(
+            email="other@example.com",
+            password="password",
+            first_name="first",
+            last_name="last",
+        )
+    )
+
+    assert send(uploader, upload_id, b"content", 0).status_code == 404
+    assert complete(uploader, upload_id).status_code == 404
+
+
+def test_a_completed_upload_enqueues_a_single_job(uploader, workbook, owner):
+    """Completing an upload again returns the job of the first time."""
+    content = workbook({"workspace": [("a", "text")]}).read()
+    upload_id = upload(uploader, content)
+
+    response = complete(uploader, upload_id)
+
+    assert response.status_code == 202
+    job = IngestionJob.objects.get()
+    assert response.json()["job_id"] == str(job.id)
+    assert job.owner == owner
+    assert complete(uploader, upload_id).json()["job_id"] == str(job.id)
+    assert IngestionJob.objects.count() == 1
+    assert send(uploader, upload_id, b"x", len(content)).status_code == 409
+
+
+def test_an_incomplete_upload_is_not_enqueued(uploader, workbook):
+    """Completing an upload before its last chunk returns the bytes received."""
+    content = workbook({"workspace": [("a", "text")]}).read()
+    upload_id = start(uploader, content).json()["id"]
+    send(uploader, upload_id, content[:100], 0)
+
+    response = complete(uploader, upload_id)
+
+    assert response.status_code == 409
+    assert response.json()["offset"] == 100
+    assert not IngestionJob.objects.exists()
+
+
+def test_an_upload_is_prechecked_before_being_enqueued(uploader):
+    """A file that is not a workbook is rejected on completion."""
+    upload_id = upload(uploader, b"not a workbook")
+
+    response = complete(uploader, upload_id)
+
+    assert response.status_code == 400
+    assert not IngestionJob.objects.exists()
+    assert ChunkedUpload.objects.get(id=upload_id).status == (
+        ChunkedUpload.Status.UPLOADING
+    )
+
+
+def test_an_upload_over_the_budget_is_rejected(uploader, owner, workbook):
+    """The size is checked on start, and the sheets on completion."""
+    IngestionBudget.objects.create(owner=owner, max_file_size=10**6, max_sheets=1)
+
+    assert start(uploader, b"", size=10**6 + 1).status_code == 413
+
+    upload_id = upload(
+        uploader, workbook({"first": [("a", "text")], "second": [("a", "text")]}).read()
+    )
+
+    assert complete(uploader, upload_id).status_code == 413
+    assert not IngestionJob.objects.exists()
+
+
+def test_the_abandoned_uploads_expire_with_their_files(uploader, workbook):
+    """Only the uploads without chunks for longer than the expiry are deleted."""
+    content = workbook({"workspace": [("a", "text")]}).read()
+    old_id = start(uploader, content).json()["id"]
+    send(uploader, old_id, content[:100], 0)
+    ChunkedUpload.objects.filter(id=old_id).update(
+        updated_at=timezone.now() - timedelta(days=2)
+    )
+    recent_id = start(uploader, content).json()["id"]
+    completed_id = upload(uploader, content)
+    complete(uploader, completed_id)
+    ChunkedUpload.objects.filter(id=completed_id).update(
+        updated_at=timezone.now() - timedelta(days=2)
+    )
+    old_path = ChunkedUpload.objects.get(id=old_id).file_path
+
+    call_command("clean_up_ingestion_jobs", uploads_older_than=24 * 60 * 60)
+
+    assert not ChunkedUpload.objects.filter(id=old_id).exists()
+    assert not os.path.exists(old_path)
+    assert ChunkedUpload.objects.filter(id__in=[recent_id, completed_id]).count() == 2
+    assert os.path.exists(ChunkedUpload.objects.get(id=recent_id).file_path)
+    assert os.path.exists(ChunkedUpload.objects.get(id=completed_id).file_path)
@@ -0,0 +1,137 @@
+"""Corpus import tests module."""
+import io
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from django_decoupled.application.exceptions import FileValidationError
+from django_decoupled.controllers.services.file_readers import (
+    CsvFileReader,
+    JsonLinesFileReader,
+    ParallelCorpusReader,
+)
+
+
+def named(content, name):
+    """Return a file with a name."""
+    file = io.BytesIO(content)
+    file.name = name
+
+    return file
+
+
+def rows(file_rows):
+    """Return the workspace, category, text and row of every file row."""
+    return [(row.workspace, row.category, row.text, row.row) for row in file_rows]
+
+
+@pytest.fixture
+def corpus(tmp_path, workbook):
+    """Return a directory with a file of every supported type, and an invalid one."""
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "csv.csv").write_text("Category,Text\na,csv text\n")
+    (tmp_path / "nested" / "jsonl.jsonl").write_text(
+        '{"category": "a", "text": "jsonl text"}\n'
+    )
+    (tmp_path / "xlsx.xlsx").write_bytes(
+        workbook({"xlsx": [("a", "xlsx text")]}).read()
+    )
+    (tmp_path / "invalid.jsonl").write_text("not json\n")
+    (tmp_path / "ignored.txt").write_text("not a corpus file\n")
+
+    return tmp_path
+
+
+def test_csv_files_are_read_as_a_sheet_named_after_the_file():
+    """The header and the rows without category are skipped."""
+    file = named(
+        '\ufeffCategory,Text\na,text 1\n,no category\nb,"text, 2"\nc\n'.encode(),
+        "dir/corpus.csv",
+    )
+
+    assert rows(CsvFileReader().iter_rows(bytes=file)) == [
+        ("corpus", "a", "text 1", 2),
+        ("corpus", "b", "text, 2", 4),
+        ("corpus", "c", None, 5),
+    ]
+    assert not file.closed
+
+
+def test_json_lines_files_are_read_as_a_sheet_named_after_the_file():
+    """Blank lines and objects without category are skipped."""
+    file = named(
+        b'{"category": "a", "text": "caf\\u00e9"}\n\n{"text": "no category"}\n'
+        b'{"category": "b", "text": "text"}\n',
+        "corpus.jsonl",
+    )
+
+    assert rows(JsonLinesFileReader().iter_rows(bytes=file)) == [
+        ("corpus", "a", "café", 1),
+        ("corpus", "b", "text", 4),
+    ]
+
+
+def test_a_line_that_is_not_a_json_object_fails_the_file():
+    """The issue points to the line."""
+    file = named(b'{"category": "a", "text": "text"}\n["a", "text"]\n', "f.jsonl")
+
+    with pytest.raises(FileValidationError) as error:
+        list(JsonLinesFileReader().iter_rows(bytes=file))
+
+    assert error.value.report.issues[0].row == 2
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_corpus_files_are_read_with_the_reader_of_their_extension(corpus, workers):
+    """Parse errors are returned with their file instead of raised."""
+    paths = sorted(
+        str(path) for path in corpus.rglob("*") if path.suffix != "" and path.is_file()
+    )
+
+    files = {
+        file.path.rsplit("/", 1)[-1]: file
+        for file in ParallelCorpusReader().read_files(paths=paths, workers=workers)
+    }
+
+    assert files["ignored.txt"].error == "Unsupported file type '.txt'."
+    assert rows(files["csv.csv"].rows) == [("csv", "a", "csv text", 2)]
+    assert rows(files["xlsx.xlsx"].rows) == [("xlsx", "a", "xlsx text", 2)]
+
+    if workers > 1:
+        assert "not a JSON object" in files["invalid.jsonl"].error
+    else:
+        with pytest.raises(FileValidationError):
+            list(files["invalid.jsonl"].rows)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("workers", [1, 2])
+def test_a_directory_is_imported_into_the_workspaces_of_its_owner(
+    corpus, owner, stored, workers
+):
+    """The failed files are reported, and the rest imported."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    call_command(
+        "import_corpus",
+        str(corpus),
+        owner=owner.email,
+        workers=workers,
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+    assert stored(owner) == {
+        "csv": {"a": ["csv text"]},
+        "jsonl": {"a": ["jsonl text"]},
+        "xlsx": {"a": ["xlsx text"]},
+    }
+    assert "3 files imported, 1 failed: 3 rows" in stdout.getvalue()
+    assert "invalid.jsonl" in stderr.getvalue()
+
+
+@pytest.mark.django_db
+def test_the_owner_of_an_import_must_exist(corpus):
+    """Nothing is imported for an unknown owner."""
+    with pytest.raises(CommandError):
+        call_command("import_corpus", str(corpus), owner="nobody@example.com")
@@ -0,0 +1,203 @@
+"""Document collection tests module."""
+import pytest
+
+from django_decoupled.application.identifiers import uuid7
+from django_decoupled.domain.exceptions.workspaces import (
+    DocumentTextValidationError,
+    DocumentViewUpdateError,
+    ItemsAlreadyExistError,
+)
+from django_decoupled.domain.models.workspaces import (
+    CategoryId,
+    Document,
+    DocumentCollection,
+    DocumentId,
+    DocumentText,
+)
+
+
+@pytest.fixture
+def category_id():
+    """Return the ID of the category of the documents."""
+    return CategoryId(value=uuid7())
+
+
+@pytest.fixture
+def ids():
+    """Return the IDs of ten documents."""
+    return [uuid7() for _ in range(10)]
+
+
+@pytest.fixture
+def documents(category_id, ids):
+    """Return a collection with ten documents."""
+    collection = DocumentCollection()
+    collection.extend(
+        ids=ids, texts=[f"text {i}" for i in range(10)], category_id=category_id
+    )
+
+    return collection
+
+
+def test_documents_are_kept_in_insertion_order(documents, ids):
+    """The columns keep the order in which the documents were added."""
+    assert len(documents) == 10
+    assert [id for id, _ in documents.rows()] == ids
+    assert list(documents.texts()) == [f"text {i}" for i in range(10)]
+    assert [document.id.value for document in documents.values()] == ids
+
+
+def test_get_returns_the_document_by_id(documents, ids, category_id):
+    """Documents are looked up by ID, with their text and category."""
+    document = documents.get(id=DocumentId(value=ids[3]))
+
+    assert document.id.value == ids[3]
+    assert document.text.value == "text 3"
+    assert document.category == category_id
+
+
+def test_get_raises_for_an_unknown_id(documents):
+    """Looking up an ID that is not stored fails."""
+    with pytest.raises(Exception):
+        documents.get(id=DocumentId(value=uuid7()))
+
+
+def test_extend_keeps_the_first_position_and_last_text(category_id):
+    """A repeated ID replaces the text of the document already stored."""
+    first, second = uuid7(), uuid7()
+    collection = DocumentCollection()
+
+    collection.extend(
+        ids=[first, second, first], texts=["a", "b", "c"], category_id=category_id
+    )
+
+    assert list(collection.rows()) == [(first, "c"), (second, "b")]
+
+
+def test_texts_longer_than_the_maximum_are_rejected(category_id):
+    """The texts are validated without building a DocumentText per row."""
+    collection = DocumentCollection()
+
+    with pytest.raises(DocumentTextValidationError):
+        collection.extend(
+            ids=[uuid7()],
+            texts=["x" * (DocumentText.MAX_LENGTH + 1)],
+            category_id=category_id,
+        )
+
+
+def test_remove_leaves_a_hole_until_compaction(documents, ids):
+    """A removed document is skipped by every reader, and can't be looked up."""
+    documents.remove(id=DocumentId(value=ids[2]))
+
+    assert len(documents) == 9
+    assert ids[2] not in [id for id, _ in documents.rows()]
+    assert "text 2" not in list(documents.texts())
+    assert len(list(documents.values())) == 9
+
+    with pytest.raises(Exception):
+        documents.get(id=DocumentId(value=ids[2]))
+
+    # A single removal does not rewrite the columns.
+    assert len(documents._texts) == 10
+
+
+def test_remove_compacts_once_most_rows_are_holes(documents, ids):
+    """Removing more than half of the documents drops the holes."""
+    for id in ids[:6]:
+        documents.remove(id=DocumentId(value=id))
+
+    assert len(documents) == 4
+    assert len(documents._texts) == 4
+    assert [id for id, _ in documents.rows()] == ids[6:]
+    assert documents.get(id=DocumentId(value=ids[8])).text.value == "text 8"
+
+
+def test_removed_documents_can_be_added_again(documents, ids, category_id):
+    """A removed ID is free again, and the document is added at the end."""
+    documents.remove(id=DocumentId(value=ids[0]))
+    documents.add_many(ids=[ids[0]], texts=["again"], category_id=category_id)
+
+    assert len(documents) == 10
+    assert list(documents.rows())[-1] == (ids[0], "again")
+    assert documents.get(id=DocumentId(value=ids[0])).text.value == "again"
+
+
+def test_removed_documents_can_be_added_again_after_compaction(
+    documents, ids, category_id
+):
+    """The index is rebuilt by the compaction, so the removed IDs are free too."""
+    for id in ids[:6]:
+        documents.remove(id=DocumentId(value=id))
+
+    documents.add(
+        item=Document(
+            id=DocumentId(value=ids[1]),
+            text=DocumentText(value="again"),
+            category_id=category_id,
+        )
+    )
+
+    assert len(documents) == 5
+    assert documents.get(id=DocumentId(value=ids[1])).text.value == "again"
+
+
+def test_add_many_adds_nothing_if_any_id_conflicts(documents, ids, category_id):
+    """A batch is added as a whole, reporting every conflicting ID."""
+    new = uuid7()
+
+    with pytest.raises(ItemsAlreadyExistError) as error:
+        documents.add_many(
+            ids=[new, ids[4], new], texts=["a", "b", "c"], category_id=category_id
+        )
+
+    assert {id.value for id in error.value.ids} == {new, ids[4]}
+    assert len(documents) == 10
+
+
+def test_replace_drops_every_stored_document(documents, ids, category_id):
+    """The batch becomes the only content of the collection."""
+    new = uuid7()
+
+    documents.replace(ids=[new, ids[0]], texts=["a", "b"], category_id=category_id)
+
+    assert list(documents.rows()) == [(new, "a"), (ids[0], "b")]
+    assert documents.get(id=DocumentId(value=ids[0])).text.value == "b"
+
+
+def test_update_stores_the_new_text(documents, ids, category_id):
+    """Changes are only stored through update."""
+    documents.update(
+        item=Document(
+            id=DocumentId(value=ids[5]),
+            text=DocumentText(value="updated"),
+            category_id=category_id,
+        )
+    )
+
+    assert documents.get(id=DocumentId(value=ids[5])).text.value == "updated"
+
+
+def test_document_views_are_read_only(documents, ids):
+    """Updating a view fails, as the change would not reach the collection."""
+    document = documents.get(id=DocumentId(value=ids[5]))
+
+    with pytest.raises(DocumentViewUpdateError):
+        document.update_text(text=DocumentText(value="lost"))
+
+    assert documents.get(id=DocumentId(value=ids[5])).text.value == "text 5"
+
+
+def test_extend_keeps_the_index_it_builds(documents, ids, category_id):
+    """Lookups after a bulk addition reuse its index, also for the next batch."""
+    index = documents._index
+
+    assert index is not None
+
+    new = uuid7()
+    documents.extend(ids=[new, ids[0]], texts=["a", "b"], category_id=category_id)
+
+    assert documents._index is index
+    assert len(documents) == 11
+    assert documents.get(id=DocumentId(value=new)).text.value == "a"
+    assert documents.get(id=DocumentId(value=ids[0])).text.value == "b"
@@ -0,0 +1,90 @@
+"""Domain models tests module."""
+import dataclasses
+
+import pytest
+
+from django_decoupled.application.identifiers import uuid7
+from django_decoupled.domain.models.workspaces import (
+    Category,
+    CategoryCollection,
+    CategoryId,
+    CategoryName,
+    Document,
+    DocumentCollection,
+    DocumentId,
+    DocumentText,
+    Workspace,
+    WorkspaceId,
+    WorkspaceMetrics,
+    WorkspaceName,
+    WorkspaceOwnerId,
+)
+
+
+@pytest.fixture
+def workspace():
+    """Return a workspace with a category and a document."""
+    workspace_id = WorkspaceId(value=uuid7())
+    category_id = CategoryId(value=uuid7())
+
+    return Workspace(
+        id=workspace_id,
+        name=WorkspaceName(value="workspace"),
+        owner_id=WorkspaceOwnerId(value=uuid7()),
+        categories=CategoryCollection(
+            items=[
+                Category(
+                    id=category_id,
+                    name=CategoryName(value="category"),
+                    workspace_id=workspace_id,
+                    documents=DocumentCollection(
+                        items=[
+                            Document(
+                                id=DocumentId(value=uuid7()),
+                                text=DocumentText(value="text"),
+                                category_id=category_id,
+                            )
+                        ]
+                    ),
+                )
+            ]
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "value_object",
+    [
+        DocumentText(value="text"),
+        WorkspaceName(value="workspace"),
+        CategoryName(value="category"),
+        WorkspaceMetrics(value={}),
+        DocumentId(value=uuid7()),
+    ],
+)
+def test_value_objects_are_frozen_and_slotted(value_object):
+    """Value objects have no instance dict and can't be changed."""
+    assert not hasattr(value_object, "__dict__")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        value_object.value = None  # type: ignore
+
+
+def test_value_objects_compare_and_hash_by_value():
+    """Two value objects with the same value are the same."""
+    assert DocumentText(value="text") == DocumentText(value="text")
+    assert len({CategoryName(value="a"), CategoryName(value="a")}) == 1
+
+
+def test_entities_and_collections_are_slotted(workspace):
+    """No entity of an aggregate keeps an instance dict."""
+    category = next(iter(workspace.categories.values()))
+    document = next(iter(category.documents.values()))
+
+    for obj in (workspace, workspace.categories, category, category.documents):
+        assert not hasattr(obj, "__dict__")
+
+        with pytest.raises(AttributeError):
+            obj.undeclared = None  # type: ignore
+
+    assert not hasattr(document, "__dict__")
@@ -0,0 +1,158 @@
+"""Domain events tests module."""
+import logging
+
+import pytest
+
+from django_decoupled.application.identifiers import uuid7
+from django_decoupled.dependency_injection.dispatcher import Dispatcher
+from django_decoupled.domain.events import DomainEvent
+from django_decoupled.domain.events.workspaces import (
+    CategoryAdded,
+    DocumentTextChanged,
+    MetricsUpdated,
+    ModelTrained,
+)
+from django_decoupled.domain.models.workspaces import (
+    Category,
+    CategoryCollection,
+    CategoryId,
+    CategoryName,
+    DocumentCollection,
+    DocumentId,
+    DocumentText,
+    Workspace,
+    WorkspaceId,
+    WorkspaceModelId,
+    WorkspaceName,
+    WorkspaceOwnerId,
+)
+from django_decoupled.infrastructure.persistence.workspaces.mappers import (
+    DjangoWorkspaceMapper,
+)
+
+
+def new_category(workspace_id, name="category", texts=()):
+    """Return a new category of a workspace, holding its texts."""
+    category_id = CategoryId(value=uuid7())
+    documents = DocumentCollection()
+    documents.extend(
+        ids=[uuid7() for _ in texts], texts=list(texts), category_id=category_id
+    )
+
+    return Category(
+        id=category_id,
+        name=CategoryName(value=name),
+        workspace_id=workspace_id,
+        documents=documents,
+    )
+
+
+@pytest.fixture
+def workspace_id():
+    """Return the ID of the workspace."""
+    return WorkspaceId(value=uuid7())
+
+
+@pytest.fixture
+def workspace(workspace_id):
+    """Return a new workspace without categories."""
+    return Workspace(
+        id=workspace_id,
+        name=WorkspaceName(value="workspace"),
+        owner_id=WorkspaceOwnerId(value=uuid7()),
+        categories=CategoryCollection(),
+    )
+
+
+def test_workspaces_record_their_changes(workspace, workspace_id):
+    """The events are returned once, in the order of the changes."""
+    category = new_category(workspace_id)
+
+    workspace.add_category(category=category)
+    workspace.set_model_id(model_id="model")
+    workspace.set_metrics(metrics={"accuracy": 1.0})
+
+    assert workspace.pull_events() == [
+        CategoryAdded(workspace_id=workspace_id, category_id=category.id),
+        ModelTrained(
+            workspace_id=workspace_id, model_id=WorkspaceModelId(value="model")
+        ),
+        MetricsUpdated(workspace_id=workspace_id),
+    ]
+    assert workspace.pull_events() == []
+
+
+def test_workspace_updates_the_text_of_a_document(workspace, workspace_id):
+    """The workspace stores the change and records its event."""
+    category = new_category(workspace_id, texts=["text"])
+    workspace.add_category(category=category)
+    workspace.pull_events()
+    document_id = DocumentId(value=next(category.documents.rows())[0])
+
+    workspace.update_document_text(
+        category_id=category.id,
+        document_id=document_id,
+        text=DocumentText(value="updated"),
+    )
+
+    assert category.documents.get(id=document_id).text.value == "updated"
+    assert workspace.pull_events() == [
+        DocumentTextChanged(
+            category_id=category.id,
+            document_id=document_id,
+            text=DocumentText(value="updated"),
+        )
+    ]
+
+
+def test_subscribers_receive_the_events_of_their_type_and_subtypes(
+    workspace_id, caplog
+):
+    """A failing subscriber is logged, and the rest still receive the event."""
+    dispatcher = Dispatcher(handlers={})
+    received = []
+
+    def failing(event):
+        raise RuntimeError(event)
+
+    dispatcher.subscribe(event_type=DomainEvent, subscriber=failing)
+    dispatcher.subscribe(event_type=DomainEvent, subscriber=received.append)
+    dispatcher.subscribe(event_type=ModelTrained, subscriber=received.append)
+
+    with caplog.at_level(logging.ERROR):
+        dispatcher.publish(events=[MetricsUpdated(workspace_id=workspace_id)])
+
+    assert received == [MetricsUpdated(workspace_id=workspace_id)]
+    assert "failed handling" in caplog.text
+
+
+@pytest.mark.django_db
+def test_saved_events_are_published_once_committed(
+    workspace_id, owner, django_capture_on_commit_callbacks
+):
+    """Nothing is published until the transaction of the change commits."""
+    dispatcher = Dispatcher(handlers={})
+    received = []
+    dispatcher.subscribe(event_type=DomainEvent, subscriber=received.append)
+    mapper = DjangoWorkspaceMapper(publisher=dispatcher)
+    workspace = Workspace(
+        id=workspace_id,
+        name=WorkspaceName(value="workspace"),
+        owner_id=WorkspaceOwnerId(value=owner.id),
+        categories=CategoryCollection(),
+    )
+    category = new_category(workspace_id, texts=["text"])
+    workspace.add_category(category=category)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        mapper.save(aggregate=workspace)
+
+        assert received == []
+
+    for callback in callbacks:
+        callback()
+
+    assert received == [
+        CategoryAdded(workspace_id=workspace_id, category_id=category.id)
+    ]
+    assert workspace.pull_events() == []
@@ -0,0 +1,165 @@
+"""File readers tests module."""
+import pandas as pd
+import pytest
+
+from django_decoupled.application.commands import (
+    CreateWorkspaceAndAddDataFromFileCommand,
+)
+from django_decoupled.application.dtos import FileCategory, FileDocument
+from django_decoupled.application.exceptions import (
+    FileValidationError,
+    WorkspaceDoesNotExistsError,
+)
+from django_decoupled.controllers.services import file_readers
+from django_decoupled.controllers.services.file_readers import (
+    ExcelFileReader,
+    ParallelExcelFileReader,
+)
+from django_decoupled.dependency_injection.containers import container
+
+
+def contents(file_workspaces):
+    """Return the categories and texts of every workspace, by name."""
+    return {
+        file_workspace.name: {
+            category.name: category.texts for category in file_workspace.categories
+        }
+        for file_workspace in file_workspaces
+    }
+
+
+@pytest.fixture
+def sheets():
+    """Return the rows of a workbook with three sheets."""
+    return {
+        f"Sheet{sheet}": [
+            (f"category {row % 3}", f"text {sheet} {row}") for row in range(20)
+        ]
+        for sheet in range(3)
+    }
+
+
+def test_parallel_reader_reads_the_same_as_the_sequential_one(workbook, sheets):
+    """Every sheet is parsed in a worker into the same workspace."""
+    file = workbook(sheets)
+
+    parallel = ParallelExcelFileReader(max_workers=3).read_from_bytes(bytes=file)
+    sequential = ExcelFileReader().read_from_bytes(bytes=file)
+
+    assert contents(parallel) == contents(sequential)
+    assert contents(parallel)["Sheet1"]["category 0"] == [
+        f"text 1 {row}" for row in range(0, 20, 3)
+    ]
+
+
+def test_categories_do_not_leak_into_the_following_sheets(workbook):
+    """A sheet only has the categories of its own rows."""
+    file = workbook({"A": [("only a", "text")], "B": [("only b", "text")]})
+
+    for reader in (ExcelFileReader(), ParallelExcelFileReader(max_workers=2)):
+        assert contents(reader.read_from_bytes(bytes=file)) == {
+            "A": {"only a": ["text"]},
+            "B": {"only b": ["text"]},
+        }
+
+
+def test_parallel_reader_reports_the_invalid_values_of_every_sheet(workbook):
+    """The sheets are validated in the workers, and their issues collected."""
+    file = workbook(
+        {"A": [("category", "text"), ("category", " ")], "B": [("category", "")]}
+    )
+
+    with pytest.raises(FileValidationError) as error:
+        ParallelExcelFileReader(max_workers=2).read_from_bytes(bytes=file)
+
+    assert {(issue.sheet, issue.row) for issue in error.value.report.issues} == {
+        ("A", 3),
+        ("B", 2),
+    }
+
+
+def test_parallel_reader_reads_a_single_sheet_without_workers(
+    workbook, sheets, monkeypatch
+):
+    """There is nothing to parallelize with a single sheet or worker."""
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("No worker processes should be started.")
+
+    monkeypatch.setattr(file_readers, "ProcessPoolExecutor", no_pool)
+    file = workbook(sheets)
+
+    assert contents(
+        ParallelExcelFileReader(max_workers=4).read_sheets(bytes=file, names=["Sheet2"])
+    ) == contents(ExcelFileReader().read_sheets(bytes=file, names=["Sheet2"]))
+    assert len(ParallelExcelFileReader(max_workers=1).read_from_bytes(bytes=file)) == 3
+
+
+def test_sheet_names_are_listed_in_the_workbook_order(workbook):
+    """The names come from the workbook metadata."""
+    file = workbook({"second": [("a", "text")], "first": [], "third": [("a", " ")]})
+
+    assert ExcelFileReader().list_sheet_names(bytes=file) == [
+        "second",
+        "first",
+        "third",
+    ]
+
+
+def test_only_the_given_sheets_are_read_and_validated(workbook):
+    """The invalid values of the other sheets are not reported."""
+    file = workbook({"valid": [("a", "text")], "invalid": [("a", " ")]})
+
+    for reader in (ExcelFileReader(), ParallelExcelFileReader(max_workers=2)):
+        assert contents(reader.read_sheets(bytes=file, names=["valid"])) == {
+            "valid": {"a": ["text"]}
+        }
+
+
+@pytest.mark.django_db
+def test_a_workspace_is_created_from_its_sheet_only(owner, workbook, stored):
+    """The other sheets of the file are neither parsed nor stored."""
+    file = workbook({"workspace": [("a", "text")], "other": [("a", " ")]})
+    handler = container.create_workspace_and_add_data_from_excel_handler
+
+    handler.handle(
+        CreateWorkspaceAndAddDataFromFileCommand(
+            workspace_name="workspace", file_bytes=file, owner_id=str(owner.id)
+        )
+    )
+
+    assert stored(owner) == {"workspace": {"a": ["text"]}}
+
+    with pytest.raises(WorkspaceDoesNotExistsError):
+        handler.handle(
+            CreateWorkspaceAndAddDataFromFileCommand(
+                workspace_name="missing", file_bytes=file, owner_id=str(owner.id)
+            )
+        )
+
+
+def test_sheets_are_mapped_to_the_texts_of_every_category():
+    """The texts are taken by column, keeping the order of the sheet."""
+    file_workspace = file_readers.dataframe_to_workspace(
+        workspace_name="workspace",
+        df=pd.DataFrame(
+            {"Category": ["a", "b", "a"], "Text": ["first", "second", "third"]}
+        ),
+    )
+
+    assert contents([file_workspace]) == {
+        "workspace": {"a": ["first", "third"], "b": ["second"]}
+    }
+    assert all(
+        isinstance(category.texts, list) for category in file_workspace.categories
+    )
+
+
+def test_file_categories_still_build_their_documents():
+    """A FileDocument is built per text, for the callers reading documents."""
+    category = FileCategory(name="a", texts=["first", "second"])
+
+    assert category.documents == [
+        FileDocument(text="first"),
+        FileDocument(text="second"),
+    ]
@@ -0,0 +1,145 @@
+"""Fingerprints tests module."""
+import hashlib
+import io
+
+import pytest
+
+from django_decoupled.application.commands import (
+    CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
+    StreamWorkspacesFromUploadExcelFileCommand,
+)
+from django_decoupled.application.fingerprints import (
+    SheetFingerprint,
+    fingerprint_file,
+    fingerprint_workspace,
+)
+from django_decoupled.controllers.services.file_readers import ExcelFileReader
+from django_decoupled.dependency_injection.containers import container
+from django_decoupled.infrastructure.persistence.workspaces.models import Workspace
+
+
+def fingerprint(rows):
+    """Return the fingerprint of some (category, text) rows."""
+    sheet_fingerprint = SheetFingerprint()
+
+    for category, text in rows:
+        sheet_fingerprint.update(category=category, text=text)
+
+    return sheet_fingerprint.hexdigest()
+
+
+def upload(owner, file):
+    """Upload a file through the non-streaming handler."""
+    return container.create_or_update_workspace_from_upload_excel_file_handler.handle(
+        CreateOrUpdateWorkspaceFromUploadExcelFileCommand(
+            file_bytes=file, owner=str(owner.id)
+        )
+    )
+
+
+def test_file_fingerprint_is_its_digest_and_rewinds_the_file():
+    """The file can be read again after being fingerprinted."""
+    file = io.BytesIO(b"content" * 1000)
+    file.read(10)
+
+    assert fingerprint_file(file=file) == hashlib.sha256(b"content" * 1000).hexdigest()
+    assert file.tell() == 0
+
+
+def test_sheet_fingerprint_does_not_depend_on_the_row_order():
+    """Rows streamed or grouped by category give the same fingerprint."""
+    rows = [("a", "text 1"), ("b", "text 2"), ("a", "text 3")]
+
+    assert fingerprint(rows) == fingerprint(reversed(rows))
+    assert fingerprint(rows) != fingerprint(rows + [("a", "text 1")])
+    assert fingerprint(rows) != fingerprint([("b", "text 1")] + rows[1:])
+
+
+def test_sheet_fingerprint_reads_the_cells_as_every_file_reader():
+    """Integers read as floats and empty cells read as NaN hash as openpyxl reads."""
+    assert (
+        fingerprint([(1, 2)]) == fingerprint([(1.0, 2.0)]) == fingerprint([("1", "2")])
+    )
+    assert fingerprint([("a", None)]) == fingerprint([("a", float("nan"))])
+    assert fingerprint([("a", 1.5)]) == fingerprint([("a", "1.5")])
+
+
+def test_workspace_fingerprint_is_the_fingerprint_of_the_streamed_rows(workbook):
+    """The parsed and the streamed sheets of a file have the same fingerprints."""
+    file = workbook(
+        {
+            "first": [("a", "text 1"), ("b", "text 2"), ("a", "text 3")],
+            "second": [("a", "text")],
+        }
+    )
+    streamed = {}
+
+    for row in ExcelFileReader().iter_rows(bytes=file):
+        streamed.setdefault(row.workspace, SheetFingerprint()).update(
+            category=row.category, text=row.text
+        )
+
+    assert {
+        file_workspace.name: fingerprint_workspace(file_workspace=file_workspace)
+        for file_workspace in ExcelFileReader().read_from_bytes(bytes=file)
+    } == {name: sheet.hexdigest() for name, sheet in streamed.items()}
+
+
+@pytest.mark.django_db
+def test_an_unchanged_file_is_skipped(owner, workbook):
+    """Uploading the same file again writes nothing."""
+    file = workbook({"first": [("a", "text")], "second": [("a", "text")]})
+
+    assert upload(owner=owner, file=file).changed
+    assert not upload(owner=owner, file=file).changed
+
+
+@pytest.mark.django_db
+def test_only_the_changed_sheets_are_processed(owner, workbook, stored):
+    """The sheets with the same rows as their last upload are skipped."""
+    upload(
+        owner=owner, file=workbook({"first": [("a", "old")], "second": [("a", "old")]})
+    )
+
+    result = upload(
+        owner=owner,
+        file=workbook({"first": [("a", "old")], "second": [("a", "new")]}),
+    )
+
+    assert result.workspaces_processed == ["second"]
+    assert result.workspaces_skipped == ["first"]
+    assert stored(owner) == {"first": {"a": ["old"]}, "second": {"a": ["new"]}}
+
+
+@pytest.mark.django_db
+def test_a_file_is_processed_again_once_a_workspace_is_deleted(owner, workbook, stored):
+    """The log of a sheet goes with its workspace, so the file is not unchanged."""
+    sheets = {"first": [("a", "text")], "second": [("a", "text")]}
+    upload(owner=owner, file=workbook(sheets))
+    Workspace.objects.filter(name="second").delete()
+
+    result = upload(owner=owner, file=workbook(sheets))
+
+    assert result.workspaces_processed == ["second"]
+    assert stored(owner) == {"first": {"a": ["text"]}, "second": {"a": ["text"]}}
+
+
+@pytest.mark.django_db
+def test_streamed_and_uploaded_files_share_the_ingestion_log(owner, workbook):
+    """The sheets streamed are skipped when uploaded unchanged."""
+    container.stream_workspaces_from_upload_excel_file_handler.handle(
+        StreamWorkspacesFromUploadExcelFileCommand(
+            file_bytes=workbook({"first": [("a", "text"), ("b", "text 2")]}),
+            owner=str(owner.id),
+        )
+    )
+
+    result = upload(
+        owner=owner,
+        file=workbook(
+            {"first": [("a", "text"), ("b", "text 2")], "second": [("a", "text")]}
+        ),
+    )
+
+    assert result.workspaces_processed == ["second"]
+    assert result.workspaces_skipped == ["first"]
@@ -0,0 +1,136 @@
+"""Identifiers tests module."""
+import time
+import uuid
+
+import pytest
+
+from django_decoupled.application import identifiers
+from django_decoupled.application.dtos import FileRow
+from django_decoupled.application.identifiers import (
+    DOCUMENT_IDS_CONTENT,
+    DocumentIdFactory,
+    uuid7,
+)
+from django_decoupled.application.pipelines import WorkspaceIngestionPipeline
+from django_decoupled.dependency_injection.containers import container
+from django_decoupled.infrastructure.persistence.workspaces.models import (
+    Document,
+    Workspace,
+)
+
+
+def test_uuid7_is_a_version_7_rfc_uuid():
+    """The UUIDs have the version and variant bits of RFC 9562."""
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_starts_with_the_unix_time_in_milliseconds():
+    """The first 48 bits are the time the UUID was generated."""
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert before <= value.int >> 80 <= after + 1
+
+
+def test_uuid7_is_strictly_increasing():
+    """UUIDs generated in the same millisecond still sort in generation order."""
+    values = [uuid7() for _ in range(10_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_uuid7_is_strictly_increasing_when_the_counter_overflows(monkeypatch):
+    """Once the counter of a millisecond is used up, the time is moved forward."""
+    now = time.time_ns() + 1_000_000_000
+    monkeypatch.setattr(identifiers.time, "time_ns", lambda: now)
+    # The clock of the module is restored afterwards, as it is now in the future.
+    monkeypatch.setattr(identifiers, "_last_timestamp", identifiers._last_timestamp)
+    monkeypatch.setattr(identifiers, "_counter", identifiers._counter)
+
+    values = [uuid7() for _ in range(5_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert values[-1].int >> 80 > now // 1_000_000
+
+
+@pytest.mark.django_db
+def test_stored_workspaces_get_time_ordered_ids(owner):
+    """The rows created without an ID get a version 7 one."""
+    first = Workspace.objects.create(name="first", owner=owner)
+    second = Workspace.objects.create(name="second", owner=owner)
+
+    assert first.id.version == 7
+    assert first.id < second.id
+
+
+def test_content_addressed_ids_are_derived_from_the_document():
+    """The same text in the same category of a workspace always gets the same ID."""
+    factory = DocumentIdFactory(scheme=DOCUMENT_IDS_CONTENT)
+    workspace_id = str(uuid7())
+
+    first = factory.generate(workspace_id=workspace_id, category_name="a", text="t")
+    second = factory.generate(workspace_id=workspace_id, category_name="a", text="t")
+    other = factory.generate(workspace_id=workspace_id, category_name="b", text="t")
+
+    assert factory.is_content_addressed
+    assert first == second
+    assert first != other
+
+
+def test_time_ordered_ids_are_new_for_every_document():
+    """The default scheme ignores the content of the document."""
+    factory = DocumentIdFactory()
+    workspace_id = str(uuid7())
+
+    first = factory.generate(workspace_id=workspace_id, category_name="a", text="t")
+    second = factory.generate(workspace_id=workspace_id, category_name="a", text="t")
+
+    assert not factory.is_content_addressed
+    assert first.version == 7
+    assert first < second
+
+
+def test_unknown_document_id_schemes_are_rejected():
+    """The scheme comes from the settings, so a typo fails early."""
+    with pytest.raises(ValueError):
+        DocumentIdFactory(scheme="uuid4")
+
+
+@pytest.mark.django_db
+def test_ingesting_the_same_texts_again_with_content_addressed_ids_writes_nothing(
+    owner,
+):
+    """The stored documents keep their IDs, and only the new texts are written."""
+
+    def ingest(texts):
+        return WorkspaceIngestionPipeline(
+            owner=str(owner.id),
+            batch_size=2,
+            workspace_repository=container.workspace_repository,
+            bulk_repository=container.workspace_repository,
+            workspace_finder=container.workspace_finder,
+            workspace_serializer=container.workspace_domain_serializer,
+            category_serializer=container.category_domain_serializer,
+            document_serializer=container.document_domain_serializer,
+            document_ids=DocumentIdFactory(scheme=DOCUMENT_IDS_CONTENT),
+        ).run(
+            rows=[
+                FileRow(workspace="workspace", category="a", text=text, row=row)
+                for row, text in enumerate(texts, start=2)
+            ]
+        )
+
+    assert ingest(["first", "second"]).documents == 2
+    ids = dict(Document.objects.values_list("text", "id"))
+
+    assert ingest(["first", "second", "third"]).documents == 1
+    assert dict(Document.objects.values_list("text", "id")) == {
+        **ids,
+        "third": Document.objects.get(text="third").id,
+    }
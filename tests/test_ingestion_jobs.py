@@ -0,0 +1,255 @@
+"""Ingestion jobs tests module."""
+import os
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from django_decoupled.application.commands import (
+    CleanUpIngestionJobsCommand,
+    ProcessNextIngestionJobCommand,
+    RetryIngestionJobCommand,
+)
+from django_decoupled.application.handlers import (
+    CleanUpIngestionJobsCommandHandler,
+    ProcessNextIngestionJobCommandHandler,
+    RetryIngestionJobCommandHandler,
+)
+from django_decoupled.controllers.services.file_storages import LocalFileStorage
+from django_decoupled.dependency_injection.containers import container
+from django_decoupled.infrastructure.persistence.ingestion.models import IngestionJob
+from django_decoupled.infrastructure.persistence.ingestion.repositories import (
+    DjangoIngestionJobRepository,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+class RecordingJobRepository(DjangoIngestionJobRepository):
+    """Job repository recording every progress update."""
+
+    def __init__(self) -> None:
+        """Class constructor."""
+        super().__init__(lease_timeout=60)
+        self.progress = []
+
+    def update_progress(self, job_id: str, rows_parsed: int, rows_written: int) -> None:
+        """Record the progress and write it."""
+        self.progress.append((rows_parsed, rows_written))
+        super().update_progress(
+            job_id=job_id, rows_parsed=rows_parsed, rows_written=rows_written
+        )
+
+
+@pytest.fixture
+def file_storage(tmp_path):
+    """Return a file storage in a temporary directory."""
+    return LocalFileStorage(directory=str(tmp_path))
+
+
+@pytest.fixture
+def job_repository():
+    """Return a job repository recording the progress of the jobs."""
+    return RecordingJobRepository()
+
+
+@pytest.fixture
+def process_next(job_repository, file_storage):
+    """Return the processor of the next job, streaming the files bigger than 'size'."""
+
+    def process(streaming_min_file_size=10 * 1024 * 1024):
+        """Process the next pending job."""
+        return ProcessNextIngestionJobCommandHandler(
+            job_repository=job_repository,
+            file_storage=file_storage,
+            upload_handler=(
+                container.create_or_update_workspace_from_upload_excel_file_handler
+            ),
+            stream_handler=container.stream_workspaces_from_upload_excel_file_handler,
+            create_workspace_handler=(
+                container.create_workspace_and_add_data_from_excel_handler
+            ),
+            streaming_min_file_size=streaming_min_file_size,
+        ).handle(command=ProcessNextIngestionJobCommand())
+
+    return process
+
+
+def enqueue(job_repository, file_storage, owner, file, workspace_name=None):
+    """Store a file and enqueue the job ingesting it."""
+    return job_repository.enqueue(
+        owner_id=str(owner.id),
+        file_path=file_storage.save(file=file),
+        workspace_name=workspace_name,
+    )
+
+
+def test_jobs_are_claimed_once_until_their_lease_expires(owner, job_repository):
+    """A running job is only claimed again once it has no progress for a lease."""
+    job_id = job_repository.enqueue(owner_id=str(owner.id), file_path="file.xlsx")
+
+    assert job_repository.claim_next().id == job_id
+    assert job_repository.claim_next() is None
+
+    IngestionJob.objects.filter(id=job_id).update(
+        updated_at=timezone.now() - timedelta(seconds=120)
+    )
+
+    assert job_repository.claim_next().id == job_id
+
+
+def test_progress_renews_the_lease_of_a_job(owner, job_repository):
+    """Updating the progress of a job is its heartbeat."""
+    job_id = job_repository.enqueue(owner_id=str(owner.id), file_path="file.xlsx")
+    job_repository.claim_next()
+    IngestionJob.objects.filter(id=job_id).update(
+        updated_at=timezone.now() - timedelta(seconds=120)
+    )
+
+    job_repository.update_progress(job_id=job_id, rows_parsed=10, rows_written=5)
+
+    assert job_repository.claim_next() is None
+    assert IngestionJob.objects.values_list("rows_parsed", "rows_written").get() == (
+        10,
+        5,
+    )
+
+
+def test_uploads_report_their_progress_after_every_workspace(
+    owner, workbook, job_repository, file_storage, process_next, stored
+):
+    """The progress of the non-streaming jobs is reported too."""
+    job_id = enqueue(
+        job_repository,
+        file_storage,
+        owner,
+        workbook(
+            {"first": [("a", "text 1"), ("a", "text 2")], "second": [("a", "other")]}
+        ),
+    )
+
+    assert process_next() == job_id
+
+    job = IngestionJob.objects.get(id=job_id)
+    assert job.status == IngestionJob.Status.SUCCEEDED
+    assert (job.rows_parsed, job.rows_written) == (3, 3)
+    # Parsed, then written a workspace at a time, in no particular order.
+    assert len(job_repository.progress) == 3
+    assert job_repository.progress[0] == (3, 0)
+    assert job_repository.progress[-1] == (3, 3)
+    assert stored(owner) == {
+        "first": {"a": ["text 1", "text 2"]},
+        "second": {"a": ["other"]},
+    }
+
+
+def test_workspace_jobs_report_their_progress(
+    owner, workbook, job_repository, file_storage, process_next
+):
+    """Jobs creating a single workspace report the rows of its sheet."""
+    job_id = enqueue(
+        job_repository,
+        file_storage,
+        owner,
+        workbook({"workspace": [("a", "text 1"), ("a", "text 2")], "other": []}),
+        workspace_name="workspace",
+    )
+
+    process_next()
+
+    job = IngestionJob.objects.get(id=job_id)
+    assert job.status == IngestionJob.Status.SUCCEEDED
+    assert job_repository.progress == [(2, 0), (2, 2)]
+
+
+def test_streamed_jobs_report_their_progress(
+    owner, workbook, job_repository, file_storage, process_next
+):
+    """The progress of a streamed job is its rows parsed and documents written."""
+    job_id = enqueue(
+        job_repository,
+        file_storage,
+        owner,
+        workbook({"workspace": [("a", f"text {i}") for i in range(3)]}),
+    )
+
+    process_next(streaming_min_file_size=0)
+
+    job = IngestionJob.objects.get(id=job_id)
+    assert job.status == IngestionJob.Status.SUCCEEDED
+    assert (job.rows_parsed, job.rows_written) == (3, 3)
+    assert job.result["documents"] == 3
+
+
+def test_the_file_of_a_job_is_only_deleted_once_it_succeeds(
+    owner, workbook, job_repository, file_storage, process_next
+):
+    """A failed job keeps its file, so it can be retried."""
+    failed_id = enqueue(
+        job_repository, file_storage, owner, workbook({"workspace": [("a", " ")]})
+    )
+    process_next()
+    succeeded_id = enqueue(
+        job_repository, file_storage, owner, workbook({"workspace": [("a", "text")]})
+    )
+    process_next()
+
+    failed, succeeded = (
+        IngestionJob.objects.get(id=failed_id),
+        IngestionJob.objects.get(id=succeeded_id),
+    )
+    assert failed.status == IngestionJob.Status.FAILED
+    assert os.path.exists(failed.file_path)
+    assert succeeded.status == IngestionJob.Status.SUCCEEDED
+    assert not os.path.exists(succeeded.file_path)
+
+
+def test_only_failed_jobs_are_retried(
+    owner, workbook, job_repository, file_storage, process_next
+):
+    """A retried job is pending again, without the progress and error of its run."""
+    job_id = enqueue(
+        job_repository, file_storage, owner, workbook({"workspace": [("a", " ")]})
+    )
+    process_next()
+
+    retry = RetryIngestionJobCommandHandler(job_repository=job_repository)
+
+    assert retry.handle(command=RetryIngestionJobCommand(job_id=job_id))
+    job = IngestionJob.objects.get(id=job_id)
+    assert job.status == IngestionJob.Status.PENDING
+    assert (job.rows_parsed, job.error) == (0, None)
+    assert not retry.handle(command=RetryIngestionJobCommand(job_id=job_id))
+    assert process_next() == job_id
+
+
+def test_the_jobs_failed_for_longer_than_the_retention_are_abandoned(
+    owner, workbook, job_repository, file_storage, process_next
+):
+    """The files of the abandoned jobs are deleted, and the rest are kept."""
+    old_id = enqueue(
+        job_repository, file_storage, owner, workbook({"workspace": [("a", " ")]})
+    )
+    process_next()
+    IngestionJob.objects.filter(id=old_id).update(
+        updated_at=timezone.now() - timedelta(days=2)
+    )
+    recent_id = enqueue(
+        job_repository, file_storage, owner, workbook({"workspace": [("a", " ")]})
+    )
+    process_next()
+
+    abandoned = CleanUpIngestionJobsCommandHandler(
+        job_repository=job_repository, file_storage=file_storage
+    ).handle(command=CleanUpIngestionJobsCommand(older_than=24 * 60 * 60))
+
+    old, recent = IngestionJob.objects.get(id=old_id), IngestionJob.objects.get(
+        id=recent_id
+    )
+    assert abandoned == 1
+    assert old.status == IngestionJob.Status.ABANDONED
+    assert old.is_finished
+    assert not os.path.exists(old.file_path)
+    assert recent.status == IngestionJob.Status.FAILED
+    assert os.path.exists(recent.file_path)
+    assert not job_repository.retry(job_id=old_id)
@@ -0,0 +1,148 @@
+"""Lazy collections tests module."""
+from uuid import UUID
+
+import pytest
+
+from django_decoupled.application.commands import (
+    CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
+)
+from django_decoupled.application.identifiers import uuid7
+from django_decoupled.dependency_injection.containers import container
+from django_decoupled.domain.models.workspaces import (
+    Category,
+    CategoryId,
+    CategoryName,
+    DocumentCollection,
+    DocumentId,
+    LazyCategoryCollection,
+    LazyDocumentCollection,
+    WorkspaceId,
+)
+from django_decoupled.infrastructure.persistence.workspaces.models import Workspace
+
+
+@pytest.fixture
+def category_id():
+    """Return the ID of the category of the documents."""
+    return CategoryId(value=uuid7())
+
+
+@pytest.fixture
+def ids():
+    """Return the IDs of ten documents."""
+    return [uuid7() for _ in range(10)]
+
+
+@pytest.fixture
+def workspace_id(owner, workbook):
+    """Return the ID of a stored workspace with two categories."""
+    container.create_or_update_workspace_from_upload_excel_file_handler.handle(
+        CreateOrUpdateWorkspaceFromUploadExcelFileCommand(
+            file_bytes=workbook({"workspace": [("a", "text a"), ("b", "text b")]}),
+            owner=str(owner.id),
+        )
+    )
+
+    return str(Workspace.objects.get(name="workspace").id)
+
+
+def test_lazy_documents_are_loaded_on_first_access(category_id, ids):
+    """The loader only runs when the documents are used, and only once."""
+    calls = []
+
+    def loader():
+        calls.append(None)
+        return [(id, f"text {i}") for i, id in enumerate(ids)]
+
+    documents = LazyDocumentCollection(category_id=category_id, loader=loader)
+
+    assert not documents.is_loaded
+    assert calls == []
+
+    assert len(documents) == 10
+    assert documents.get(id=DocumentId(value=ids[1])).text.value == "text 1"
+    assert documents.is_loaded
+    assert len(calls) == 1
+
+
+def test_lazy_documents_are_replaced_without_loading(category_id):
+    """Replacing every document does not need the stored ones."""
+
+    def loader():
+        raise AssertionError("The documents should not be loaded.")
+
+    documents = LazyDocumentCollection(category_id=category_id, loader=loader)
+    new: UUID = uuid7()
+
+    documents.replace(ids=[new], texts=["a"], category_id=category_id)
+
+    assert documents.is_loaded
+    assert list(documents.rows()) == [(new, "a")]
+
+
+def test_lazy_categories_are_loaded_on_first_access(category_id):
+    """The loader runs once, and the categories are found by name after it."""
+    calls = []
+    category = Category(
+        id=category_id,
+        name=CategoryName(value="category"),
+        workspace_id=WorkspaceId(value=uuid7()),
+        documents=DocumentCollection(),
+    )
+
+    def loader():
+        calls.append(None)
+        return [category]
+
+    categories = LazyCategoryCollection(loader=loader)
+
+    assert not categories.is_loaded
+    assert str(categories) == "[...]"
+
+    assert categories.has_name(name="category")
+    assert categories.get(id=category_id) is category
+    assert categories.is_loaded
+    assert len(calls) == 1
+
+
+@pytest.mark.django_db
+def test_workspaces_without_categories_load_them_on_first_access(owner, workspace_id):
+    """The categories are read from the database, without their documents."""
+    dto = container.workspace_finder.get_without_categories(
+        id=workspace_id, owner_id=str(owner.id)
+    )
+    workspace = container.workspace_domain_serializer.deserialize(dto=dto)
+
+    assert dto.categories is None
+    assert not workspace.categories.is_loaded
+    assert (
+        container.workspace_domain_serializer.serialize(domain_obj=workspace).categories
+        is None
+    )
+
+    category = workspace.categories.get_by_name(name="a")
+
+    assert workspace.categories.is_loaded
+    assert not category.documents.is_loaded
+    assert list(category.documents.texts()) == ["text a"]
+
+
+@pytest.mark.django_db
+def test_workspaces_found_by_name_are_loaded_without_documents(owner, workspace_id):
+    """The categories are read, and their documents left in the database."""
+    dto = container.workspace_finder.get_by_name_without_documents(
+        name="workspace", owner_id=str(owner.id)
+    )
+
+    assert dto.id == workspace_id
+    assert sorted(category.name for category in dto.categories) == ["a", "b"]
+    assert all(category.documents is None for category in dto.categories)
+
+    category = next(category for category in dto.categories if category.name == "b")
+
+    assert [
+        document.text
+        for document in container.workspace_finder.load_documents(
+            category_id=category.id
+        )
+    ] == ["text b"]
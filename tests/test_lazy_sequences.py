@@ -0,0 +1,94 @@
+"""Lazy sequences tests module."""
+import pytest
+
+from django_decoupled.application.commands import (
+    CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
+)
+from django_decoupled.application.dtos import LazySequence
+from django_decoupled.dependency_injection.containers import container
+
+
+class CountingLoader:
+    """Loader of a list of items, counting the loads."""
+
+    def __init__(self, items):
+        """Class constructor."""
+        self.items = items
+        self.loads = 0
+
+    def __call__(self):
+        """Return the items."""
+        self.loads += 1
+        return iter(self.items)
+
+
+def test_items_are_loaded_once_on_first_access():
+    """Indexing, slicing and iterating share a single load."""
+    loader = CountingLoader(["a", "b", "c"])
+    sequence = LazySequence(loader=loader)
+
+    assert not sequence.is_loaded
+    assert repr(sequence) == "LazySequence([...])"
+
+    assert sequence[1] == "b"
+    assert sequence[1:] == ["b", "c"]
+    assert list(sequence) == ["a", "b", "c"]
+    assert sequence.is_loaded
+    assert loader.loads == 1
+
+
+def test_a_given_length_does_not_load_the_items():
+    """A counting function is only called once, and only if no items were read."""
+    loader = CountingLoader(["a", "b"])
+    counts = []
+
+    def count():
+        counts.append(None)
+        return 2
+
+    sequence = LazySequence(loader=loader, length=count)
+
+    assert len(sequence) == 2
+    assert len(sequence) == 2
+    assert len(counts) == 1
+    assert loader.loads == 0
+    assert len(LazySequence(loader=CountingLoader(["a"]))) == 1
+
+
+def test_sequences_compare_by_items():
+    """A lazy sequence is equal to a list with its items, and is not hashable."""
+    sequence = LazySequence(loader=CountingLoader(["a", "b"]))
+
+    assert sequence == ["a", "b"]
+    assert sequence == LazySequence(loader=CountingLoader(["a", "b"]))
+    assert sequence != ("a", "b")
+
+    with pytest.raises(TypeError):
+        hash(sequence)
+
+
+@pytest.mark.django_db
+def test_found_workspaces_count_their_documents_without_reading_them(
+    owner, workbook, django_assert_num_queries
+):
+    """The documents of a category are read when first used."""
+    container.create_or_update_workspace_from_upload_excel_file_handler.handle(
+        CreateOrUpdateWorkspaceFromUploadExcelFileCommand(
+            file_bytes=workbook({"workspace": [("a", "first"), ("a", "second")]}),
+            owner=str(owner.id),
+        )
+    )
+
+    workspace_dto = container.workspace_finder.get_by_name(
+        name="workspace", owner_id=str(owner.id)
+    )
+    documents = workspace_dto.categories[0].documents
+
+    assert isinstance(documents, LazySequence)
+    assert len(documents) == 2
+    assert not documents.is_loaded
+
+    with django_assert_num_queries(1):
+        texts = sorted(document.text for document in documents)
+
+    assert texts == ["first", "second"]
@@ -0,0 +1,164 @@
+"""Workspace mapper tests module."""
+import pytest
+
+from django_decoupled.application.exceptions import (
+    WorkspaceAlreadyExistsError,
+    WorkspaceDoesNotExistsError,
+)
+from django_decoupled.application.identifiers import uuid7
+from django_decoupled.domain.models.workspaces import (
+    Category,
+    CategoryCollection,
+    CategoryId,
+    CategoryName,
+    DocumentCollection,
+    DocumentId,
+    DocumentText,
+    Workspace,
+    WorkspaceId,
+    WorkspaceName,
+    WorkspaceOwnerId,
+)
+from django_decoupled.infrastructure.persistence.workspaces.mappers import (
+    DjangoWorkspaceMapper,
+)
+from django_decoupled.infrastructure.persistence.workspaces.models import (
+    Category as CategoryModel,
+)
+from django_decoupled.infrastructure.persistence.workspaces.models import Document
+
+pytestmark = pytest.mark.django_db
+
+
+def new_workspace(owner, categories):
+    """Return a new workspace with a category per item, holding its texts."""
+    workspace_id = WorkspaceId(value=uuid7())
+    collection = CategoryCollection()
+
+    for name, texts in categories.items():
+        category_id = CategoryId(value=uuid7())
+        documents = DocumentCollection()
+        documents.extend(
+            ids=[uuid7() for _ in texts], texts=texts, category_id=category_id
+        )
+        collection.add(
+            item=Category(
+                id=category_id,
+                name=CategoryName(value=name),
+                workspace_id=workspace_id,
+                documents=documents,
+            )
+        )
+
+    return Workspace(
+        id=workspace_id,
+        name=WorkspaceName(value="workspace"),
+        owner_id=WorkspaceOwnerId(value=owner.id),
+        categories=collection,
+    )
+
+
+@pytest.fixture
+def mapper():
+    """Return a mapper without publisher."""
+    return DjangoWorkspaceMapper()
+
+
+def test_saved_workspaces_are_read_back(mapper, owner, stored):
+    """A workspace is found by ID and by name, with its documents."""
+    workspace = new_workspace(owner, {"a": ["one", "two"], "b": ["three"]})
+
+    mapper.save(aggregate=workspace)
+
+    assert stored(owner) == {"workspace": {"a": ["one", "two"], "b": ["three"]}}
+
+    by_id = mapper.get(id=str(workspace.id.value), owner_id=str(owner.id))
+    by_name = mapper.get_by_name(name="workspace", owner_id=str(owner.id))
+
+    assert by_id.id == by_name.id == workspace.id
+    assert list(by_name.categories.get_by_name(name="a").documents.rows()) == list(
+        workspace.categories.get_by_name(name="a").documents.rows()
+    )
+    assert mapper.get(id=str(uuid7()), owner_id=str(owner.id)) is None
+
+
+def test_workspaces_are_read_without_their_collections(
+    mapper, owner, django_assert_num_queries
+):
+    """The categories and documents are only read when used."""
+    workspace = new_workspace(owner, {"a": ["one"]})
+    mapper.save(aggregate=workspace)
+
+    with django_assert_num_queries(1):
+        found = mapper.get(id=str(workspace.id.value), owner_id=str(owner.id))
+
+    assert not found.categories.is_loaded
+
+    with django_assert_num_queries(1):
+        category = found.categories.get_by_name(name="a")
+
+    assert not category.documents.is_loaded
+    assert list(category.documents.texts()) == ["one"]
+
+
+def test_a_workspace_is_only_saved_once(mapper, owner):
+    """Saving a workspace whose name is stored fails."""
+    mapper.save(aggregate=new_workspace(owner, {"a": ["one"]}))
+
+    with pytest.raises(WorkspaceAlreadyExistsError):
+        mapper.save(aggregate=new_workspace(owner, {"b": ["two"]}))
+
+
+def test_only_stored_workspaces_are_updated(mapper, owner):
+    """Updating a workspace that was never saved fails."""
+    with pytest.raises(WorkspaceDoesNotExistsError):
+        mapper.update(aggregate=new_workspace(owner, {"a": ["one"]}))
+
+
+def test_updates_write_the_changed_documents(mapper, owner, stored):
+    """Added, removed and changed documents are written, the rest left as stored."""
+    mapper.save(aggregate=new_workspace(owner, {"a": ["one", "two"], "b": ["b"]}))
+    kept = dict(Document.objects.values_list("text", "id"))
+
+    workspace = mapper.get_by_name(name="workspace", owner_id=str(owner.id))
+    category = workspace.categories.get_by_name(name="a")
+    documents = category.documents
+    documents.remove(id=DocumentId(value=kept["two"]))
+    documents.add_many(ids=[uuid7()], texts=["three"], category_id=category.id)
+    workspace.update_document_text(
+        category_id=category.id,
+        document_id=DocumentId(value=kept["one"]),
+        text=DocumentText(value="updated"),
+    )
+
+    mapper.update(aggregate=workspace)
+
+    assert stored(owner) == {
+        "workspace": {"a": ["three", "updated"], "b": ["b"]},
+    }
+    assert Document.objects.get(text="updated").id == kept["one"]
+
+
+def test_updates_leave_the_collections_that_were_not_loaded(
+    mapper, owner, stored, django_assert_max_num_queries
+):
+    """A workspace whose categories were never read only writes its own row."""
+    workspace = new_workspace(owner, {"a": ["one"]})
+    mapper.save(aggregate=workspace)
+
+    found = mapper.get(id=str(workspace.id.value), owner_id=str(owner.id))
+    found.set_metrics(metrics={"accuracy": 1.0})
+
+    with django_assert_max_num_queries(5) as queries:
+        mapper.update(aggregate=found)
+
+    assert not found.categories.is_loaded
+    assert not any(
+        table in query["sql"]
+        for query in queries.captured_queries
+        for table in (CategoryModel._meta.db_table, Document._meta.db_table)
+    )
+    assert stored(owner) == {"workspace": {"a": ["one"]}}
+    assert mapper.get(
+        id=str(workspace.id.value), owner_id=str(owner.id)
+    ).metrics.value == {"accuracy": 1.0}
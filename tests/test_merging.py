@@ -0,0 +1,108 @@
+"""Merge modes tests module."""
+import pytest
+
+from django_decoupled.application.commands import (
+    CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
+    StreamWorkspacesFromUploadExcelFileCommand,
+)
+from django_decoupled.application.merging import (
+    MERGE_MODE_APPEND,
+    MERGE_MODE_MERGE,
+    MERGE_MODE_REPLACE,
+    DocumentMatcher,
+    check_merge_mode,
+)
+from django_decoupled.dependency_injection.containers import container
+from django_decoupled.infrastructure.persistence.workspaces.models import Document
+
+HANDLERS = {
+    "upload": (
+        "create_or_update_workspace_from_upload_excel_file_handler",
+        CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
+    ),
+    "stream": (
+        "stream_workspaces_from_upload_excel_file_handler",
+        StreamWorkspacesFromUploadExcelFileCommand,
+    ),
+}
+
+
+@pytest.fixture(params=list(HANDLERS))
+def ingest(request, owner, workbook):
+    """Return the ingestion of some texts of a category, by every handler."""
+    handler_name, command_class = HANDLERS[request.param]
+
+    def ingest_texts(texts, merge_mode=None):
+        getattr(container, handler_name).handle(
+            command_class(
+                file_bytes=workbook(
+                    {"workspace": [("category", text) for text in texts]}
+                ),
+                owner=str(owner.id),
+                merge_mode=merge_mode,
+            )
+        )
+
+    return ingest_texts
+
+
+def stored_ids(owner):
+    """Return the ID of every stored document by text."""
+    return dict(
+        Document.objects.filter(category__workspace__owner=owner).values_list(
+            "text", "id"
+        )
+    )
+
+
+def test_an_unknown_merge_mode_is_rejected():
+    """The merge mode comes from the settings or the command line."""
+    assert check_merge_mode(merge_mode=MERGE_MODE_APPEND) == MERGE_MODE_APPEND
+
+    with pytest.raises(ValueError):
+        check_merge_mode(merge_mode="upsert")
+
+
+def test_stored_documents_match_a_single_text_each():
+    """Duplicated texts are matched one to one."""
+    matcher = DocumentMatcher(stored=[("text", 1), ("text", 2), ("other", 3)])
+
+    assert {matcher.match(text="text"), matcher.match(text="text")} == {1, 2}
+    assert matcher.match(text="text") is None
+    assert matcher.match(text="new") is None
+    assert matcher.unmatched() == [3]
+
+
+@pytest.mark.django_db
+def test_replace_mode_replaces_the_documents(ingest, owner, stored):
+    """The documents of the category are the texts of the file."""
+    ingest(["kept", "removed"])
+
+    ingest(["kept", "new"], merge_mode=MERGE_MODE_REPLACE)
+
+    assert stored(owner) == {"workspace": {"category": ["kept", "new"]}}
+
+
+@pytest.mark.django_db
+def test_append_mode_keeps_the_stored_documents_and_their_ids(ingest, owner, stored):
+    """Only the texts that are not stored are added."""
+    ingest(["kept", "other"])
+    ids = stored_ids(owner)
+
+    ingest(["kept", "new"], merge_mode=MERGE_MODE_APPEND)
+
+    assert stored(owner) == {"workspace": {"category": ["kept", "new", "other"]}}
+    assert stored_ids(owner)["kept"] == ids["kept"]
+    assert stored_ids(owner)["other"] == ids["other"]
+
+
+@pytest.mark.django_db
+def test_merge_mode_keeps_the_ids_of_the_texts_still_in_the_file(ingest, owner, stored):
+    """The stored texts that are not in the file are deleted."""
+    ingest(["kept", "removed"])
+    ids = stored_ids(owner)
+
+    ingest(["kept", "new"], merge_mode=MERGE_MODE_MERGE)
+
+    assert stored(owner) == {"workspace": {"category": ["kept", "new"]}}
+    assert stored_ids(owner)["kept"] == ids["kept"]
@@ -0,0 +1,126 @@
+"""Text normalization tests module."""
+import pytest
+
+from django_decoupled.application.commands import (
+    CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
+)
+from django_decoupled.application.dtos import FileCategory, FileWorkspace
+from django_decoupled.application.normalization import (
+    DEDUP_SCOPE_CATEGORY,
+    DEDUP_SCOPE_NONE,
+    DEDUP_SCOPE_WORKBOOK,
+    TextNormalizer,
+)
+from django_decoupled.dependency_injection.containers import container
+
+
+def texts(file_workspaces):
+    """Return the texts of every category of every workspace, by name."""
+    return {
+        file_workspace.name: {
+            category.name: list(category.texts)
+            for category in file_workspace.categories
+        }
+        for file_workspace in file_workspaces
+    }
+
+
+@pytest.fixture
+def file_workspaces():
+    """Return two workspaces sharing a text, with duplicates in a category."""
+    return [
+        FileWorkspace(
+            name="second",
+            categories=[FileCategory(name="a", texts=["shared"])],
+        ),
+        FileWorkspace(
+            name="first",
+            categories=[
+                FileCategory(name="a", texts=["text", " text", "shared"]),
+                FileCategory(name="b", texts=["text"]),
+            ],
+        ),
+    ]
+
+
+def test_texts_are_normalized_to_nfc_with_collapsed_whitespace():
+    """Non-text values are left to the validators."""
+    normalizer = TextNormalizer()
+
+    assert normalizer.normalize(text="  café \t con\n leche ") == "café con leche"
+    assert normalizer.normalize(text="Text") == "Text"
+    assert normalizer.normalize(text=None) is None
+    assert normalizer.normalize(text=1.5) == 1.5
+
+
+def test_texts_are_casefolded_if_asked():
+    """Casefolding makes texts differing only in case duplicates."""
+    assert TextNormalizer(casefold=True).normalize(text="Straße") == "strasse"
+
+
+def test_an_unknown_dedup_scope_is_rejected():
+    """The scope comes from the settings, so it is checked on start."""
+    with pytest.raises(ValueError):
+        TextNormalizer(dedup_scope="sheet")
+
+
+def test_dedup_keys_are_scoped():
+    """The same text has the same key across categories only within a workbook."""
+    category = TextNormalizer(dedup_scope=DEDUP_SCOPE_CATEGORY)
+    workbook = TextNormalizer(dedup_scope=DEDUP_SCOPE_WORKBOOK)
+
+    assert category.dedup_key("first", "a", "text") != category.dedup_key(
+        "first", "b", "text"
+    )
+    assert len(category.dedup_key("first", "a", "text")) == 16
+    assert workbook.dedup_key("first", "a", "text") == workbook.dedup_key(
+        "second", "b", "text"
+    )
+    assert (
+        TextNormalizer(dedup_scope=DEDUP_SCOPE_NONE).dedup_key("first", "a", "text")
+        is None
+    )
+    assert category.is_sheet_scoped
+    assert not workbook.is_sheet_scoped
+
+
+def test_duplicates_are_dropped_within_their_category(file_workspaces):
+    """The texts of other categories are not duplicates."""
+    normalized, removed = TextNormalizer().normalize_workspaces(
+        file_workspaces=file_workspaces
+    )
+
+    assert removed == 1
+    assert texts(normalized) == {
+        "first": {"a": ["text", "shared"], "b": ["text"]},
+        "second": {"a": ["shared"]},
+    }
+
+
+def test_duplicates_are_dropped_across_the_workbook_by_sheet_name(file_workspaces):
+    """The first occurrence by sheet name is kept, whatever the order of the file."""
+    normalized, removed = TextNormalizer(
+        dedup_scope=DEDUP_SCOPE_WORKBOOK
+    ).normalize_workspaces(file_workspaces=file_workspaces)
+
+    assert removed == 3
+    assert texts(normalized) == {
+        "first": {"a": ["text", "shared"], "b": []},
+        "second": {"a": []},
+    }
+
+
+@pytest.mark.django_db
+def test_uploads_report_the_duplicates_removed(owner, workbook, stored):
+    """The stored texts are the normalized ones."""
+    result = container.create_or_update_workspace_from_upload_excel_file_handler.handle(
+        CreateOrUpdateWorkspaceFromUploadExcelFileCommand(
+            file_bytes=workbook(
+                {"workspace": [("a", "text  one"), ("a", " text one"), ("b", "other")]}
+            ),
+            owner=str(owner.id),
+        )
+    )
+
+    assert result.duplicates_removed == 1
+    assert stored(owner) == {"workspace": {"a": ["text one"], "b": ["other"]}}
@@ -0,0 +1,251 @@
+"""Ingestion pipelines tests module."""
+import pytest
+
+from django_decoupled.application.commands import (
+    CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
+    StreamWorkspacesFromUploadExcelFileCommand,
+)
+from django_decoupled.application.dtos import FileRow
+from django_decoupled.application.exceptions import FileValidationError
+from django_decoupled.application.normalization import (
+    DEDUP_SCOPE_CATEGORY,
+    TextNormalizer,
+)
+from django_decoupled.application.pipelines import WorkspaceIngestionPipeline, batched
+from django_decoupled.dependency_injection.containers import container
+from django_decoupled.domain.events.workspaces import DocumentsAdded
+
+pytestmark = pytest.mark.django_db
+
+
+class RecordingBulkRepository:
+    """Bulk repository recording the size of every batch of documents written."""
+
+    def __init__(self, repository) -> None:
+        """Class constructor."""
+        self._repository = repository
+        self.batches = []
+
+    def save_documents(self, documents) -> None:
+        """Record the batch and write it."""
+        self.batches.append(len(documents))
+        self._repository.save_documents(documents=documents)
+
+    def __getattr__(self, name):
+        """Delegate the rest of the methods to the repository."""
+        return getattr(self._repository, name)
+
+
+class RecordingPublisher:
+    """Event publisher keeping the events published."""
+
+    def __init__(self) -> None:
+        """Class constructor."""
+        self.events = []
+
+    def publish(self, events) -> None:
+        """Keep the events."""
+        self.events.extend(events)
+
+
+def create_pipeline(owner, bulk_repository=None, **kwargs):
+    """Return a pipeline writing the rows of the owner in batches of two."""
+    return WorkspaceIngestionPipeline(
+        owner=str(owner.id),
+        batch_size=2,
+        workspace_repository=container.workspace_repository,
+        bulk_repository=bulk_repository or container.workspace_repository,
+        workspace_finder=container.workspace_finder,
+        workspace_serializer=container.workspace_domain_serializer,
+        category_serializer=container.category_domain_serializer,
+        document_serializer=container.document_domain_serializer,
+        **kwargs,
+    )
+
+
+def rows(count, workspace="workspace", category="category"):
+    """Return the rows of a category."""
+    return [
+        FileRow(workspace=workspace, category=category, text=f"text {i}", row=i + 2)
+        for i in range(count)
+    ]
+
+
+def test_batched_groups_the_items_in_lists_of_bounded_size():
+    """The last batch has the remaining items."""
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched([], 2)) == []
+
+
+def test_pipeline_writes_the_rows_in_bounded_batches(owner, stored):
+    """Every batch is written on its own, with the progress reported after it."""
+    bulk_repository = RecordingBulkRepository(container.workspace_repository)
+    progress = []
+    pipeline = create_pipeline(
+        owner=owner,
+        bulk_repository=bulk_repository,
+        on_progress=lambda parsed, written: progress.append((parsed, written)),
+    )
+
+    report = pipeline.run(rows=iter(rows(5)))
+
+    assert bulk_repository.batches == [2, 2, 1]
+    assert progress == [(2, 2), (4, 4), (5, 5)]
+    assert (report.rows, report.documents) == (5, 5)
+    assert report.workspaces_created == ["workspace"]
+    assert stored(owner) == {"workspace": {"category": [f"text {i}" for i in range(5)]}}
+
+
+def test_pipeline_replaces_the_documents_of_the_stored_categories(owner, stored):
+    """A category already stored has its documents replaced by the ones streamed."""
+    create_pipeline(owner=owner).run(rows=rows(3))
+
+    report = create_pipeline(owner=owner).run(
+        rows=[FileRow(workspace="workspace", category="category", text="new", row=2)]
+    )
+
+    assert report.workspaces_updated == ["workspace"]
+    assert stored(owner) == {"workspace": {"category": ["new"]}}
+
+
+def test_pipeline_fails_at_the_first_invalid_batch(owner):
+    """The rows after the first invalid batch are neither read nor validated."""
+    read = []
+    invalid_rows = rows(2) + [
+        FileRow(workspace="workspace", category="category", text=" ", row=4),
+        FileRow(workspace="workspace", category="category", text="text", row=5),
+        FileRow(workspace="workspace", category="category", text="", row=6),
+        FileRow(workspace="workspace", category="category", text="text", row=7),
+    ]
+
+    def read_rows():
+        for row in invalid_rows:
+            read.append(row.row)
+            yield row
+
+    with pytest.raises(FileValidationError) as error:
+        create_pipeline(owner=owner).run(rows=read_rows())
+
+    assert [issue.row for issue in error.value.report.issues] == [4]
+    assert read == [2, 3, 4, 5]
+
+
+def test_pipeline_deduplicates_the_texts_of_every_sheet(owner, stored):
+    """The keys of a sheet are dropped once the next one is streamed."""
+    pipeline = create_pipeline(
+        owner=owner, normalizer=TextNormalizer(dedup_scope=DEDUP_SCOPE_CATEGORY)
+    )
+
+    report = pipeline.run(
+        rows=[
+            FileRow(workspace="first", category="a", text="text", row=2),
+            FileRow(workspace="first", category="a", text=" text ", row=3),
+            FileRow(workspace="second", category="a", text="text", row=2),
+        ]
+    )
+
+    assert report.duplicates_removed == 1
+    assert len(pipeline._seen_texts) == 1  # pylint: disable=protected-access
+    assert stored(owner) == {"first": {"a": ["text"]}, "second": {"a": ["text"]}}
+
+
+def test_stream_handler_leaves_the_workspaces_as_they_were_on_failure(
+    owner, workbook, stored
+):
+    """The batches written before an invalid one are rolled back."""
+    handler = container.stream_workspaces_from_upload_excel_file_handler
+    handler.handle(
+        StreamWorkspacesFromUploadExcelFileCommand(
+            file_bytes=workbook({"workspace": [("category", "old")]}),
+            owner=str(owner.id),
+        )
+    )
+
+    with pytest.raises(FileValidationError):
+        handler.handle(
+            StreamWorkspacesFromUploadExcelFileCommand(
+                file_bytes=workbook(
+                    {"workspace": [("category", f"new {i}") for i in range(2000)]}
+                    | {"invalid": [("category", " ")]}
+                ),
+                owner=str(owner.id),
+            )
+        )
+
+    assert stored(owner) == {"workspace": {"category": ["old"]}}
+
+
+def test_stream_handler_publishes_the_events_on_commit(
+    owner, workbook, monkeypatch, django_capture_on_commit_callbacks
+):
+    """The events of the streamed documents are published once they are stored."""
+    handler = container.stream_workspaces_from_upload_excel_file_handler
+    publisher = RecordingPublisher()
+    monkeypatch.setattr(handler, "_publisher", publisher)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        handler.handle(
+            StreamWorkspacesFromUploadExcelFileCommand(
+                file_bytes=workbook({"workspace": [("category", "text")]}),
+                owner=str(owner.id),
+            )
+        )
+
+        assert not publisher.events
+
+    assert callbacks
+    assert DocumentsAdded in {type(event) for event in publisher.events}
+
+
+def test_upload_handler_writes_the_workspaces_in_a_single_unit_of_work(
+    owner, workbook, stored, monkeypatch
+):
+    """A workspace failing to be written rolls back the ones written before it."""
+    handler = container.create_or_update_workspace_from_upload_excel_file_handler
+    handler.handle(
+        CreateOrUpdateWorkspaceFromUploadExcelFileCommand(
+            file_bytes=workbook({"updated": [("category", "old")]}),
+            owner=str(owner.id),
+        )
+    )
+
+    def fail(aggregate):
+        raise RuntimeError("The database is gone.")
+
+    monkeypatch.setattr(container.workspace_mapper, "update", fail)
+
+    with pytest.raises(RuntimeError):
+        handler.handle(
+            CreateOrUpdateWorkspaceFromUploadExcelFileCommand(
+                file_bytes=workbook(
+                    {
+                        "created": [("category", "text")],
+                        "updated": [("category", "new")],
+                    }
+                ),
+                owner=str(owner.id),
+            )
+        )
+
+    assert stored(owner) == {"updated": {"category": ["old"]}}
+
+
+def test_upload_handler_publishes_the_events_on_commit(
+    owner, workbook, monkeypatch, django_capture_on_commit_callbacks
+):
+    """No event of the upload is published before it is committed."""
+    publisher = RecordingPublisher()
+    monkeypatch.setattr(container.workspace_mapper, "_publisher", publisher)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        container.create_or_update_workspace_from_upload_excel_file_handler.handle(
+            CreateOrUpdateWorkspaceFromUploadExcelFileCommand(
+                file_bytes=workbook({"workspace": [("category", "text")]}),
+                owner=str(owner.id),
+            )
+        )
+
+        assert not publisher.events
+
+    assert callbacks
+    assert publisher.events
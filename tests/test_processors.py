@@ -0,0 +1,92 @@
+"""File processors tests module."""
+import pytest
+
+from django_decoupled.application.commands import (
+    CreateOrUpdateWorkspaceFromUploadExcelFileCommand,
+    CreateWorkspaceAndAddDataFromFileCommand,
+)
+from django_decoupled.application.dtos import FileCategory, FileWorkspace
+from django_decoupled.application.exceptions import WorkspaceAlreadyExistsError
+from django_decoupled.dependency_injection.containers import container
+
+pytestmark = pytest.mark.django_db
+
+
+def file_workspace(name, texts=("text",)):
+    """Return a file workspace with a single category."""
+    return FileWorkspace(
+        name=name, categories=[FileCategory(name="category", texts=list(texts))]
+    )
+
+
+def test_every_call_returns_its_own_result(owner):
+    """The workspaces of a call are not in the result of the next one."""
+    processor = container.file_processor
+
+    first = processor.process(
+        file_workspaces={file_workspace("first")}, owner=str(owner.id)
+    )
+    second = processor.process(
+        file_workspaces={file_workspace("second")}, owner=str(owner.id)
+    )
+
+    assert set(first.by_name) == {"first"}
+    assert set(second.by_name) == {"second"}
+    assert len(second.new) == 1
+    assert not second.existing
+
+
+def test_results_are_immutable(owner):
+    """A result cannot be changed by the handler reading it."""
+    result = container.file_processor.process(
+        file_workspaces={file_workspace("first")}, owner=str(owner.id)
+    )
+
+    with pytest.raises(TypeError):
+        result.by_name["other"] = result.get(name="first")  # type: ignore
+
+    assert isinstance(result.new, frozenset)
+
+
+def test_stored_workspaces_are_existing_ones(owner, workbook):
+    """A workspace of the file already stored is processed as existing."""
+    container.create_or_update_workspace_from_upload_excel_file_handler.handle(
+        CreateOrUpdateWorkspaceFromUploadExcelFileCommand(
+            file_bytes=workbook({"stored": [("category", "text")]}),
+            owner=str(owner.id),
+        )
+    )
+
+    result = container.file_processor.process(
+        file_workspaces={file_workspace("stored"), file_workspace("new")},
+        owner=str(owner.id),
+    )
+
+    assert result.is_existing(name="stored")
+    assert not result.is_existing(name="new")
+    assert not result.is_existing(name="missing")
+    assert result.get(name="new") in result.new
+
+
+def test_a_workspace_cannot_be_created_twice_from_a_file(owner, workbook, stored):
+    """The second creation fails, leaving the workspace as it was."""
+    handler = container.create_workspace_and_add_data_from_excel_handler
+
+    handler.handle(
+        CreateWorkspaceAndAddDataFromFileCommand(
+            workspace_name="workspace",
+            file_bytes=workbook({"workspace": [("category", "old")]}),
+            owner_id=str(owner.id),
+        )
+    )
+
+    with pytest.raises(WorkspaceAlreadyExistsError):
+        handler.handle(
+            CreateWorkspaceAndAddDataFromFileCommand(
+                workspace_name="workspace",
+                file_bytes=workbook({"workspace": [("category", "new")]}),
+                owner_id=str(owner.id),
+            )
+        )
+
+    assert stored(owner) == {"workspace": {"category": ["old"]}}
@@ -0,0 +1,293 @@
+"""Serializers tests module."""
+from typing import Dict, Iterator, List
+from uuid import uuid4
+
+import pytest
+
+from django_decoupled.application.dtos import CategoryDTO, DocumentDTO, LazySequence
+from django_decoupled.application.identifiers import uuid7
+from django_decoupled.application.interfaces import ICollectionLoader
+from django_decoupled.application.services import (
+    CategoryDomainSerializer,
+    DocumentDomainSerializer,
+    FlatCategoryDomainSerializer,
+)
+from django_decoupled.domain.models.workspaces import (
+    Category,
+    CategoryId,
+    CategoryName,
+    DocumentCollection,
+    WorkspaceId,
+)
+
+
+class InMemoryCollectionLoader(ICollectionLoader[CategoryDTO, DocumentDTO]):
+    """Collection loader reading the documents from a dict, counting the reads."""
+
+    def __init__(self, documents: Dict[str, List[DocumentDTO]]) -> None:
+        """Class constructor."""
+        self.documents = documents
+        self.loads = 0
+
+    def load_categories(self, workspace_id: str) -> List[CategoryDTO]:
+        """Return no categories, as the tests only load documents."""
+        return []
+
+    def load_documents(self, category_id: str) -> Iterator[DocumentDTO]:
+        """Yield the documents of a category."""
+        self.loads += 1
+        yield from self.documents.get(category_id, [])
+
+
+def domain_serializers(loader):
+    """Return the nested and flat category domain serializers."""
+    return [
+        serializer_class(document_serializer=DocumentDomainSerializer(), loader=loader)
+        for serializer_class in (CategoryDomainSerializer, FlatCategoryDomainSerializer)
+    ]
+
+
+@pytest.fixture
+def category_dto():
+    """Return a category DTO with three documents."""
+    category_id = str(uuid7())
+
+    return CategoryDTO(
+        id=category_id,
+        name="category",
+        workspace_id=str(uuid7()),
+        documents=[
+            DocumentDTO(id=str(uuid7()), text=f"text {i}", category_id=category_id)
+            for i in range(3)
+        ],
+    )
+
+
+@pytest.fixture
+def category():
+    """Return a domain category with three documents."""
+    category_id = CategoryId(value=uuid7())
+    documents = DocumentCollection()
+    documents.extend(
+        ids=[uuid7() for _ in range(3)],
+        texts=[f"text {i}" for i in range(3)],
+        category_id=category_id,
+    )
+
+    return Category(
+        id=category_id,
+        name=CategoryName(value="category"),
+        workspace_id=WorkspaceId(value=uuid7()),
+        documents=documents,
+    )
+
+
+def test_flat_and_nested_domain_serializers_serialize_the_same(category):
+    """The flat serializer gives the same DTO as serializing every document."""
+    nested, flat = domain_serializers(loader=InMemoryCollectionLoader(documents={}))
+
+    nested_dto = nested.serialize(domain_obj=category)
+
+    assert flat.serialize(domain_obj=category) == nested_dto
+    assert [document.text for document in nested_dto.documents] == [
+        "text 0",
+        "text 1",
+        "text 2",
+    ]
+
+
+def test_flat_and_nested_domain_serializers_deserialize_the_same(category_dto):
+    """Both serializers build a category with the documents of the DTO, in order."""
+    nested, flat = domain_serializers(loader=InMemoryCollectionLoader(documents={}))
+
+    nested_category = nested.deserialize(dto=category_dto)
+    flat_category = flat.deserialize(dto=category_dto)
+
+    expected_rows = [
+        (document.id, document.text) for document in category_dto.documents
+    ]
+    for category in (nested_category, flat_category):
+        assert str(category.id.value) == category_dto.id
+        assert category.name.value == category_dto.name
+        assert [(str(id), text) for id, text in category.documents.rows()] == (
+            expected_rows
+        )
+        assert {document.category for document in category.documents.values()} == {
+            category.id
+        }
+
+
+def test_domain_serializers_round_trip(category):
+    """Serializing and deserializing a category gives back the same documents."""
+    for serializer in domain_serializers(loader=InMemoryCollectionLoader({})):
+        category_copy = serializer.deserialize(
+            dto=serializer.serialize(domain_obj=category)
+        )
+
+        assert list(category_copy.documents.rows()) == list(category.documents.rows())
+
+
+def test_unloaded_documents_are_read_from_the_loader_on_first_access(category_dto):
+    """A DTO without documents gets a lazy collection, read once when used."""
+    unloaded = CategoryDTO(
+        id=category_dto.id,
+        name=category_dto.name,
+        workspace_id=category_dto.workspace_id,
+        documents=None,
+    )
+    loader = InMemoryCollectionLoader(
+        documents={category_dto.id: list(category_dto.documents)}
+    )
+
+    for serializer in domain_serializers(loader=loader):
+        category = serializer.deserialize(dto=unloaded)
+
+        assert not category.documents.is_loaded
+        assert serializer.serialize(domain_obj=category).documents is None
+
+        assert len(category.documents) == 3
+        assert serializer.serialize(domain_obj=category).documents == (
+            category_dto.documents
+        )
+
+    assert loader.loads == 2
+
+
+def test_lazy_sequences_are_read_on_first_access(category_dto):
+    """The documents of a lazy sequence are only read when the category is used."""
+    reads = []
+
+    def read():
+        reads.append(None)
+        return category_dto.documents
+
+    for serializer in domain_serializers(loader=InMemoryCollectionLoader({})):
+        category = serializer.deserialize(
+            dto=CategoryDTO(
+                id=category_dto.id,
+                name=category_dto.name,
+                workspace_id=category_dto.workspace_id,
+                documents=LazySequence(loader=read, length=3),
+            )
+        )
+
+        assert not category.documents.is_loaded
+        assert [text for _, text in category.documents.rows()] == [
+            "text 0",
+            "text 1",
+            "text 2",
+        ]
+
+    assert len(reads) == 2
+
+
+@pytest.fixture
+def stored_workspace(django_user_model):
+    """Return a stored workspace with two categories of three documents each."""
+    # pylint: disable=import-outside-toplevel
+    from django_decoupled.infrastructure.persistence.workspaces.models import (
+        Category as CategoryModel,
+    )
+    from django_decoupled.infrastructure.persistence.workspaces.models import (
+        Document as DocumentModel,
+    )
+    from django_decoupled.infrastructure.persistence.workspaces.models import (
+        Workspace as WorkspaceModel,
+    )
+
+    owner = django_user_model.objects.create_user(
+        email=f"{uuid4()}@example.com",
+        password="password",
+        first_name="first",
+        last_name="last",
+    )
+    workspace = WorkspaceModel.objects.create(
+        name="workspace", owner=owner, model_id="model", metrics={"f1": 1}
+    )
+
+    for name in ("a", "b"):
+        category = CategoryModel.objects.create(name=name, workspace=workspace)
+        DocumentModel.objects.bulk_create(
+            [DocumentModel(text=f"{name} {i}", category=category) for i in range(3)]
+        )
+
+    return workspace
+
+
+def db_serializers():
+    """Return the nested and flat workspace DB serializers."""
+    # pylint: disable=import-outside-toplevel
+    from django_decoupled.infrastructure.persistence.workspaces.serializers import (
+        CategoryDBSerializer,
+        DocumentDBSerializer,
+        FlatCategoryDBSerializer,
+        FlatWorkspaceDBSerializer,
+        WorkspaceDBSerializer,
+    )
+
+    document_serializer = DocumentDBSerializer()
+
+    return (
+        WorkspaceDBSerializer(
+            category_serializer=CategoryDBSerializer(
+                document_serializer=document_serializer
+            )
+        ),
+        FlatWorkspaceDBSerializer(
+            category_serializer=FlatCategoryDBSerializer(
+                document_serializer=document_serializer
+            )
+        ),
+    )
+
+
+@pytest.mark.django_db
+def test_flat_and_nested_db_serializers_serialize_the_same(stored_workspace):
+    """The flat serializers give the same DTOs as the nested ones."""
+    nested, flat = db_serializers()
+
+    nested_dto = nested.serialize(database_obj=stored_workspace)
+    flat_dto = flat.serialize(database_obj=stored_workspace)
+
+    assert flat_dto == nested_dto
+    assert sorted(
+        document.text
+        for category in flat_dto.categories
+        for document in category.documents
+    ) == ["a 0", "a 1", "a 2", "b 0", "b 1", "b 2"]
+
+
+@pytest.mark.django_db
+def test_flat_and_nested_category_db_serializers_serialize_the_same(
+    stored_workspace,
+):
+    """The flat category serializer reads the same documents, in the same order."""
+    nested, flat = db_serializers()
+    category = stored_workspace.categories.first()
+
+    assert flat._category_serializer.serialize(
+        database_obj=category
+    ) == nested._category_serializer.serialize(database_obj=category)
+
+
+@pytest.mark.django_db
+def test_flat_db_serializer_counts_without_reading_documents(
+    stored_workspace, django_assert_num_queries
+):
+    """The document counts come with the categories, in a single query."""
+    _, flat = db_serializers()
+
+    with django_assert_num_queries(1):
+        workspace_dto = flat.serialize(database_obj=stored_workspace)
+        counts = [len(category.documents) for category in workspace_dto.categories]
+
+    assert counts == [3, 3]
+
+    # The documents of every category are read together on first use.
+    with django_assert_num_queries(1):
+        texts = [
+            [document.text for document in category.documents]
+            for category in workspace_dto.categories
+        ]
+
+    assert sorted(texts) == [["a 0", "a 1", "a 2"], ["b 0", "b 1", "b 2"]]
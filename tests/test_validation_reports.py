@@ -0,0 +1,68 @@
+"""Validation reports tests module."""
+import pytest
+
+from django_decoupled.application.dtos import ValidationIssue, ValidationReport
+from django_decoupled.application.exceptions import FileValidationError
+from django_decoupled.controllers.services.file_readers import collect_sheets
+
+
+def issues(count, sheet="sheet"):
+    """Return some issues of the texts of a sheet."""
+    return [
+        ValidationIssue(sheet=sheet, row=row, column="text", message="Empty text")
+        for row in range(2, count + 2)
+    ]
+
+
+def test_a_report_keeps_the_first_issues_and_counts_the_rest():
+    """The issues over the maximum are only counted."""
+    report = ValidationReport(issues=issues(ValidationReport.MAX_ISSUES + 5))
+
+    assert len(report.issues) == ValidationReport.MAX_ISSUES
+    assert (report.omitted, report.count) == (5, ValidationReport.MAX_ISSUES + 5)
+    assert not report.is_valid
+
+
+def test_merging_reports_accumulates_in_place():
+    """The issues of the merged reports are kept up to the maximum."""
+    report = ValidationReport()
+
+    report.merge(ValidationReport())
+    assert report.is_valid
+
+    for sheet in ("first", "second", "third"):
+        report.merge(ValidationReport(issues=issues(60, sheet=sheet)))
+
+    assert len(report.issues) == ValidationReport.MAX_ISSUES
+    assert report.count == 180
+    assert {issue.sheet for issue in report.issues} == {"first", "second"}
+
+    report.merge(ValidationReport(omitted=20))
+
+    assert report.count == 200
+
+
+def test_the_error_counts_the_omitted_issues():
+    """The message lists a few issues and the number of the rest."""
+    error = FileValidationError(
+        report=ValidationReport(issues=issues(ValidationReport.MAX_ISSUES + 5))
+    )
+
+    assert error.message.startswith("The file has 105 invalid values: 'sheet' row 2")
+    assert error.message.endswith(
+        f"and {105 - FileValidationError.MAX_REPORTED_ISSUES} more."
+    )
+
+
+def test_the_issues_of_every_sheet_are_collected():
+    """A file fails with the issues of all its sheets."""
+    with pytest.raises(FileValidationError) as error:
+        collect_sheets(
+            [
+                ("first", ValidationReport(issues=issues(1, sheet="first"))),
+                ("second", ValidationReport()),
+                ("third", ValidationReport(issues=issues(2, sheet="third"))),
+            ]
+        )
+
+    assert error.value.report.count == 3
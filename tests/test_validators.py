@@ -0,0 +1,189 @@
+"""Validators tests module."""
+import io
+
+import pandas as pd
+import pytest
+
+from django_decoupled.application.dtos import FileRow, IngestionBudget, SheetMetadata
+from django_decoupled.application.exceptions import (
+    FileValidationError,
+    IngestionBudgetExceededError,
+    InvalidWorkbookError,
+)
+from django_decoupled.application.validators import (
+    BatchValidator,
+    WorkspaceFileValidator,
+)
+from django_decoupled.controllers.apps.workspaces.forms import (
+    WorkspaceWithFileUploadForm,
+)
+from django_decoupled.controllers.services import file_readers
+from django_decoupled.controllers.services.file_readers import (
+    ExcelFileReader,
+    read_workbook_metadata,
+)
+from django_decoupled.domain.models.workspaces import CategoryName, DocumentText
+
+
+def issues(report):
+    """Return the sheet, row, column and message of every issue of a report."""
+    return [
+        (issue.sheet, issue.row, issue.column, issue.message) for issue in report.issues
+    ]
+
+
+def test_every_invalid_text_of_a_batch_is_reported():
+    """Empty, blank, non-text and too long texts are reported by row."""
+    report = BatchValidator.validate_rows(
+        rows=[
+            FileRow(workspace="sheet", category="a", text="text", row=2),
+            FileRow(workspace="sheet", category="a", text=None, row=3),
+            FileRow(workspace="sheet", category="a", text="  ", row=4),
+            FileRow(workspace="sheet", category="a", text=1.5, row=5),
+            FileRow(
+                workspace="sheet",
+                category="a",
+                text="x" * (DocumentText.MAX_LENGTH + 1),
+                row=6,
+            ),
+            FileRow(
+                workspace="sheet",
+                category="a",
+                text="x" * DocumentText.MAX_LENGTH,
+                row=7,
+            ),
+        ]
+    )
+
+    assert issues(report) == [
+        ("sheet", 3, "text", "Empty value"),
+        ("sheet", 4, "text", "Empty value"),
+        ("sheet", 5, "text", "The value is not a text"),
+        ("sheet", 6, "text", f"Longer than {DocumentText.MAX_LENGTH} characters"),
+    ]
+
+
+def test_a_batch_without_strings_is_validated():
+    """A column without any string has every value reported."""
+    report = BatchValidator.validate_rows(
+        rows=[FileRow(workspace="sheet", category="a", text=1, row=2)]
+    )
+
+    assert issues(report) == [("sheet", 2, "text", "The value is not a text")]
+
+
+def test_an_invalid_name_is_reported_once_per_sheet():
+    """The issue of a name is at its first row of every sheet it appears in."""
+    name = "x" * (CategoryName.MAX_LENGTH + 1)
+
+    report = BatchValidator.validate_frame(
+        df=pd.DataFrame(
+            {
+                "workspace": ["first", "first", "second", "second"],
+                "category": [name, name, "a", name],
+                "text": ["text"] * 4,
+                "row": [2, 3, 2, 3],
+            },
+            dtype=object,
+        )
+    )
+
+    message = f"Longer than {CategoryName.MAX_LENGTH} characters"
+    assert issues(report) == [
+        ("first", 2, "category", message),
+        ("second", 3, "category", message),
+    ]
+
+
+def test_invalid_sheet_names_have_no_row():
+    """A sheet name is reported once, without a row."""
+    report = BatchValidator.validate_rows(
+        rows=[
+            FileRow(workspace=" ", category="a", text="text", row=2),
+            FileRow(workspace=" ", category="a", text="text", row=3),
+        ]
+    )
+
+    assert issues(report) == [(" ", None, "workspace", "Empty value")]
+
+
+@pytest.fixture
+def file_validator():
+    """Return a validator of the workbook metadata."""
+    return WorkspaceFileValidator(metadata_reader=ExcelFileReader())
+
+
+@pytest.fixture
+def no_cells(monkeypatch):
+    """Fail if any cell of a workbook is parsed."""
+
+    def parse(*args, **kwargs):
+        raise AssertionError("No cell should be parsed.")
+
+    monkeypatch.setattr(file_readers, "load_workbook", parse)
+    monkeypatch.setattr(file_readers.pd, "read_excel", parse)
+
+
+def test_workbook_metadata_is_read_from_the_sheet_dimensions(workbook, no_cells):
+    """The rows of a sheet are the rows below its header."""
+    file = workbook({"first": [("a", "text")] * 3, "empty": []})
+
+    metadata = read_workbook_metadata(file=file)
+
+    assert metadata.size == file.size
+    assert metadata.sheets == [
+        SheetMetadata(name="first", rows=3, columns=2),
+        SheetMetadata(name="empty", rows=0, columns=2),
+    ]
+    assert file.tell() == 0
+
+
+def test_files_that_are_not_workbooks_are_rejected(file_validator):
+    """A file that is not an xlsx archive is an invalid workbook."""
+    with pytest.raises(InvalidWorkbookError):
+        file_validator.validate(value=io.BytesIO(b"not a workbook"))
+
+
+def test_the_sheet_of_the_workspace_must_be_in_the_file(
+    workbook, file_validator, no_cells
+):
+    """The missing sheet is reported as a validation issue."""
+    file = workbook({"first": [("a", "text")]})
+
+    file_validator.validate(value=file, workspace_name="first")
+
+    with pytest.raises(FileValidationError) as error:
+        file_validator.validate(value=file, workspace_name="missing")
+
+    assert error.value.report.issues[0].sheet == "missing"
+
+
+def test_files_over_the_budget_are_rejected_from_their_metadata(
+    workbook, file_validator, no_cells
+):
+    """Only the sheet of the workspace counts, if there is one."""
+    file = workbook({"first": [("a", "text")] * 3, "second": [("a", "text")] * 3})
+
+    file_validator.validate(
+        value=file, workspace_name="first", budget=IngestionBudget(max_rows=3)
+    )
+
+    for budget in (
+        IngestionBudget(max_rows=5),
+        IngestionBudget(max_sheets=1),
+        IngestionBudget(max_file_size=10),
+    ):
+        with pytest.raises(IngestionBudgetExceededError):
+            file_validator.validate(value=file, budget=budget)
+
+
+@pytest.mark.django_db
+def test_the_workspace_form_reports_the_precheck_on_the_dataset(owner, workbook):
+    """A dataset without the sheet of the workspace is a form error."""
+    form = WorkspaceWithFileUploadForm(
+        data={"name": "missing", "owner": owner.id},
+        files={"dataset": workbook({"first": [("a", "text")]})},
+    )
+
+    assert not form.is_valid()
+    assert list(form.errors) == ["dataset"]